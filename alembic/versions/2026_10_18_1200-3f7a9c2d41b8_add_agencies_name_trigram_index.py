@@ -0,0 +1,29 @@
+"""Add agencies name trigram index
+
+Revision ID: 3f7a9c2d41b8
+Revises: 71374f18982c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7a9c2d41b8"
+down_revision: Union[str, None] = "71374f18982c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GiST rather than GIN, as only GiST supports ordering by trigram distance (`<->`)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_agencies_name_trgm "
+        "ON agencies USING gist (name gist_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_agencies_name_trgm")
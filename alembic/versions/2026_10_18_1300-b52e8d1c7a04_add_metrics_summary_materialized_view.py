@@ -0,0 +1,54 @@
+"""Add metrics_summary materialized view
+
+Revision ID: b52e8d1c7a04
+Revises: 3f7a9c2d41b8
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b52e8d1c7a04"
+down_revision: Union[str, None] = "3f7a9c2d41b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW metrics_summary AS
+        WITH location_counts AS (
+            SELECT
+                COUNT(DISTINCT L.ID) FILTER (WHERE L.TYPE = 'State') AS state_count,
+                COUNT(DISTINCT L.ID) FILTER (WHERE L.TYPE = 'County') AS county_count
+            FROM
+                LINK_AGENCIES__DATA_SOURCES LINK
+                INNER JOIN AGENCIES A ON A.ID = LINK.AGENCY_ID
+                LEFT JOIN LINK_AGENCIES__LOCATIONS LAL on A.ID = LAL.AGENCY_ID
+                JOIN DEPENDENT_LOCATIONS DL ON LAL.LOCATION_ID = DL.DEPENDENT_LOCATION_ID
+                JOIN LOCATIONS L ON L.ID = LAL.LOCATION_ID
+                OR L.ID = DL.PARENT_LOCATION_ID
+            WHERE
+                L.TYPE IN ('State', 'County')
+        )
+        SELECT
+            1 AS id,
+            (SELECT COUNT(*) FROM DATA_SOURCES) AS source_count,
+            (
+                SELECT COUNT(DISTINCT AGENCY_ID) FROM LINK_AGENCIES__DATA_SOURCES
+            ) AS agency_count,
+            location_counts.state_count,
+            location_counts.county_count,
+            NOW() AS refreshed_at
+        FROM
+            location_counts
+        """)
+    # Allows the view to be refreshed concurrently
+    op.execute("CREATE UNIQUE INDEX ix_metrics_summary_id ON metrics_summary (id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS metrics_summary")
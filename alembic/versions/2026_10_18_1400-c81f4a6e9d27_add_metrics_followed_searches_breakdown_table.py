@@ -0,0 +1,69 @@
+"""Add metrics_followed_searches_breakdown table
+
+Revision ID: c81f4a6e9d27
+Revises: b52e8d1c7a04
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c81f4a6e9d27"
+down_revision: Union[str, None] = "b52e8d1c7a04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "metrics_followed_searches_breakdown"
+
+SORTABLE_COLUMNS = [
+    "location_name",
+    "source_count",
+    "source_change",
+    "approved_requests_count",
+    "approved_requests_change",
+    "completed_requests_count",
+    "completed_requests_change",
+    "follower_count",
+    "follower_change",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE_NAME,
+        sa.Column("location_id", sa.Integer(), nullable=False),
+        sa.Column("location_name", sa.String(), nullable=False),
+        sa.Column("follower_count", sa.Integer(), nullable=False),
+        sa.Column("follower_change", sa.Integer(), nullable=False),
+        sa.Column("source_count", sa.Integer(), nullable=False),
+        sa.Column("source_change", sa.Integer(), nullable=False),
+        sa.Column("approved_requests_count", sa.Integer(), nullable=False),
+        sa.Column("approved_requests_change", sa.Integer(), nullable=False),
+        sa.Column("completed_requests_count", sa.Integer(), nullable=False),
+        sa.Column("completed_requests_change", sa.Integer(), nullable=False),
+        sa.Column(
+            "refreshed_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["location_id"],
+            ["locations.id"],
+            name="metrics_followed_searches_breakdown_location_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("location_id"),
+    )
+    # Pages are ordered by the sort column, with location id as a tiebreaker
+    for column in SORTABLE_COLUMNS:
+        op.create_index(
+            f"ix_metrics_breakdown_{column}",
+            TABLE_NAME,
+            [column, "location_id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE_NAME)
@@ -1,5 +1,5 @@
 import os
-from datetime import timedelta, date, datetime
+from datetime import timedelta, datetime
 
 import uvicorn
 from apscheduler.triggers.interval import IntervalTrigger
@@ -7,18 +7,19 @@ from environs import Env
 from fastapi import FastAPI
 from fastapi.middleware.wsgi import WSGIMiddleware as WSGIMiddlewareFastAPI
 from flask import Flask
-from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_restx import Api
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
 
-from config import config, oauth, limiter, jwt
+from config import oauth, limiter, jwt
 from middleware.access_log_filter import (
     SuppressTestAccessLogMiddleware,
     install_test_request_log_filter,
 )
-from db.helpers_.psycopg import initialize_psycopg_connection
+from db.client.core import DatabaseClient
+from db.helpers_.psycopg import initialize_psycopg_connection_pool
+from db.helpers_.url_index import normalized_url_index, url_index_enabled
 from endpoints.instantiations.admin_.routes import namespace_admin
 from endpoints.instantiations.agencies_.routes import namespace_agencies
 from endpoints.instantiations.auth_.callback import namespace_callback
@@ -72,6 +73,11 @@ from endpoints.v3.user.routes import user_router
 from middleware.scheduled_tasks.check_database_health import check_database_health
 from middleware.scheduled_tasks.manager import SchedulerManager
 from middleware.util.env import get_env_variable
+from middleware.util.json_serialization import (
+    FastJSONProvider,
+    FastJSONResponse,
+    output_json,
+)
 
 env = Env()
 env.read_env()
@@ -115,19 +121,13 @@ def get_flask_app_cookie_encryption_key() -> str:
     return get_env_variable("FLASK_APP_COOKIE_ENCRYPTION_KEY")
 
 
-class UpdatedJSONProvider(DefaultJSONProvider):
-    def default(self, o):
-        if isinstance(o, date) or isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
-
-
 def create_flask_app() -> Flask:
-    psycopg2_connection = initialize_psycopg_connection()
-    config.connection = psycopg2_connection
+    initialize_psycopg_connection_pool()
+    if url_index_enabled():
+        normalized_url_index.get(DatabaseClient().stream_raw_sql)
     api = get_api_with_namespaces()
     app = Flask(__name__)
-    app.json = UpdatedJSONProvider(app)
+    app.json = FastJSONProvider(app)
 
     # JWT settings
     app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY")
@@ -165,6 +165,20 @@ def create_flask_app() -> Flask:
         scheduler.add_materialized_view_scheduled_job("map_states", 4)
         scheduler.add_materialized_view_scheduled_job("map_counties", 5)
         scheduler.add_materialized_view_scheduled_job("map_localities", 6)
+        scheduler.add_job(
+            job_id="refresh_metrics_summary",
+            func=scheduler.dbc.refresh_metrics_summary,
+            interval=IntervalTrigger(
+                start_date=current_time + timedelta(minutes=10), minutes=60
+            ),
+        )
+        scheduler.add_job(
+            job_id="refresh_metrics_followed_searches_breakdown",
+            func=scheduler.dbc.refresh_metrics_followed_searches_breakdown,
+            interval=IntervalTrigger(
+                start_date=current_time + timedelta(minutes=20), minutes=60
+            ),
+        )
         scheduler.start()
     else:
         print("Scheduled jobs are disabled.")
@@ -184,6 +198,7 @@ def get_api_with_namespaces():
         "\n\nTo search the database, go to [pdap.io](https://pdap.io)."
         "\n\nThe new FastAPI API is available at {this_address}/docs",
     )
+    api.representation("application/json")(output_json)
     for namespace in NAMESPACES:
         api.add_namespace(namespace)
     return api
@@ -232,6 +247,7 @@ def create_fast_api_app() -> FastAPI:
         "\n\nTo search the database, go to [pdap.io](https://pdap.io)."
         "\n\nThe old Flask API is available at {this_address}/"
         "",
+        default_response_class=FastJSONResponse,
     )
     for router in [sm_router, user_router, permission_router]:
         fast_api_app.include_router(router)
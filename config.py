@@ -6,14 +6,6 @@ from flask_limiter.util import get_remote_address
 from flask_jwt_extended import JWTManager
 
 from middleware.util.env import get_env_variable
-from psycopg.connection import Connection as PgConnection
-
-
-class Config:
-    connection: PgConnection = None
-
-
-config = Config()
 
 secret_key = get_env_variable("FLASK_APP_COOKIE_ENCRYPTION_KEY")
 cache_secret_key = f"_state_github_{secret_key}"
@@ -1,3 +1,4 @@
+import threading
 from collections import namedtuple
 from collections.abc import Sequence
 from contextlib import contextmanager
@@ -7,6 +8,7 @@ from operator import and_
 from typing import (
     Any,
     Callable,
+    Iterator,
     LiteralString,
     cast,
     final,
@@ -14,8 +16,7 @@ from typing import (
 
 import psycopg
 import sqlalchemy.exc
-from psycopg import Cursor
-from psycopg.connection import Connection as pg_connection
+from psycopg import Cursor, sql
 from psycopg.rows import tuple_row
 from sqlalchemy import select, delete, update, Select, func, RowMapping, Executable
 from sqlalchemy.orm import (
@@ -28,15 +29,19 @@ from db.client.decorators import session_manager, session_manager_v2, cursor_man
 from db.client.helpers import initialize_sqlalchemy_session
 from db.constants import (
     PAGE_SIZE,
+    STREAM_BATCH_SIZE,
 )
 from db.db_client_dataclasses import (
     OrderByParameters,
     WhereMapping,
 )
+from db.dtos.agency_match_input import AgencyMatchInput
+from db.dtos.data_request_github_update import DataRequestGithubUpdate
 from db.dtos.data_request_info_for_github import (
     DataRequestInfoForGithub,
 )
 from db.dtos.event_batch import EventBatch
+from db.dtos.pending_event_batch import PendingEventBatch
 from db.dtos.user_with_permissions import UsersWithPermissions
 from db.dynamic_query_constructor import DynamicQueryConstructor
 from db.enums import (
@@ -47,10 +52,22 @@ from db.enums import (
 )
 from db.exceptions import LocationDoesNotExistError
 from db.helpers_ import session as sh
-from db.helpers_.psycopg import initialize_psycopg_connection
+from db.helpers_.keyset_pagination import KeysetPage
+from db.helpers_.materialized_views import notify_materialized_views_refreshed
+from db.helpers_.psycopg import stream_query_results
 from db.helpers_.result_formatting import (
     get_expanded_display_name,
 )
+from db.helpers_.typeahead_index.manager import (
+    typeahead_agencies_index,
+    typeahead_index_enabled,
+    typeahead_locations_index,
+)
+from db.helpers_.url_index import (
+    invalidate_normalized_url_index,
+    normalized_url_index,
+    url_index_enabled,
+)
 from db.models.base import Base
 from db.models.implementations.core.agency.core import Agency
 from db.models.implementations.core.data_request.core import DataRequest
@@ -85,10 +102,17 @@ from db.models.implementations.links.agency__location import LinkAgencyLocation
 from db.models.implementations.links.user__followed_location import (
     LinkUserFollowedLocation,
 )
+from db.models.implementations.materialized_views.metrics.summary import (
+    MetricsSummary,
+)
 from db.models.table_reference import (
     SQL_ALCHEMY_TABLE_REFERENCE,
 )
 from db.queries.builder.core import QueryBuilderBase
+from db.queries.instantiations.data_requests.github import (
+    CreateDataRequestsGithubIssueInfoQueryBuilder,
+    UpdateDataRequestsFromGithubQueryBuilder,
+)
 from db.queries.instantiations.data_requests.post import DataRequestsPostQueryBuilder
 from db.queries.instantiations.data_requests.put import DataRequestsPutQueryBuilder
 from db.queries.instantiations.data_sources.post.single import (
@@ -102,11 +126,26 @@ from db.queries.instantiations.log.most_recent_logged_table_counts import (
 from db.queries.instantiations.map.data_source_count import (
     GET_DATA_SOURCE_COUNT_BY_LOCATION_TYPE_QUERY,
 )
-from db.queries.instantiations.match.agencies import GetSimilarAgenciesQueryBuilder
+from db.queries.instantiations.match.agencies import (
+    GetSimilarAgenciesBatchQueryBuilder,
+    GetSimilarAgenciesQueryBuilder,
+)
+from db.queries.instantiations.match.locations import (
+    GetLocationIdsByNamesQueryBuilder,
+    LocationNames,
+)
 from db.queries.instantiations.metrics.followed_searches.breakdown import (
     GetMetricsFollowedSearchesBreakdownQueryBuilder,
 )
-from db.queries.instantiations.metrics.get import GET_METRICS_QUERY
+from db.queries.instantiations.metrics.followed_searches.refresh import (
+    RefreshMetricsFollowedSearchesBreakdownQueryBuilder,
+)
+from db.queries.instantiations.notifications.mark_sent import (
+    MarkNotificationsSentQueryBuilder,
+)
+from db.queries.instantiations.notifications.pending import (
+    GetPendingEventBatchesQueryBuilder,
+)
 from db.queries.instantiations.notifications.post import NotificationsPostQueryBuilder
 from db.queries.instantiations.notifications.preview import (
     NotificationsPreviewQueryBuilder,
@@ -199,17 +238,39 @@ from middleware.schema_and_dto.dtos.metrics import (
 from middleware.schema_and_dto.dtos.notifications.preview import (
     NotificationsPreviewOutput,
 )
+from middleware.primary_resource_logic.search.cache import (
+    invalidate_search_results_cache,
+)
+from middleware.security.api_key.cache import ApiKeyIdentity, api_key_auth_cache
+from middleware.third_party_interaction_logic.github.issue_info import GithubIssueInfo
 from middleware.util.argument_checking import check_for_mutually_exclusive_arguments
 from utilities.enums import RecordCategoryEnum
 
+# Tables whose changes can alter location and record type search results
+SEARCH_RESULT_RELATIONS = {
+    Relations.DATA_SOURCES.value,
+    Relations.AGENCIES.value,
+    Relations.LINK_AGENCIES_DATA_SOURCES.value,
+    Relations.LINK_AGENCIES_LOCATIONS.value,
+}
+
 
 @final
 class DatabaseClient:
     def __init__(self):
-        self.connection: pg_connection = initialize_psycopg_connection()
         self.session_maker = initialize_sqlalchemy_session()
         self.session: Session | None = None
-        self.cursor: Cursor | None = None
+        # Cursors are bound to a pooled connection for the duration of one call,
+        # so they are tracked per thread to keep shared clients thread-safe
+        self._local = threading.local()
+
+    @property
+    def cursor(self) -> Cursor | None:
+        return getattr(self._local, "cursor", None)
+
+    @cursor.setter
+    def cursor(self, cursor: Cursor | None):
+        self._local.cursor = cursor
 
     @cursor_manager()
     def execute_raw_sql(
@@ -235,6 +296,22 @@ class DatabaseClient:
             return None
         return results
 
+    def stream_raw_sql(
+        self,
+        query: str | sql.Composable,
+        vars_: tuple | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Executes an SQL query, yielding its results from a server-side cursor
+        rather than fetching them all at once.
+
+        :param query: The SQL query to execute.
+        :param vars_: A tuple of variables to replace placeholders in the SQL query, defaults to None
+        :param batch_size: Number of rows fetched per round trip.
+        :return: A generator of dicts.
+        """
+        return stream_query_results(query, vars_, batch_size=batch_size)
+
     @staticmethod
     def compile(query: Select) -> SQLCompiler:
         return query.compile(compile_kwargs={"literal_binds": True})
@@ -381,10 +458,49 @@ class DatabaseClient:
         builder = GetUserByIdQueryBuilder(user_id)
         return self.run_query_builder(builder)
 
+    def get_user_identity_by_api_key(self, api_key: str) -> ApiKeyIdentity | None:
+        """
+        Get the id, email and permissions of the user with the given api key hash,
+        served from the API key cache where possible.
+        :return: ApiKeyIdentity if the key exists; otherwise, None.
+        """
+        # Read before the lookup, so an identity raced by an invalidation is not cached
+        cache_generation = api_key_auth_cache.generation
+        identity = api_key_auth_cache.get(api_key)
+        if identity is not None:
+            return identity
+
+        query = (
+            select(
+                User.id,
+                User.email,
+                func.array_remove(
+                    func.array_agg(Permission.permission_name), None
+                ).label("permissions"),
+            )
+            .outerjoin(UserPermission, UserPermission.user_id == User.id)
+            .outerjoin(Permission, UserPermission.permission_id == Permission.id)
+            .where(User.api_key == api_key)
+            .group_by(User.id, User.email)
+        )
+        result = self.mapping(query)
+        if result is None:
+            return None
+        identity = ApiKeyIdentity(
+            user_id=result["id"],
+            user_email=result["email"],
+            permissions=tuple(
+                PermissionsEnum(permission) for permission in result["permissions"]
+            ),
+        )
+        api_key_auth_cache.set(api_key, identity, generation=cache_generation)
+        return identity
+
     def update_user_api_key(self, api_key: str, user_id: int):
         """Update the api key for a user."""
         query = update(User).where(User.id == user_id).values(api_key=api_key)
         self.execute(query)
+        api_key_auth_cache.invalidate_user(user_id)
 
     MapInfo = namedtuple(
         "MapInfo",
@@ -468,9 +584,17 @@ class DatabaseClient:
             email=results.email,
         )
 
-    @cursor_manager()
     def get_typeahead_locations(self, search_term: str, page: int) -> list[dict]:
-        """Return a list of data sources that match the search query."""
+        """Return a list of locations that match the search query."""
+        if typeahead_index_enabled():
+            index = typeahead_locations_index.get(self.execute_raw_sql)
+            return index.search(search_term, page=page)
+        return self._get_typeahead_locations_from_database(search_term, page=page)
+
+    @cursor_manager()
+    def _get_typeahead_locations_from_database(
+        self, search_term: str, page: int
+    ) -> list[dict]:
         query = DynamicQueryConstructor.generate_like_typeahead_locations_query(
             search_term, page=page
         )
@@ -489,9 +613,17 @@ class DatabaseClient:
         self.cursor.execute(fuzzy_match_query)
         return self.cursor.fetchall()
 
-    @cursor_manager()
     def get_typeahead_agencies(self, search_term: str, page: int) -> list[dict]:
-        """Return a list of data sources that match the search query."""
+        """Return a list of agencies that match the search query."""
+        if typeahead_index_enabled():
+            index = typeahead_agencies_index.get(self.execute_raw_sql)
+            return index.search(search_term, page=page)
+        return self._get_typeahead_agencies_from_database(search_term, page=page)
+
+    @cursor_manager()
+    def _get_typeahead_agencies_from_database(
+        self, search_term: str, page: int
+    ) -> list[dict]:
         query = DynamicQueryConstructor.generate_new_typeahead_agencies_query(
             search_term, page=page
         )
@@ -528,6 +660,25 @@ class DatabaseClient:
         self.cursor.execute(query)
         return self.cursor.fetchall()
 
+    def stream_search_with_location_and_record_type(
+        self,
+        location_id: int,
+        record_categories: list[RecordCategoryEnum] | None = None,
+        record_types: list[RecordTypesEnum] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Search for data sources in the database,
+        yielding results in batches from a server-side cursor rather than fetching them all at once.
+        """
+        check_for_mutually_exclusive_arguments(record_categories, record_types)
+
+        query = DynamicQueryConstructor.create_search_query(
+            location_id=location_id,
+            record_categories=record_categories,
+            record_types=record_types,
+        )
+        return stream_query_results(query)
+
     @cursor_manager()
     def search_federal_records(
         self, record_categories: list[RecordCategoryEnum] | None = None, page: int = 1
@@ -587,6 +738,7 @@ class DatabaseClient:
             permission_id=cast(int, permission_id_subquery),  # pyright: ignore[reportInvalidCast]
         )
         self.add(up)
+        api_key_auth_cache.invalidate_user(int(user_id))
 
     def remove_user_permission(self, user_id: str, permission: PermissionsEnum):
         query = delete(UserPermission).where(
@@ -599,6 +751,7 @@ class DatabaseClient:
             ),
         )
         self.execute(query)
+        api_key_auth_cache.invalidate_user(int(user_id))
 
     def get_user_permissions(self, user_id: int) -> list[PermissionsEnum]:
         query = (
@@ -632,6 +785,10 @@ class DatabaseClient:
         query_where = query_base.where(column == entry_id)
         query_values = query_where.values(**column_edit_mappings)
         session.execute(query_values)
+        if table_name in SEARCH_RESULT_RELATIONS:
+            sh.run_after_commit(session, invalidate_search_results_cache)
+        if table_name == Relations.DATA_SOURCES.value:
+            sh.run_after_commit(session, invalidate_normalized_url_index)
 
     update_data_source = partialmethod(
         _update_entry_in_table, table_name="data_sources", id_column_name="id"
@@ -651,6 +808,8 @@ class DatabaseClient:
             user_id=user_id,
         )
         self.run_query_builder(builder)
+        invalidate_search_results_cache()
+        invalidate_normalized_url_index()
 
     update_data_request = partialmethod(
         _update_entry_in_table,
@@ -685,7 +844,12 @@ class DatabaseClient:
             column_value_mappings=column_value_mappings,
             column_to_return=column_to_return,
         )
-        return self.run_query_builder(builder)
+        result = self.run_query_builder(builder)
+        if table_name in SEARCH_RESULT_RELATIONS:
+            invalidate_search_results_cache()
+        if table_name == Relations.DATA_SOURCES.value:
+            invalidate_normalized_url_index()
+        return result
 
     create_data_request = partialmethod(
         _create_entry_in_table, table_name="data_requests", column_to_return="id"
@@ -707,12 +871,15 @@ class DatabaseClient:
         dto: AgenciesPostDTO,
         user_id: int | None = None,
     ) -> int:
-        return self.run_query_builder(
+        agency_id = self.run_query_builder(
             CreateAgencyQueryBuilder(dto=dto, user_id=user_id)
         )
+        invalidate_search_results_cache()
+        return agency_id
 
     def add_location_to_agency(self, location_id: int, agency_id: int):
         self.add(LinkAgencyLocation(location_id=location_id, agency_id=agency_id))
+        invalidate_search_results_cache()
 
     def remove_location_from_agency(self, location_id: int, agency_id: int):
         query = delete(LinkAgencyLocation).where(
@@ -722,6 +889,7 @@ class DatabaseClient:
             )
         )
         self.execute(query)
+        invalidate_search_results_cache()
 
     create_request_source_relation = partialmethod(
         _create_entry_in_table,
@@ -743,7 +911,10 @@ class DatabaseClient:
 
     def add_data_source_v2(self, dto: DataSourcesPostDTO) -> int:
         builder = DataSourcesPostSingleQueryBuilder(dto)
-        return self.run_query_builder(builder)
+        data_source_id = self.run_query_builder(builder)
+        invalidate_search_results_cache()
+        invalidate_normalized_url_index()
+        return data_source_id
 
     create_data_request_github_info = partialmethod(
         _create_entry_in_table,
@@ -756,8 +927,10 @@ class DatabaseClient:
         column_to_return="id",
     )
 
+    @session_manager_v2
     def create_followed_search(
         self,
+        session: Session,
         user_id: int,
         location_id: int,
         record_types: list[RecordTypesEnum] | None = None,
@@ -769,7 +942,11 @@ class DatabaseClient:
             record_types=record_types,
             record_categories=record_categories,
         )
-        return self.run_query_builder(builder)
+        builder.build(session)
+        # Refreshed in the same transaction, so the follow and its breakdown commit together
+        RefreshMetricsFollowedSearchesBreakdownQueryBuilder(
+            location_ids=[location_id]
+        ).build(session)
 
     def create_county(self, name: str, fips: str, state_id: int) -> int:
         """Create county and return county id."""
@@ -853,12 +1030,14 @@ class DatabaseClient:
         page: int | None = 1,
         limit: int | None = PAGE_SIZE,
         requested_columns: list[str] | None = None,
-    ):
+        cursor: str | None = None,
+    ) -> KeysetPage:
         params = GetParams(
             order_by=order_by,
             page=page,
             limit=limit,
             requested_columns=requested_columns,
+            cursor=cursor,
         )
         builder = GetAgenciesQueryBuilder(
             params=params,
@@ -879,13 +1058,15 @@ class DatabaseClient:
         order_by: OrderByParameters | None = None,
         page: int | None = 1,
         limit: int | None = PAGE_SIZE,
-    ):
+        cursor: str | None = None,
+    ) -> KeysetPage:
         builder = GetDataSourcesQueryBuilder(
             data_sources_columns=data_sources_columns,
             data_requests_columns=data_requests_columns,
             order_by=order_by,
             page=page,
             limit=limit,
+            cursor=cursor,
         )
         return self.run_query_builder(builder)
 
@@ -993,12 +1174,21 @@ class DatabaseClient:
         table_name: str,
         id_column_value: str | int,
         id_column_name: str = "id",
-    ):
-        """Delete an entry from a table in the database."""
+    ) -> int:
+        """
+        Delete an entry from a table in the database.
+
+        :return: The number of rows deleted.
+        """
         table = SQL_ALCHEMY_TABLE_REFERENCE[table_name]
         column = getattr(table, id_column_name)
         query = delete(table).where(column == id_column_value)
-        session.execute(query)
+        result = session.execute(query)
+        if table_name in SEARCH_RESULT_RELATIONS:
+            sh.run_after_commit(session, invalidate_search_results_cache)
+        if table_name == Relations.DATA_SOURCES.value:
+            sh.run_after_commit(session, invalidate_normalized_url_index)
+        return result.rowcount
 
     delete_data_request = partialmethod(_delete_from_table, table_name="data_requests")
 
@@ -1012,8 +1202,10 @@ class DatabaseClient:
         _delete_from_table, table_name=Relations.LINK_LOCATIONS_DATA_REQUESTS.value
     )
 
+    @session_manager_v2
     def delete_followed_search(
         self,
+        session: Session,
         user_id: int,
         location_id: int,
         record_types: list[RecordTypesEnum] | None = None,
@@ -1025,7 +1217,11 @@ class DatabaseClient:
             record_types=record_types,
             record_categories=record_categories,
         )
-        return self.run_query_builder(builder)
+        builder.build(session)
+        # Refreshed in the same transaction, so the unfollow and its breakdown commit together
+        RefreshMetricsFollowedSearchesBreakdownQueryBuilder(
+            location_ids=[location_id]
+        ).build(session)
 
     @session_manager_v2
     def delete_data_source_agency_relation(
@@ -1036,13 +1232,47 @@ class DatabaseClient:
             LinkAgencyDataSource.data_source_id == data_source_id,
         )
         session.execute(statement)
+        sh.run_after_commit(session, invalidate_search_results_cache)
 
-    @cursor_manager()
     def check_for_url_duplicates(self, url: str) -> list[dict]:
+        if url_index_enabled():
+            index = normalized_url_index.get(self.stream_raw_sql)
+            duplicates = index.get_duplicates(url)
+            return [{"original_url": duplicate} for duplicate in duplicates]
+        return self._check_for_url_duplicates(url)
+
+    @cursor_manager()
+    def _check_for_url_duplicates(self, url: str) -> list[dict]:
         query = DynamicQueryConstructor.get_distinct_source_urls_query(url)
         self.cursor.execute(query)
         return self.cursor.fetchall()
 
+    def check_for_url_duplicates_bulk(self, urls: list[str]) -> dict[str, list[dict]]:
+        """
+        Checks many URLs for duplicates at once.
+
+        :param urls: Normalized URLs.
+        :return: The duplicates of each URL, keyed by URL.
+        """
+        if url_index_enabled():
+            index = normalized_url_index.get(self.stream_raw_sql)
+            return {
+                url: [
+                    {"original_url": duplicate}
+                    for duplicate in index.get_duplicates(url)
+                ]
+                for url in urls
+            }
+        query = select(
+            DistinctSourceURL.base_url, DistinctSourceURL.original_url
+        ).where(DistinctSourceURL.base_url.in_(urls))
+        duplicates: dict[str, list[dict]] = {url: [] for url in urls}
+        for mapping in self.mappings(query):
+            duplicates[mapping["base_url"]].append(
+                {"original_url": mapping["original_url"]}
+            )
+        return duplicates
+
     def get_columns_for_relation(self, relation: Relations) -> list[dict]:
         """Get columns for a given relation."""
         results = self.execute_raw_sql(get_columns_for_relation_query(relation))
@@ -1142,9 +1372,32 @@ class DatabaseClient:
             for result in results
         ]
 
-    def optionally_update_user_notification_queue(self) -> None:
+    def update_data_requests_from_github(
+        self, updates: list[DataRequestGithubUpdate]
+    ) -> None:
+        builder = UpdateDataRequestsFromGithubQueryBuilder(updates=updates)
+        self.run_query_builder(builder)
+
+    def create_data_requests_github_issue_info(
+        self, issue_infos: list[GithubIssueInfo]
+    ) -> None:
+        builder = CreateDataRequestsGithubIssueInfoQueryBuilder(issue_infos=issue_infos)
+        self.run_query_builder(builder)
+
+    def get_recorded_github_issue_numbers(self, issue_numbers: list[int]) -> set[int]:
+        """
+        Returns which of the GitHub issues are already linked to a data request.
+        """
+        query = select(DataRequestsGithubIssueInfo.github_issue_number).where(
+            DataRequestsGithubIssueInfo.github_issue_number.in_(issue_numbers)
+        )
+        return {row["github_issue_number"] for row in self.mappings(query)}
+
+    def optionally_update_user_notification_queue(
+        self, incremental: bool = False
+    ) -> None:
         return self.run_query_builder(
-            OptionallyUpdateUserNotificationQueueQueryBuilder()
+            OptionallyUpdateUserNotificationQueueQueryBuilder(incremental=incremental)
         )
 
     def get_national_location_id(self) -> int:
@@ -1158,6 +1411,25 @@ class DatabaseClient:
     def get_next_user_event_batch(self) -> EventBatch | None:
         return self.run_query_builder(NotificationsPostQueryBuilder())
 
+    def get_pending_event_batches(
+        self, limit: int, after_user_id: int | None = None
+    ) -> list[PendingEventBatch]:
+        return self.run_query_builder(
+            GetPendingEventBatchesQueryBuilder(limit=limit, after_user_id=after_user_id)
+        )
+
+    def mark_notifications_sent(
+        self,
+        data_request_queue_ids: list[int],
+        data_source_queue_ids: list[int],
+    ) -> None:
+        return self.run_query_builder(
+            MarkNotificationsSentQueryBuilder(
+                data_request_queue_ids=data_request_queue_ids,
+                data_source_queue_ids=data_source_queue_ids,
+            )
+        )
+
     def preview_notifications(self) -> NotificationsPreviewOutput:
         return self.run_query_builder(NotificationsPreviewQueryBuilder())
 
@@ -1277,6 +1549,7 @@ class DatabaseClient:
     def delete_user(self, user_id: int):
         query = delete(User).where(User.id == user_id)
         self.execute(query)
+        api_key_auth_cache.invalidate_user(user_id)
 
     def update_pending_user_validation_token(self, email: str, validation_token: str):
         query = (
@@ -1320,12 +1593,37 @@ class DatabaseClient:
         builder = GetSimilarAgenciesQueryBuilder(name=name, location_id=location_id)
         return self.run_query_builder(builder)
 
-    def get_metrics(self):
-        result = self.execute_raw_sql(GET_METRICS_QUERY)
-        d = {}
-        for row in result:
-            d[row["Count Type"]] = row["count"]
-        return d
+    def get_similar_agencies_batch(
+        self, inputs: list[AgencyMatchInput], similarity_threshold: float
+    ) -> list[list[AgencyMatchResponseInnerDTO]]:
+        builder = GetSimilarAgenciesBatchQueryBuilder(
+            inputs=inputs, similarity_threshold=similarity_threshold
+        )
+        return self.run_query_builder(builder)
+
+    def get_location_ids_by_names(
+        self, locations: list[LocationNames]
+    ) -> list[int | None]:
+        return self.run_query_builder(
+            GetLocationIdsByNamesQueryBuilder(locations=locations)
+        )
+
+    def get_metrics(self) -> dict[str, int]:
+        query = select(
+            MetricsSummary.source_count,
+            MetricsSummary.agency_count,
+            MetricsSummary.state_count,
+            MetricsSummary.county_count,
+        )
+        return dict(self.mappings(query)[0])
+
+    def refresh_metrics_summary(self) -> None:
+        """
+        Recomputes the site-wide counts read by the metrics endpoints.
+        Refreshed concurrently, so reads are served from the previous counts meanwhile.
+        """
+        self.execute_raw_sql("REFRESH MATERIALIZED VIEW CONCURRENTLY metrics_summary;")
+        notify_materialized_views_refreshed(["metrics_summary"])
 
     @session_manager
     def get_record_types_and_categories(self):
@@ -1357,16 +1655,24 @@ class DatabaseClient:
 
         return {"record_types": record_types, "record_categories": record_categories}
 
-    @session_manager
-    def get_all(self, model: type[Base]):
-        def to_dict(instance):
-            return {
-                c.name: getattr(instance, c.name) for c in instance.__table__.columns
-            }
-
-        results = self.session.query(model).all()
+    def get_all(self, model: type[Base]) -> list[dict[str, Any]]:
+        return list(self.stream_all(model))
 
-        return [to_dict(result) for result in results]
+    def stream_all(
+        self, model: type[Base], batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yields every row of a model's table as a dict of column values,
+        fetching `batch_size` rows from the database at a time.
+        Rows are read as plain columns, so no ORM instances are built or retained.
+        The session is held open until the generator is exhausted or closed.
+        """
+        query = select(*model.__table__.columns)
+        with self.session_scope() as session:
+            for mapping in sh.stream_mappings(
+                session, query=query, batch_size=batch_size
+            ):
+                yield dict(mapping)
 
     @session_manager
     def update_location_by_id(self, location_id: int, dto: LocationPutDTO):
@@ -1383,9 +1689,11 @@ class DatabaseClient:
 
     def refresh_materialized_view(self, view_name: str):
         self.execute_raw_sql(f"REFRESH MATERIALIZED VIEW {view_name};")
+        notify_materialized_views_refreshed([view_name])
 
     def refresh_all_materialized_views(self) -> None:
         self.execute_raw_sql(REFRESH_ALL_MATERIALIZED_VIEWS_QUERIES)
+        notify_materialized_views_refreshed()
 
     def get_map_localities(self) -> list[dict[str, str | int | dict[str, float]]]:
         return self.execute_raw_sql(GET_MAP_LOCALITIES_QUERY)
@@ -1396,6 +1704,15 @@ class DatabaseClient:
     def get_map_states(self) -> list[dict[str, str | int]]:
         return self.execute_raw_sql(GET_MAP_STATES_QUERY)
 
+    @cursor_manager(row_factory=tuple_row)
+    def get_json_payload(self, query: str) -> bytes:
+        """
+        Executes a query returning a single JSON document as text,
+        and returns it encoded, without parsing it into Python objects.
+        """
+        self.cursor.execute(cast(LiteralString, query))
+        return self.cursor.fetchone()[0].encode("utf-8")
+
     def get_data_source_count_by_location_type(self):
         return self.execute_raw_sql(GET_DATA_SOURCE_COUNT_BY_LOCATION_TYPE_QUERY)[0]
 
@@ -1432,6 +1749,19 @@ class DatabaseClient:
         builder = GetMetricsFollowedSearchesBreakdownQueryBuilder(dto=dto)
         return self.run_query_builder(builder)
 
+    def refresh_metrics_followed_searches_breakdown(
+        self, location_ids: list[int] | None = None
+    ) -> None:
+        """
+        Recomputes the followed searches breakdown.
+
+        :param location_ids: The followed locations to recompute. If None, all are recomputed.
+        """
+        builder = RefreshMetricsFollowedSearchesBreakdownQueryBuilder(
+            location_ids=location_ids
+        )
+        self.run_query_builder(builder)
+
     def get_metrics_followed_searches_aggregate(self) -> dict[str, Any]:
         # TODO: QueryBuilder
         subquery_latest_notification = (
@@ -1441,24 +1771,33 @@ class DatabaseClient:
             .scalar_subquery()
         )
 
+        # Counted live, so the totals agree with the breakdown refreshed on each follow
         statement = select(
             func.count(func.distinct(LinkUserFollowedLocation.user_id)).label(
                 "total_followers"
             ),
-            func.count(LinkUserFollowedLocation.location_id).label("location_count"),
+            func.count(LinkUserFollowedLocation.location_id).label(
+                "total_followed_searches"
+            ),
             subquery_latest_notification.label("last_notification"),
         )
 
         result = self.one(statement)
 
+        last_notification_date = None
+        if result.last_notification is not None:
+            last_notification_date = result.last_notification.strftime(DATE_FORMAT)
         return {
             "total_followers": result.total_followers,
-            "total_followed_searches": result.location_count,
-            "last_notification_date": result.last_notification.strftime(DATE_FORMAT),
+            "total_followed_searches": result.total_followed_searches,
+            "last_notification_date": last_notification_date,
         }
 
     def get_duplicate_urls_bulk(self, urls: list[str]) -> Sequence:
         """Return all URLs that already exist in the database."""
+        if url_index_enabled():
+            index = normalized_url_index.get(self.stream_raw_sql)
+            return index.get_existing_urls(urls)
         stmt = select(DistinctSourceURL.original_url).where(
             DistinctSourceURL.base_url.in_(urls)
         )
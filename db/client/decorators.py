@@ -7,7 +7,7 @@ from functools import wraps
 from psycopg.rows import RowFactory, dict_row
 from sqlalchemy.orm import Session
 
-from db.helpers_.psycopg import initialize_psycopg_connection
+from db.helpers_.psycopg import get_psycopg_connection_pool
 
 
 def session_manager(method):
@@ -48,7 +48,8 @@ def session_manager_v2(method: callable) -> callable:
 
 def cursor_manager(row_factory: RowFactory = dict_row):
     """Decorator method for managing a cursor object.
-    The cursor is closed after the method concludes its execution.
+    A connection is checked out of the shared pool for the duration of the method,
+    and the cursor is closed after the method concludes its execution.
 
     :param row_factory: Row factory for the cursor, defaults to dict_row
     """
@@ -56,25 +57,23 @@ def cursor_manager(row_factory: RowFactory = dict_row):
     def decorator(method):
         @wraps(method)
         def wrapper(self, *args, **kwargs):
-            # Open a new cursor
-            # If connection is closed, reopen
-            if self.connection.closed != 0:
-                self.connection = initialize_psycopg_connection()
-            self.cursor = self.connection.cursor(row_factory=row_factory)
-            try:
-                # Execute the method
-                result = method(self, *args, **kwargs)
-                # Commit the transaction if no exception occurs
-                self.connection.commit()
-                return result
-            except Exception as e:
-                # Rollback in case of an error
-                self.connection.rollback()
-                raise e
-            finally:
-                # Close the cursor
-                self.cursor.close()
-                self.cursor = None
+            with get_psycopg_connection_pool().connection() as connection:
+                # Open a new cursor on the checked-out connection
+                self.cursor = connection.cursor(row_factory=row_factory)
+                try:
+                    # Execute the method
+                    result = method(self, *args, **kwargs)
+                    # Commit the transaction if no exception occurs
+                    connection.commit()
+                    return result
+                except Exception as e:
+                    # Rollback in case of an error
+                    connection.rollback()
+                    raise e
+                finally:
+                    # Close the cursor
+                    self.cursor.close()
+                    self.cursor = None
 
         return wrapper
 
@@ -59,6 +59,8 @@ METADATA_METHOD_NAMES = [
 ]
 
 PAGE_SIZE = 100
+# Number of rows fetched per round trip when streaming query results
+STREAM_BATCH_SIZE = 1000
 
 GET_METRICS_FOLLOWED_SEARCHES_BREAKDOWN_SORTABLE_COLUMNS = [
     "location_name",
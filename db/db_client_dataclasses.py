@@ -4,6 +4,7 @@ from typing import Any, Callable, Optional
 
 from pydantic import BaseModel
 from sqlalchemy.sql.expression import UnaryExpression
+from sqlalchemy import bindparam
 from sqlalchemy.schema import Column
 from sqlalchemy.sql.expression import asc, desc, BinaryExpression
 
@@ -80,6 +81,36 @@ class WhereMapping:
         relation_reference = SQL_ALCHEMY_TABLE_REFERENCE[relation]
         return getattr(relation_reference, self.column).in_(self.value)
 
+    @property
+    def shape(self) -> tuple:
+        """
+        Identifies the clause built by `build_parametrized_where_clause`,
+        which is the same for any values of the same kind.
+        """
+        if isinstance(self.value, list):
+            return self.column, self.eq, "in"
+        if self.value is None:
+            return self.column, self.eq, "null"
+        return self.column, self.eq, "value"
+
+    def build_parametrized_where_clause(
+        self, relation: str, parameter_name: str
+    ) -> BinaryExpression:
+        """Creates a SQLAlchemy BinaryExpression comparing against a bound parameter,
+        to be supplied with `value` at execution.
+
+        :param relation:
+        :param parameter_name: The name of the bound parameter.
+        :return: BinaryExpression. Example: Agency.municipality == :where_0
+        """
+        column = getattr(SQL_ALCHEMY_TABLE_REFERENCE[relation], self.column)
+        if isinstance(self.value, list):
+            return column.in_(bindparam(parameter_name, expanding=True))
+        if self.value is None:
+            return column.is_(None) if self.eq is True else column.is_not(None)
+        parameter = bindparam(parameter_name)
+        return column == parameter if self.eq is True else column != parameter
+
     @staticmethod
     def from_dict(d: dict) -> list["WhereMapping"]:
         results = []
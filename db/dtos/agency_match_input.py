@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from middleware.schema_and_dto.dtos._helpers import (
+    default_field_not_required,
+    default_field_required,
+)
+
+
+class AgencyMatchInput(BaseModel):
+    """
+    A name to match agencies against, optionally restricted to a location
+    """
+
+    name: str = default_field_required(
+        description="The name of the agency to match",
+    )
+    location_id: Optional[int] = default_field_not_required(
+        description="The ID of the location the agency must be linked to, if any",
+    )
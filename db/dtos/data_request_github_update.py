@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from db.enums import RequestStatus
+from middleware.enums import RecordTypesEnum
+
+
+class DataRequestGithubUpdate(BaseModel):
+    """
+    Data Request Info to be updated from its GitHub Issue
+    """
+
+    data_request_id: int
+    request_status: RequestStatus
+    record_types_required: list[RecordTypesEnum]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+from db.dtos.event_batch import EventBatch
+from middleware.schema_and_dto.dtos._helpers import default_field_required
+
+
+class PendingEventBatch(BaseModel):
+    """
+    An unsent event batch, with the notification queue entries it was built from
+    """
+
+    event_batch: EventBatch = default_field_required(
+        description="The events to send to the user",
+    )
+    data_request_queue_ids: list[int] = default_field_required(
+        description="The IDs of the data request notification queue entries in the batch",
+    )
+    data_source_queue_ids: list[int] = default_field_required(
+        description="The IDs of the data source notification queue entries in the batch",
+    )
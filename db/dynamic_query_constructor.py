@@ -1,10 +1,9 @@
 from collections import namedtuple
-from typing import Callable, Optional
+from typing import Optional
 
 from psycopg import sql
-from sqlalchemy import select
+from sqlalchemy import Integer, Select, bindparam, select
 from sqlalchemy.orm import load_only, InstrumentedAttribute, selectinload
-from sqlalchemy.schema import Column
 
 from db.db_client_dataclasses import (
     OrderByParameters,
@@ -17,12 +16,17 @@ from db.models.table_reference import (
     SQL_ALCHEMY_TABLE_REFERENCE,
     convert_to_column_reference,
 )
+from db.helpers_.statement_cache import StatementCache
 from db.subquery_logic import SubqueryParameters
 from middleware.enums import RecordTypesEnum, Relations
 from utilities.enums import RecordCategoryEnum
 
 TableColumn = namedtuple("TableColumn", ["table", "column"])
 TableColumnAlias = namedtuple("TableColumnAlias", ["table", "column", "alias"])
+SelectionQuery = namedtuple("SelectionQuery", ["statement", "parameters"])
+
+# Statements built by `DynamicQueryConstructor.create_selection_query`, keyed by query shape
+SELECTION_QUERY_CACHE = StatementCache()
 
 
 class DynamicQueryConstructor:
@@ -436,63 +440,126 @@ class DynamicQueryConstructor:
     @staticmethod
     def create_selection_query(
         relation: str,
-        columns: list[Column],
+        columns: list[str],
         where_mappings: Optional[list[WhereMapping] | dict] = [True],
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[OrderByParameters] = None,
         subquery_parameters: Optional[list[SubqueryParameters]] = [],
         alias_mappings: Optional[dict[str, str]] = None,
-    ) -> Callable:
+    ) -> SelectionQuery:
         """
         Creates a SELECT query for a relation (table or view)
-        that selects the given columns with the given where mappings
-        :param columns: List of database column references. Example: [User.name, User.email]
+        that selects the given columns with the given where mappings.
+        Statements are cached by the shape of the query, with where clause values,
+        limit and offset supplied as bound parameters,
+        so repeated queries of the same shape are neither rebuilt nor recompiled.
+        :param columns: List of column names. Example: ["name", "email"]
         :param where_mappings: List of WhereMapping objects for conditional selection.
         :param limit:
         :param offset:
         :param order_by:
         :param subquery_parameters: List of SubqueryParameters objects for executing subqueries.
-        :return:
+        :return: The statement, and the parameters to execute it with.
         """
         if len(columns) == 0:
             raise ValueError("No columns provided")
+        filters: list[WhereMapping] | None
         if type(where_mappings) == dict:
-            where_mappings = [
+            filters = [
                 WhereMapping(
                     column=list(where_mappings.keys())[0],
                     value=list(where_mappings.values())[0],
                 )
             ]
-        if where_mappings != [True]:
-            where_mappings = [
-                mapping.build_where_clause(relation) for mapping in where_mappings
-            ]
+        elif where_mappings is None or where_mappings == [True]:
+            # `[True]` selects every row
+            filters = None
+        else:
+            filters = where_mappings
+        parameters = {}
+        where_shape = None
+        if filters is not None:
+            for index, mapping in enumerate(filters):
+                parameters[f"where_{index}"] = mapping.value
+            where_shape = tuple(mapping.shape for mapping in filters)
+        if limit is not None:
+            parameters["limit"] = limit
+        if offset is not None:
+            parameters["offset"] = offset
+
+        key = (
+            relation,
+            tuple(columns),
+            where_shape,
+            None if order_by is None else (order_by.sort_by, order_by.sort_order),
+            limit is not None,
+            offset is not None,
+            tuple(parameter.shape for parameter in subquery_parameters or []),
+            None if alias_mappings is None else tuple(sorted(alias_mappings.items())),
+        )
+        statement = SELECTION_QUERY_CACHE.get_or_build(
+            key,
+            lambda: DynamicQueryConstructor._build_selection_statement(
+                relation=relation,
+                columns=columns,
+                where_mappings=filters,
+                has_limit=limit is not None,
+                has_offset=offset is not None,
+                order_by=order_by,
+                subquery_parameters=subquery_parameters,
+                alias_mappings=alias_mappings,
+            ),
+        )
+        return SelectionQuery(statement=statement, parameters=parameters)
+
+    @staticmethod
+    def _build_selection_statement(
+        relation: str,
+        columns: list[str],
+        where_mappings: list[WhereMapping] | None,
+        has_limit: bool,
+        has_offset: bool,
+        order_by: Optional[OrderByParameters],
+        subquery_parameters: Optional[list[SubqueryParameters]],
+        alias_mappings: Optional[dict[str, str]],
+    ) -> Select:
+        column_references = convert_to_column_reference(
+            columns=columns, relation=relation
+        )
+        where_clauses = [
+            mapping.build_parametrized_where_clause(
+                relation, parameter_name=f"where_{index}"
+            )
+            for index, mapping in enumerate(where_mappings or [])
+        ]
         if order_by is not None:
             order_by = order_by.build_order_by_clause(relation)
         load_options = []
         if subquery_parameters:
             for parameter in subquery_parameters:
                 load_options.append(parameter.build_subquery_load_option(relation))
-            load_options.append(load_only(*columns))
+            load_options.append(load_only(*column_references))
             primary_relation_columns = [SQL_ALCHEMY_TABLE_REFERENCE[relation]]
         else:
-            primary_relation_columns = columns
+            primary_relation_columns = column_references
 
         if alias_mappings is not None:
             primary_relation_columns = DynamicQueryConstructor.apply_alias_mappings(
-                columns, alias_mappings
+                column_references, alias_mappings
             )
 
-        base_query = (  # noqa: E731
-            lambda: select(*primary_relation_columns)
+        statement = (
+            select(*primary_relation_columns)
             .options(*load_options)
-            .where(*where_mappings)
+            .where(*where_clauses)
             .order_by(order_by)
-            .limit(limit)
-            .offset(offset)
         )
-        return base_query
+        if has_limit:
+            statement = statement.limit(bindparam("limit", type_=Integer))
+        if has_offset:
+            statement = statement.offset(bindparam("offset", type_=Integer))
+        return statement
 
     @staticmethod
     def get_distinct_source_urls_query(url: str) -> sql.Composed:
@@ -154,6 +154,17 @@ class RequestUrgency(Enum):
     INDEFINITE = "indefinite_unknown"  # Indefinite or unknown length of time
 
 
+class SubqueryLoadingStrategy(Enum):
+    """
+    How the related entries of a dynamic subquery are loaded
+    """
+
+    # A second query per relation, loading related entries for all primary rows by primary key
+    SELECTIN = "selectin"
+    # A join in the primary query, with duplicate primary rows removed afterwards
+    JOINED = "joined"
+
+
 class EntityType(Enum):
     DATA_SOURCE = "Data Source"
     DATA_REQUEST = "Data Request"
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import cast
+
+from environs import Env
+from pydantic import BaseModel
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.pool import QueuePool
+
+from middleware.util.env import get_env_variable
+
+
+class EnginePoolConfig(BaseModel):
+    """
+    Sizing parameters for the process-wide SQLAlchemy connection pool.
+    Each value can be overridden with the environment variable of the same name,
+    prefixed with `SQLALCHEMY_` (e.g. `SQLALCHEMY_POOL_SIZE`).
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    @staticmethod
+    def from_env() -> "EnginePoolConfig":
+        env = Env()
+        env.read_env()
+        defaults = EnginePoolConfig()
+        with env.prefixed("SQLALCHEMY_"):
+            return EnginePoolConfig(
+                pool_size=env.int("POOL_SIZE", defaults.pool_size),
+                max_overflow=env.int("MAX_OVERFLOW", defaults.max_overflow),
+                pool_timeout=env.int("POOL_TIMEOUT", defaults.pool_timeout),
+                pool_recycle=env.int("POOL_RECYCLE", defaults.pool_recycle),
+                pool_pre_ping=env.bool("POOL_PRE_PING", defaults.pool_pre_ping),
+            )
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Running counters for connection checkouts from the engine pool.
+    """
+
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record_wait(self, seconds: float):
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool which records how long callers wait to check out a connection.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
+
+def _register_pool_listeners(engine: Engine, metrics: PoolMetrics):
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+
+def get_sqlalchemy_database_url() -> str:
+    do_database_url = get_env_variable("DO_DATABASE_URL")
+    return "postgresql+psycopg" + do_database_url[10:]
+
+
+class SQLAlchemyEngineSingleton:
+    """
+    Holds a single pooled SQLAlchemy engine per worker process.
+
+    The engine is recreated if the process id changes,
+    so that forked workers never share sockets with their parent.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+    _engine: Engine | None = None
+    _pid: int | None = None
+
+    def __new__(cls):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SQLAlchemyEngineSingleton, cls).__new__(cls)
+        return cls._instance
+
+    def get_engine(self) -> Engine:
+        if self._engine is None or self._pid != os.getpid():
+            with self._lock:
+                if self._engine is None or self._pid != os.getpid():
+                    self._engine = self._create_engine()
+                    self._pid = os.getpid()
+        return self._engine
+
+    def dispose(self):
+        with self._lock:
+            if self._engine is not None:
+                self._engine.dispose()
+            self._engine = None
+            self._pid = None
+
+    @staticmethod
+    def _create_engine() -> Engine:
+        pool_config = EnginePoolConfig.from_env()
+        engine = create_engine(
+            get_sqlalchemy_database_url(),
+            poolclass=InstrumentedQueuePool,
+            **pool_config.model_dump(),
+        )
+        pool = cast(InstrumentedQueuePool, engine.pool)
+        _register_pool_listeners(engine, metrics=pool.metrics)
+        return engine
+
+
+def get_engine() -> Engine:
+    """
+    Returns the pooled SQLAlchemy engine shared by all database clients in this process.
+    """
+    return SQLAlchemyEngineSingleton().get_engine()
+
+
+def get_pool_metrics() -> dict[str, int | float]:
+    """
+    Returns a snapshot of the shared engine's pool state and checkout metrics.
+    Useful for sizing the number of workers against Postgres' `max_connections`.
+    """
+    pool = cast(InstrumentedQueuePool, get_engine().pool)
+    metrics = pool.metrics
+    average_wait = (
+        metrics.total_wait_seconds / metrics.checkouts if metrics.checkouts else 0.0
+    )
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "connects": metrics.connects,
+        "checkouts": metrics.checkouts,
+        "checkins": metrics.checkins,
+        "invalidations": metrics.invalidations,
+        "average_wait_seconds": average_wait,
+        "max_wait_seconds": metrics.max_wait_seconds,
+    }
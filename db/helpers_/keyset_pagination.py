@@ -0,0 +1,167 @@
+"""
+Keyset (cursor) pagination for list queries.
+
+Rather than skipping `(page - 1) * limit` rows, a page requested with a cursor
+resumes directly after the last row of the previous page, using the ordering to seek to it.
+Rows are ordered by the requested sort column with `id` as a tiebreaker, so the ordering is total.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, and_, asc, desc, or_
+
+from db.db_client_dataclasses import OrderByParameters
+from db.enums import SortOrder
+from db.helpers import get_offset
+from db.models.table_reference import SQL_ALCHEMY_TABLE_REFERENCE
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class KeysetPage(BaseModel):
+    """
+    A page of results, with the cursor for the following page if there is one
+    """
+
+    results: list[dict]
+    next_cursor: Optional[str] = None
+
+
+class KeysetPaginator:
+    """
+    Orders and pages a query over a relation, either by page number or by cursor.
+
+    Cursors are opaque to clients: URL-safe base64 encoded JSON of the last row's sort key,
+    along with the ordering it was produced under.
+    A cursor is only valid for the ordering it was produced under.
+    """
+
+    def __init__(
+        self,
+        relation: str,
+        order_by: Optional[OrderByParameters],
+        limit: Optional[int],
+        page: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        model = SQL_ALCHEMY_TABLE_REFERENCE[relation]
+        id_column = getattr(model, "id", None)
+        if id_column is None:
+            raise ValueError(
+                f"Relation {relation} has no id column to use as a pagination tiebreaker"
+            )
+        self.id_column = id_column
+        self.sort_column = None
+        self.descending = False
+        if order_by is not None:
+            if order_by.sort_by != "id":
+                self.sort_column = getattr(model, order_by.sort_by)
+            self.descending = order_by.sort_order == SortOrder.DESCENDING
+        self.limit = limit
+        self.page = page
+        self.cursor = cursor
+
+    @property
+    def _ordering(self) -> list:
+        sort_by = None if self.sort_column is None else self.sort_column.key
+        return [sort_by, self.descending]
+
+    def apply(self, query: Select) -> Select:
+        """
+        Orders the query by the sort key, and limits it to the requested page.
+        One row beyond the limit is selected, to determine whether a following page exists.
+        """
+        direction = desc if self.descending else asc
+        if self.sort_column is not None:
+            query = query.order_by(direction(self.sort_column))
+        query = query.order_by(direction(self.id_column))
+
+        if self.cursor is not None:
+            query = query.where(self._build_seek_condition(*self._decode_cursor()))
+        else:
+            query = query.offset(get_offset(self.page))
+
+        if self.limit is not None:
+            query = query.limit(self.limit + 1)
+        return query
+
+    def get_page(self, rows: Sequence[Any]) -> tuple[Sequence[Any], Optional[str]]:
+        """
+        Trims the rows selected by `apply` to the limit, returning them with the next page's cursor.
+        """
+        if self.limit is None or len(rows) <= self.limit:
+            return rows, None
+        rows = rows[: self.limit]
+        return rows, self._encode_cursor(rows[-1])
+
+    def _build_seek_condition(self, sort_value: Any, id_value: int) -> ColumnElement:
+        id_column = self.id_column
+        id_after = id_column < id_value if self.descending else id_column > id_value
+        column = self.sort_column
+        if column is None:
+            return id_after
+
+        # Postgres sorts nulls last in ascending order, and first in descending order
+        if self.descending:
+            if sort_value is None:
+                return or_(and_(column.is_(None), id_after), column.is_not(None))
+            return or_(column < sort_value, and_(column == sort_value, id_after))
+        if sort_value is None:
+            return and_(column.is_(None), id_after)
+        return or_(
+            column > sort_value,
+            and_(column == sort_value, id_after),
+            column.is_(None),
+        )
+
+    def _encode_cursor(self, row: Any) -> str:
+        sort_value = None
+        if self.sort_column is not None:
+            sort_value = self._to_json_value(getattr(row, self.sort_column.key))
+        payload = json.dumps([self._ordering, sort_value, row.id])
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self) -> tuple[Any, int]:
+        try:
+            payload = base64.urlsafe_b64decode(self.cursor.encode("ascii"))
+            ordering, sort_value, id_value = json.loads(payload)
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise InvalidCursorError("Invalid cursor.")
+        if ordering != self._ordering or not isinstance(id_value, int):
+            raise InvalidCursorError(
+                "Cursor does not match the requested sort order; "
+                "request the first page again to obtain a new cursor."
+            )
+        try:
+            return self._from_json_value(sort_value), id_value
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Invalid cursor.")
+
+    @staticmethod
+    def _to_json_value(value: Any) -> Any:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    def _from_json_value(self, value: Any) -> Any:
+        if value is None or self.sort_column is None:
+            return value
+        try:
+            python_type = self.sort_column.type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        return value
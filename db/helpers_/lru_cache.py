@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _CacheEntry(Generic[V]):
+    value: V
+    expires_at: float | None
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded, thread-safe least recently used cache, whose entries optionally expire.
+
+    Each invalidation advances the cache's `generation`.
+    A value loaded while an invalidation ran may predate it,
+    so callers read the generation before loading a value and pass it to `set`,
+    which drops the value if the cache has been invalidated since.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """
+        :param generation: The `generation` read before the value was loaded.
+            If given, the value is only cached if no invalidation has run since.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            expires_at = None
+            if self.ttl_seconds is not None:
+                expires_at = time.monotonic() + self.ttl_seconds
+            self._entries[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def remove_where(self, predicate: Callable[[K, V], bool]) -> None:
+        """
+        Invalidates the entries for which the predicate is true.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if predicate(key, entry.value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Invalidates every entry.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,38 @@
+from collections import defaultdict
+from typing import Callable
+
+# Callbacks to run after a materialized view is refreshed, keyed by view name
+_REFRESH_LISTENERS: dict[str, list[Callable[[], None]]] = defaultdict(list)
+
+
+def add_materialized_view_refresh_listener(
+    view_names: list[str], callback: Callable[[], None]
+) -> None:
+    """
+    Registers a callback to be run in this process whenever any of the given
+    materialized views is refreshed, e.g. to invalidate data derived from them.
+
+    :param view_names: Names of the materialized views to listen to.
+    :param callback: A function taking no arguments.
+    """
+    for view_name in view_names:
+        if callback not in _REFRESH_LISTENERS[view_name]:
+            _REFRESH_LISTENERS[view_name].append(callback)
+
+
+def notify_materialized_views_refreshed(view_names: list[str] | None = None) -> None:
+    """
+    Runs the callbacks registered for the given materialized views.
+    Each callback is run at most once, even if it listens to several of the views.
+
+    :param view_names: Names of the refreshed views. If None, all views are considered refreshed.
+    """
+    if view_names is None:
+        view_names = list(_REFRESH_LISTENERS.keys())
+    callbacks: list[Callable[[], None]] = []
+    for view_name in view_names:
+        for callback in _REFRESH_LISTENERS.get(view_name, []):
+            if callback not in callbacks:
+                callbacks.append(callback)
+    for callback in callbacks:
+        callback()
@@ -1,60 +1,165 @@
+import os
+import threading
+from typing import Any, Iterator
+
 import psycopg
-from psycopg.connection import Connection as PgConnection
+from environs import Env
+from psycopg import sql
+from psycopg.rows import RowFactory, dict_row
+from psycopg_pool import ConnectionPool
+from pydantic import BaseModel
 
 from db.exceptions import DatabaseInitializationError
 from middleware.util.env import get_env_variable
 
 
-class DatabaseConnectionSingleton:
-    _instance = None
+class PsycopgPoolConfig(BaseModel):
+    """
+    Sizing parameters for the process-wide psycopg connection pool.
+    Each value can be overridden with the environment variable of the same name,
+    prefixed with `PSYCOPG_POOL_` (e.g. `PSYCOPG_POOL_MAX_SIZE`).
+    """
+
+    min_size: int = 1
+    max_size: int = 10
+    timeout: float = 30.0
+    max_lifetime: float = 1800.0
+    max_idle: float = 600.0
+
+    @staticmethod
+    def from_env() -> "PsycopgPoolConfig":
+        env = Env()
+        env.read_env()
+        defaults = PsycopgPoolConfig()
+        with env.prefixed("PSYCOPG_POOL_"):
+            return PsycopgPoolConfig(
+                min_size=env.int("MIN_SIZE", defaults.min_size),
+                max_size=env.int("MAX_SIZE", defaults.max_size),
+                timeout=env.float("TIMEOUT", defaults.timeout),
+                max_lifetime=env.float("MAX_LIFETIME", defaults.max_lifetime),
+                max_idle=env.float("MAX_IDLE", defaults.max_idle),
+            )
 
-    def __init__(self):
-        self._connection = None
+
+class DatabaseConnectionPoolSingleton:
+    """
+    Holds a single psycopg connection pool per worker process.
+
+    Raw SQL callers check a connection out for the duration of one transaction,
+    so concurrent requests no longer share (and interleave transactions on) one connection.
+    The pool is recreated if the process id changes, so forked workers never share sockets.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+    _pool: ConnectionPool | None = None
+    _pid: int | None = None
 
     def __new__(cls):
         if not cls._instance:
-            if not cls._instance:
-                cls._instance = super(DatabaseConnectionSingleton, cls).__new__(cls)
-                cls._instance._connection = None
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(DatabaseConnectionPoolSingleton, cls).__new__(
+                        cls
+                    )
         return cls._instance
 
-    def get_connection(self) -> PgConnection:
-        if self._connection is None or self._connection.closed != 0:
-            self._connection = self._initialize_psycopg_connection()
-        return self._connection
+    def get_pool(self) -> ConnectionPool:
+        if self._pool is None or self._pool.closed or self._pid != os.getpid():
+            with self._lock:
+                if self._pool is None or self._pool.closed or self._pid != os.getpid():
+                    self._pool = self._initialize_connection_pool()
+                    self._pid = os.getpid()
+        return self._pool
 
-    def _initialize_psycopg_connection(self) -> PgConnection:
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+            self._pool = None
+            self._pid = None
+
+    @staticmethod
+    def _initialize_connection_pool() -> ConnectionPool:
         """
-        Initializes a connection to a PostgreSQL database using psycopg with connection parameters
-        obtained from an environment variable. If the connection fails, it raises a DatabaseInitializationError.
+        Initializes a pool of connections to a PostgreSQL database using psycopg with connection parameters
+        obtained from an environment variable.
 
-        The function sets keepalive parameters to maintain the connection active during periods of inactivity.
+        Connections are health-checked before being handed out, and are replaced
+        once they exceed their maximum lifetime.
+        Keepalive parameters maintain connections during periods of inactivity.
 
-        :return: A psycopg connection object if successful.
+        :return: An open psycopg connection pool.
         """
-        try:
-            DO_DATABASE_URL = get_env_variable("DO_DATABASE_URL")
-
-            return psycopg.connect(
-                DO_DATABASE_URL,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5,
-            )
+        pool_config = PsycopgPoolConfig.from_env()
+        return ConnectionPool(
+            get_env_variable("DO_DATABASE_URL"),
+            min_size=pool_config.min_size,
+            max_size=pool_config.max_size,
+            timeout=pool_config.timeout,
+            max_lifetime=pool_config.max_lifetime,
+            max_idle=pool_config.max_idle,
+            check=ConnectionPool.check_connection,
+            kwargs={
+                "keepalives": 1,
+                "keepalives_idle": 30,
+                "keepalives_interval": 10,
+                "keepalives_count": 5,
+            },
+            name="data-sources-app",
+            open=True,
+        )
+
+
+def get_psycopg_connection_pool() -> ConnectionPool:
+    """
+    Returns the psycopg connection pool shared by all database clients in this process.
+    """
+    return DatabaseConnectionPoolSingleton().get_pool()
+
+
+def initialize_psycopg_connection_pool(wait: bool = False) -> ConnectionPool:
+    """
+    Opens the shared psycopg connection pool, optionally waiting until it holds
+    its minimum number of connections.
+    If the pool cannot be filled in time, it raises a DatabaseInitializationError.
 
+    :param wait: Whether to block until the pool has reached its minimum size.
+    :return: The shared psycopg connection pool.
+    """
+    pool = get_psycopg_connection_pool()
+    if wait:
+        try:
+            pool.wait(timeout=pool.timeout)
         except psycopg.OperationalError as e:
             raise DatabaseInitializationError(e) from e
+    return pool
 
 
-def initialize_psycopg_connection() -> PgConnection:
+def stream_query_results(
+    query: str | sql.Composable,
+    vars_: tuple | None = None,
+    batch_size: int = 1000,
+    row_factory: RowFactory = dict_row,
+) -> Iterator[Any]:
     """
-    Initializes a connection to a PostgreSQL database using psycopg with connection parameters
-    obtained from an environment variable. If the connection fails, it returns a default dictionary
-    indicating no data sources are available.
+    Yields the results of a query from a server-side cursor,
+    fetching `batch_size` rows from the database at a time.
 
-    The function sets keepalive parameters to maintain the connection active during periods of inactivity.
+    A pooled connection is held until the generator is exhausted or closed,
+    so consumers should iterate promptly and close the generator if they stop early.
 
-    :return: A psycopg connection object if successful, or a dictionary with a count of 0 and an empty data list upon failure.
+    :param query: The SQL query to execute.
+    :param vars_: Variables to replace placeholders in the query, defaults to None
+    :param batch_size: Number of rows fetched per round trip.
+    :param row_factory: Row factory for the cursor, defaults to dict_row
     """
-    return DatabaseConnectionSingleton().get_connection()
+    with get_psycopg_connection_pool().connection() as connection:
+        # Server-side cursors are only valid within a transaction,
+        # which the pool commits when the connection is returned
+        with connection.cursor(
+            name="stream_query_results", row_factory=row_factory
+        ) as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(query, vars_)
+            yield from cursor
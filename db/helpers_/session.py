@@ -1,6 +1,6 @@
-from typing import Sequence, Any
+from typing import Callable, Iterator, Sequence, Any
 
-from sqlalchemy import Select, RowMapping
+from sqlalchemy import Select, RowMapping, event
 from sqlalchemy.orm import Session
 
 from db.models.base import Base
@@ -11,6 +11,17 @@ def mappings(session: Session, query: Select) -> Sequence[RowMapping]:
     return raw_result.mappings().all()
 
 
+def stream_mappings(
+    session: Session, query: Select, batch_size: int
+) -> Iterator[RowMapping]:
+    """
+    Yields the results of a query from a server-side cursor,
+    fetching `batch_size` rows from the database at a time.
+    """
+    raw_result = session.execute(query, execution_options={"yield_per": batch_size})
+    yield from raw_result.mappings()
+
+
 def scalar(session: Session, query: Select) -> Any:
     raw_result = session.execute(query)
     return raw_result.scalar()
@@ -49,3 +60,12 @@ def add_many(
             for model in models
         ]
     return None
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Runs the callback once the session's transaction is committed,
+    and not at all if it is rolled back.
+    Used to invalidate caches only once other sessions can see the change.
+    """
+    event.listen(session, "after_commit", lambda _: callback(), once=True)
@@ -0,0 +1,62 @@
+import threading
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+from sqlalchemy import Executable
+
+from db.helpers_.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class StatementCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class StatementCache(LRUCache[Hashable, Executable]):
+    """
+    A bounded, thread-safe LRU cache of SQLAlchemy statements, keyed by the shape of the query.
+
+    Cached statements take their values from bound parameters supplied at execution,
+    so one statement serves every request of the same shape.
+    Reusing the same statement object also reuses its memoized cache key,
+    and with it SQLAlchemy's compiled form of the statement.
+    Cached statements are shared between threads and must not be mutated.
+    """
+
+    def __init__(self, max_size: int = 512):
+        super().__init__(max_size=max_size)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], Executable]
+    ) -> Executable:
+        """
+        Returns the statement cached under the key, building and caching it if absent.
+        Statements which fail to build are not cached.
+        """
+        statement = self.get(key)
+        with self._stats_lock:
+            if statement is not None:
+                self.hits += 1
+                return statement
+            self.misses += 1
+
+        statement = build()
+        self.set(key, statement)
+        return statement
+
+    def stats(self) -> StatementCacheStats:
+        with self._stats_lock:
+            return StatementCacheStats(
+                hits=self.hits, misses=self.misses, size=len(self)
+            )
+
+    def clear(self) -> None:
+        super().clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
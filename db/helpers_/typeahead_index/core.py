@@ -0,0 +1,138 @@
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from db.helpers_.typeahead_index.trigram import get_trigrams, trigram_similarity
+
+PAGE_SIZE = 10
+FUZZY_LIMIT = 10
+SUBSTRING_GRAM_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class TypeaheadIndexEntry:
+    """
+    A row of a typeahead materialized view, with the keys used to search it.
+
+    :param search_key: The text matched by prefix and substring searches.
+    :param sort_key: The text results are ordered by.
+    :param fuzzy_key: The text ranked by trigram similarity when nothing else matches.
+    :param result: The row returned to the caller.
+    """
+
+    search_key: str
+    sort_key: str
+    fuzzy_key: str
+    result: dict[str, Any]
+
+
+class TypeaheadIndex:
+    """
+    An in-memory index over a typeahead materialized view,
+    answering the same queries as the SQL typeahead queries without a database round trip:
+
+    - Prefix matches via binary search over a sorted array of lowercased search keys
+    - Substring matches via an n-gram posting index, verified against the search key
+    - Fuzzy fallback ranked by `pg_trgm`-compatible trigram similarity
+
+    Prefix matches are ranked before substring matches, each ordered by sort key.
+    """
+
+    def __init__(self, entries: list[TypeaheadIndexEntry]):
+        # Entries are stored in sort order, so an entry's position is its rank
+        self._entries = sorted(entries, key=lambda entry: entry.sort_key)
+        self._search_keys = [entry.search_key.lower() for entry in self._entries]
+
+        self._prefix_keys: list[tuple[str, int]] = sorted(
+            (search_key, rank) for rank, search_key in enumerate(self._search_keys)
+        )
+
+        self._gram_postings: dict[str, set[int]] = defaultdict(set)
+        for rank, search_key in enumerate(self._search_keys):
+            for gram in self._get_grams(search_key):
+                self._gram_postings[gram].add(rank)
+
+        self._fuzzy_trigrams = [
+            get_trigrams(entry.fuzzy_key) for entry in self._entries
+        ]
+        self._trigram_postings: dict[str, set[int]] = defaultdict(set)
+        for rank, trigrams in enumerate(self._fuzzy_trigrams):
+            for trigram in trigrams:
+                self._trigram_postings[trigram].add(rank)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, search_term: str, page: int) -> list[dict[str, Any]]:
+        """
+        Returns a page of prefix matches followed by substring matches.
+        If the first page is empty, falls back to the closest fuzzy matches.
+        """
+        term = search_term.lower()
+        prefix_ranks = self._get_prefix_ranks(term)
+        substring_ranks = self._get_substring_ranks(term) - prefix_ranks
+        ranks = sorted(prefix_ranks) + sorted(substring_ranks)
+
+        offset = (page - 1) * PAGE_SIZE
+        results = [
+            self._entries[rank].result for rank in ranks[offset : offset + PAGE_SIZE]
+        ]
+        if results or page > 1:
+            return results
+        return self.fuzzy_search(search_term)
+
+    def fuzzy_search(self, search_term: str) -> list[dict[str, Any]]:
+        """
+        Returns the entries whose fuzzy keys are most similar to the search term.
+        """
+        term_trigrams = get_trigrams(search_term)
+        candidates: set[int] = set()
+        for trigram in term_trigrams:
+            candidates |= self._trigram_postings.get(trigram, set())
+
+        scored = sorted(
+            candidates,
+            key=lambda rank: (
+                -trigram_similarity(term_trigrams, self._fuzzy_trigrams[rank]),
+                rank,
+            ),
+        )[:FUZZY_LIMIT]
+        # As in SQL, entries with no shared trigrams fill out the limit
+        rank = 0
+        while len(scored) < min(FUZZY_LIMIT, len(self._entries)):
+            if rank not in candidates:
+                scored.append(rank)
+            rank += 1
+        return [self._entries[rank].result for rank in scored]
+
+    def _get_prefix_ranks(self, term: str) -> set[int]:
+        start = bisect_left(self._prefix_keys, (term,))
+        ranks = set()
+        for search_key, rank in self._prefix_keys[start:]:
+            if not search_key.startswith(term):
+                break
+            ranks.add(rank)
+        return ranks
+
+    def _get_substring_ranks(self, term: str) -> set[int]:
+        grams = self._get_grams(term)
+        if not grams:
+            # Terms shorter than an n-gram are checked against every key
+            return {
+                rank
+                for rank, search_key in enumerate(self._search_keys)
+                if term in search_key
+            }
+        postings = sorted(
+            (self._gram_postings.get(gram, set()) for gram in grams), key=len
+        )
+        candidates = set.intersection(*postings)
+        return {rank for rank in candidates if term in self._search_keys[rank]}
+
+    @staticmethod
+    def _get_grams(text: str) -> set[str]:
+        return {
+            text[i : i + SUBSTRING_GRAM_LENGTH]
+            for i in range(len(text) - SUBSTRING_GRAM_LENGTH + 1)
+        }
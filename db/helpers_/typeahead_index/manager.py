@@ -0,0 +1,127 @@
+import threading
+from typing import Any, Callable
+
+from environs import Env
+
+from db.helpers_.materialized_views import add_materialized_view_refresh_listener
+from db.helpers_.typeahead_index.core import TypeaheadIndex, TypeaheadIndexEntry
+
+# Runs a raw SQL query, returning its rows (such as `DatabaseClient.execute_raw_sql`)
+RawSQLRunner = Callable[[str], list[dict[str, Any]] | None]
+
+LOAD_TYPEAHEAD_LOCATIONS_QUERY = """
+    SELECT display_name, type, state_name, county_name, locality_name, location_id, search_name
+    FROM typeahead_locations
+"""
+
+LOAD_TYPEAHEAD_AGENCIES_QUERY = """
+    SELECT id, name, jurisdiction_type, state_iso, municipality, county_name
+    FROM typeahead_agencies
+"""
+
+
+def typeahead_index_enabled() -> bool:
+    """
+    Whether typeahead queries are answered from the in-memory index.
+    Enabled with the `TYPEAHEAD_INDEX_ENABLED` environment variable.
+    """
+    return Env().bool("TYPEAHEAD_INDEX_ENABLED", False)
+
+
+def load_typeahead_locations_index(run_query: RawSQLRunner) -> TypeaheadIndex:
+    rows = run_query(LOAD_TYPEAHEAD_LOCATIONS_QUERY) or []
+    return TypeaheadIndex(
+        [
+            TypeaheadIndexEntry(
+                search_key=row.pop("search_name") or "",
+                sort_key=row["display_name"] or "",
+                fuzzy_key=" ".join(
+                    [
+                        row["locality_name"] or "",
+                        row["county_name"] or "",
+                        row["state_name"] or "",
+                    ]
+                ),
+                result=row,
+            )
+            for row in rows
+        ]
+    )
+
+
+def load_typeahead_agencies_index(run_query: RawSQLRunner) -> TypeaheadIndex:
+    rows = run_query(LOAD_TYPEAHEAD_AGENCIES_QUERY) or []
+    return TypeaheadIndex(
+        [
+            TypeaheadIndexEntry(
+                search_key=row["name"] or "",
+                sort_key=row["name"] or "",
+                fuzzy_key=row["name"] or "",
+                result={
+                    "id": row["id"],
+                    "display_name": row["name"],
+                    "jurisdiction_type": row["jurisdiction_type"],
+                    "state_iso": row["state_iso"],
+                    "locality_name": row["municipality"],
+                    "county_name": row["county_name"],
+                },
+            )
+            for row in rows
+        ]
+    )
+
+
+class TypeaheadIndexHolder:
+    """
+    Holds the in-memory index for one typeahead materialized view.
+
+    The index is loaded on first use and marked stale when the view is refreshed in this process.
+    The next request rebuilds a stale index, while concurrent requests keep being served
+    from the previous one until the new index is swapped in.
+    """
+
+    def __init__(
+        self,
+        view_name: str,
+        load: Callable[[RawSQLRunner], TypeaheadIndex],
+    ):
+        self.view_name = view_name
+        self._load = load
+        self._index: TypeaheadIndex | None = None
+        self._stale = False
+        self._lock = threading.Lock()
+        add_materialized_view_refresh_listener([view_name], self.mark_stale)
+
+    def get(self, run_query: RawSQLRunner) -> TypeaheadIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load(run_query)
+                    self._stale = False
+        elif self._stale and self._lock.acquire(blocking=False):
+            try:
+                if self._stale:
+                    self._stale = False
+                    self._index = self._load(run_query)
+            except Exception:
+                self._stale = True
+                raise
+            finally:
+                self._lock.release()
+        return self._index
+
+    def mark_stale(self) -> None:
+        self._stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+            self._stale = False
+
+
+typeahead_locations_index = TypeaheadIndexHolder(
+    view_name="typeahead_locations", load=load_typeahead_locations_index
+)
+typeahead_agencies_index = TypeaheadIndexHolder(
+    view_name="typeahead_agencies", load=load_typeahead_agencies_index
+)
@@ -0,0 +1,32 @@
+"""
+A Python implementation of the `pg_trgm` trigram model,
+so in-memory similarity scores rank candidates as `similarity()` does in Postgres.
+"""
+
+import re
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def get_trigrams(text: str) -> frozenset[str]:
+    """
+    Returns the set of trigrams `pg_trgm` extracts from the text:
+    each alphanumeric word is lowercased and padded with two leading spaces and one trailing space.
+    """
+    trigrams = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            trigrams.add(padded[i : i + 3])
+    return frozenset(trigrams)
+
+
+def trigram_similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """
+    Returns the `pg_trgm` similarity of two trigram sets:
+    the number of shared trigrams divided by the number of distinct trigrams in either.
+    """
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
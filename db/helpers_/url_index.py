@@ -0,0 +1,135 @@
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from environs import Env
+
+from middleware.util.url import normalize_url
+
+# Runs a raw SQL query, yielding its rows (such as `DatabaseClient.stream_raw_sql`)
+RawSQLStreamer = Callable[[str], Iterable[dict[str, Any]]]
+
+LOAD_SOURCE_URLS_QUERY = """
+    SELECT id, source_url
+    FROM data_sources
+    WHERE source_url IS NOT NULL
+"""
+
+
+def url_index_enabled() -> bool:
+    """
+    Whether URL duplicate checks are answered from the in-memory URL index.
+    Enabled with the `URL_INDEX_ENABLED` environment variable.
+    """
+    return Env().bool("URL_INDEX_ENABLED", False)
+
+
+class NormalizedURLIndex:
+    """
+    The source URLs of all data sources, keyed by their `normalize_url` form,
+    so URLs differing only in scheme, a leading `www.` or trailing slashes are duplicates.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, str]] = ()):
+        """
+        :param rows: (data source id, source URL) pairs.
+        """
+        self._urls: dict[str, dict[str, int]] = {}
+        for data_source_id, url in rows:
+            self.add(data_source_id=data_source_id, url=url)
+
+    def add(self, data_source_id: int, url: str) -> None:
+        self._urls.setdefault(normalize_url(url), {})[url] = data_source_id
+
+    def get_duplicates(self, url: str) -> list[str]:
+        """
+        Returns the original URLs of data sources duplicating the URL.
+        """
+        return list(self._urls.get(normalize_url(url), {}))
+
+    def get_existing_urls(self, urls: Iterable[str]) -> list[str]:
+        """
+        Returns the original URLs of data sources duplicating any of the URLs.
+        """
+        existing_urls: dict[str, None] = {}
+        for url in urls:
+            for duplicate in self.get_duplicates(url):
+                existing_urls[duplicate] = None
+        return list(existing_urls)
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+
+def load_normalized_url_index(stream_query: RawSQLStreamer) -> NormalizedURLIndex:
+    return NormalizedURLIndex(
+        (row["id"], row["source_url"]) for row in stream_query(LOAD_SOURCE_URLS_QUERY)
+    )
+
+
+class NormalizedURLIndexHolder:
+    """
+    Holds the in-memory URL index for this worker process.
+
+    The index is loaded on first use (or at startup), marked stale whenever data sources
+    are changed in this process, and rebuilt once older than `max_age_seconds`,
+    which bounds staleness across worker processes.
+    The next request rebuilds a stale index, while concurrent requests keep being served
+    from the previous one until the new index is swapped in.
+    """
+
+    def __init__(self, max_age_seconds: float = 300):
+        self.max_age_seconds = max_age_seconds
+        self._index: NormalizedURLIndex | None = None
+        self._loaded_at = 0.0
+        self._stale = False
+        self._lock = threading.Lock()
+
+    def get(self, stream_query: RawSQLStreamer) -> NormalizedURLIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._load(stream_query)
+        elif self._needs_reload() and self._lock.acquire(blocking=False):
+            try:
+                if self._needs_reload():
+                    self._load(stream_query)
+            finally:
+                self._lock.release()
+        return self._index
+
+    def mark_stale(self) -> None:
+        self._stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+            self._stale = False
+
+    def _needs_reload(self) -> bool:
+        return self._stale or time.monotonic() - self._loaded_at > self.max_age_seconds
+
+    def _load(self, stream_query: RawSQLStreamer) -> None:
+        # Cleared before loading, so changes made during the load mark the new index stale
+        self._stale = False
+        try:
+            self._index = load_normalized_url_index(stream_query)
+        except Exception:
+            self._stale = True
+            raise
+        self._loaded_at = time.monotonic()
+
+
+normalized_url_index = NormalizedURLIndexHolder()
+
+
+def invalidate_normalized_url_index() -> None:
+    """
+    Marks the URL index stale.
+    Call once any change to the source URLs of data sources is committed,
+    as the next request reloads the index from the committed rows.
+    """
+    normalized_url_index.mark_stale()
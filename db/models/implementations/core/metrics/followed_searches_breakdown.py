@@ -0,0 +1,31 @@
+# pyright: reportUninitializedInstanceVariable=false
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.models.base import Base
+from middleware.enums import Relations
+
+
+class MetricsFollowedSearchesBreakdown(Base):
+    """
+    Precomputed metrics for each followed location, with changes counted since the last notification.
+    Rebuilt whenever notifications are sent, and refreshed for a location as it is followed or unfollowed.
+    """
+
+    __tablename__ = Relations.METRICS_FOLLOWED_SEARCHES_BREAKDOWN.value
+
+    location_id: Mapped[int] = mapped_column(
+        ForeignKey("public.locations.id", ondelete="CASCADE"), primary_key=True
+    )
+    location_name: Mapped[str]
+    follower_count: Mapped[int]
+    follower_change: Mapped[int]
+    source_count: Mapped[int]
+    source_change: Mapped[int]
+    approved_requests_count: Mapped[int]
+    approved_requests_change: Mapped[int]
+    completed_requests_count: Mapped[int]
+    completed_requests_change: Mapped[int]
+    refreshed_at: Mapped[datetime] = mapped_column(server_default=func.now())
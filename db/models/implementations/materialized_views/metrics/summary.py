@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.models.base import Base
+from db.models.mixins import ViewMixin
+
+
+class MetricsSummary(Base, ViewMixin):
+    """
+    A single row of site-wide counts, refreshed on a schedule
+    """
+
+    __tablename__ = "metrics_summary"
+    __table_args__ = (PrimaryKeyConstraint("id"), {"info": "view"})
+
+    id: Mapped[int] = mapped_column()
+    source_count: Mapped[int] = mapped_column()
+    agency_count: Mapped[int] = mapped_column()
+    state_count: Mapped[int] = mapped_column()
+    county_count: Mapped[int] = mapped_column()
+    refreshed_at: Mapped[datetime] = mapped_column()
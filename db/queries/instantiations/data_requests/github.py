@@ -0,0 +1,86 @@
+from typing import final, override
+
+from sqlalchemy import insert, update
+
+from db.dtos.data_request_github_update import DataRequestGithubUpdate
+from db.enums import EventType, RequestStatus
+from db.models.implementations.core.data_request.core import DataRequest
+from db.models.implementations.core.data_request.github_issue_info import (
+    DataRequestsGithubIssueInfo,
+)
+from db.queries.builder.core import QueryBuilderBase
+from db.queries.builder.mixins.pending_event.data_request import (
+    DataRequestPendingEventMixin,
+)
+from middleware.third_party_interaction_logic.github.issue_info import GithubIssueInfo
+
+_STATUS_EVENT_TYPES = {
+    RequestStatus.READY_TO_START: EventType.REQUEST_READY_TO_START,
+    RequestStatus.COMPLETE: EventType.REQUEST_COMPLETE,
+}
+
+
+@final
+class UpdateDataRequestsFromGithubQueryBuilder(
+    QueryBuilderBase, DataRequestPendingEventMixin
+):
+    """
+    Updates the status and record types of many data requests in a single statement,
+    adding the same event notifications as `DataRequestsPutQueryBuilder`
+    """
+
+    def __init__(self, updates: list[DataRequestGithubUpdate]):
+        super().__init__()
+        self.updates = updates
+
+    @override
+    def run(self) -> None:
+        if len(self.updates) == 0:
+            return
+        _ = self.session.execute(
+            update(DataRequest),
+            [
+                {
+                    "id": update_.data_request_id,
+                    "request_status": update_.request_status.value,
+                    "record_types_required": [
+                        rt.value for rt in update_.record_types_required
+                    ],
+                }
+                for update_ in self.updates
+            ],
+        )
+        for update_ in self.updates:
+            event_type = _STATUS_EVENT_TYPES.get(update_.request_status)
+            if event_type is not None:
+                self._add_pending_event_notification(
+                    update_.data_request_id, event_type=event_type
+                )
+
+
+@final
+class CreateDataRequestsGithubIssueInfoQueryBuilder(QueryBuilderBase):
+    """
+    Links many data requests to their GitHub issues in a single statement
+    """
+
+    def __init__(self, issue_infos: list[GithubIssueInfo]):
+        super().__init__()
+        self.issue_infos = issue_infos
+
+    @override
+    def run(self) -> None:
+        if len(self.issue_infos) == 0:
+            return
+        _ = self.session.execute(
+            insert(DataRequestsGithubIssueInfo).values(
+                [
+                    {
+                        "data_request_id": issue_info.data_request_id,
+                        "github_issue_url": issue_info.url,
+                        "github_issue_number": issue_info.number,
+                    }
+                    for issue_info in self.issue_infos
+                ]
+            )
+        )
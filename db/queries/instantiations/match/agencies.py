@@ -1,11 +1,25 @@
+from collections import defaultdict
 from typing import Optional, List
 
-from sqlalchemy import Select, func
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    column,
+    exists,
+    func,
+    or_,
+    select,
+    true,
+    values,
+)
 from sqlalchemy.orm import load_only, selectinload
 
+from db.dtos.agency_match_input import AgencyMatchInput
 from db.enums import LocationType
 from db.models.implementations.core.agency.core import Agency
 from db.models.implementations.core.location.expanded import LocationExpanded
+from db.models.implementations.links.agency__location import LinkAgencyLocation
 from db.queries.builder.core import QueryBuilderBase
 from middleware.enums import AgencyType
 from middleware.schema_and_dto.dtos.match.response import (
@@ -13,6 +27,62 @@ from middleware.schema_and_dto.dtos.match.response import (
     AgencyMatchResponseInnerDTO,
 )
 
+MATCH_LIMIT = 10
+
+
+def _trigram_distance(name):
+    # Orders by descending similarity, using the agencies name trigram index
+    return Agency.name.op("<->")(name)
+
+
+def _agency_match_load_options() -> list:
+    return [
+        load_only(Agency.id, Agency.name, Agency.agency_type),
+        selectinload(Agency.locations).load_only(
+            LocationExpanded.state_name,
+            LocationExpanded.county_name,
+            LocationExpanded.locality_name,
+            LocationExpanded.type,
+        ),
+    ]
+
+
+def _result_to_dto(agency: Agency, similarity: float) -> AgencyMatchResponseInnerDTO:
+    locations = []
+    for location in agency.locations:
+        location_dto = AgencyMatchResponseLocationDTO(
+            state=location.state_name,
+            county=location.county_name,
+            locality=location.locality_name,
+            location_type=LocationType(location.type),
+        )
+        locations.append(location_dto)
+
+    return AgencyMatchResponseInnerDTO(
+        id=agency.id,
+        name=agency.name,
+        agency_type=AgencyType(agency.agency_type),
+        similarity=similarity,
+        locations=locations,
+    )
+
+
+def _results_to_dtos(
+    results: list[tuple[Agency, float]],
+) -> List[AgencyMatchResponseInnerDTO]:
+    """
+    Converts results in descending order of similarity to DTOs,
+    returning only the first if it is an exact match
+    """
+    dto_results = []
+    for result, similarity in results:
+        if similarity == 1:
+            return [
+                _result_to_dto(result, similarity),
+            ]
+        dto_results.append(_result_to_dto(result, similarity))
+    return dto_results
+
 
 class GetSimilarAgenciesQueryBuilder(QueryBuilderBase):
     def __init__(self, name: str, location_id: Optional[int] = None):
@@ -25,54 +95,120 @@ class GetSimilarAgenciesQueryBuilder(QueryBuilderBase):
         Retrieve agencies similar to the query
         Optionally filtering based on the location id
         """
-        # TODO: QueryBuilder
         query = Select(
             Agency,
             func.similarity(Agency.name, self.name),
-        ).options(
-            load_only(Agency.id, Agency.name, Agency.agency_type),
-            selectinload(Agency.locations).load_only(
-                LocationExpanded.state_name,
-                LocationExpanded.county_name,
-                LocationExpanded.locality_name,
-                LocationExpanded.type,
-            ),
-        )
+        ).options(*_agency_match_load_options())
         if self.location_id is not None:
             query = query.where(
                 Agency.locations.any(LocationExpanded.id == self.location_id)
             )
-        query = query.order_by(func.similarity(Agency.name, self.name).desc()).limit(10)
+        query = query.order_by(_trigram_distance(self.name)).limit(MATCH_LIMIT)
         execute_results = self.session.execute(query).all()
-        if len(execute_results) == 0:
-            return []
+        return _results_to_dtos(execute_results)
+
+
+class GetSimilarAgenciesBatchQueryBuilder(QueryBuilderBase):
+    """
+    Retrieves agencies similar to each of many names in a single query.
+
+    Unlike `GetSimilarAgenciesQueryBuilder`, candidates are limited to agencies
+    whose similarity is at least the threshold, using the `pg_trgm` `%` operator,
+    so the agencies name trigram index bounds the work done for each name.
+    """
 
-        def result_to_dto(agency: Agency, similarity: float):
-            locations = []
-            for location in agency.locations:
-                location_dto = AgencyMatchResponseLocationDTO(
-                    state=location.state_name,
-                    county=location.county_name,
-                    locality=location.locality_name,
-                    location_type=LocationType(location.type),
+    def __init__(
+        self,
+        inputs: list[AgencyMatchInput],
+        similarity_threshold: float,
+    ):
+        super().__init__()
+        self.inputs = inputs
+        self.similarity_threshold = similarity_threshold
+
+    def run(self) -> list[List[AgencyMatchResponseInnerDTO]]:
+        """
+        :return: The matches for each input, in the order of the inputs
+        """
+        if len(self.inputs) == 0:
+            return []
+        # `%` compares against the transaction's similarity threshold
+        self.session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.similarity_threshold",
+                    str(self.similarity_threshold),
+                    True,
                 )
-                locations.append(location_dto)
-
-            return AgencyMatchResponseInnerDTO(
-                id=agency.id,
-                name=agency.name,
-                agency_type=AgencyType(agency.agency_type),
-                similarity=similarity,
-                locations=locations,
             )
+        )
 
-        dto_results = []
-        for result, similarity in execute_results:
-            if similarity == 1:
-                return [
-                    result_to_dto(result, similarity),
+        candidates_by_ordinal = self._get_candidates()
+        agency_ids = {
+            agency_id
+            for candidates in candidates_by_ordinal.values()
+            for agency_id, _ in candidates
+        }
+        agencies = self._get_agencies(agency_ids)
+
+        return [
+            _results_to_dtos(
+                [
+                    (agencies[agency_id], similarity)
+                    for agency_id, similarity in candidates_by_ordinal[ordinal]
                 ]
-            dto = result_to_dto(result, similarity)
-            dto_results.append(dto)
+            )
+            for ordinal in range(len(self.inputs))
+        ]
 
-        return dto_results
+    def _get_candidates(self) -> dict[int, list[tuple[int, float]]]:
+        inputs = values(
+            column("ordinal", Integer),
+            column("name", String),
+            column("location_id", Integer),
+            name="inputs",
+        ).data(
+            [
+                (ordinal, match_input.name, match_input.location_id)
+                for ordinal, match_input in enumerate(self.inputs)
+            ]
+        )
+        candidates = (
+            select(
+                Agency.id.label("agency_id"),
+                func.similarity(Agency.name, inputs.c.name).label("similarity"),
+            )
+            .where(
+                Agency.name.op("%")(inputs.c.name),
+                or_(
+                    inputs.c.location_id.is_(None),
+                    exists().where(
+                        LinkAgencyLocation.agency_id == Agency.id,
+                        LinkAgencyLocation.location_id == inputs.c.location_id,
+                    ),
+                ),
+            )
+            .order_by(_trigram_distance(inputs.c.name))
+            .limit(MATCH_LIMIT)
+            .lateral("candidates")
+        )
+        query = (
+            select(inputs.c.ordinal, candidates.c.agency_id, candidates.c.similarity)
+            .select_from(inputs.join(candidates, true()))
+            .order_by(inputs.c.ordinal, candidates.c.similarity.desc())
+        )
+
+        candidates_by_ordinal: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for ordinal, agency_id, similarity in self.session.execute(query):
+            candidates_by_ordinal[ordinal].append((agency_id, similarity))
+        return candidates_by_ordinal
+
+    def _get_agencies(self, agency_ids: set[int]) -> dict[int, Agency]:
+        if len(agency_ids) == 0:
+            return {}
+        query = (
+            select(Agency)
+            .options(*_agency_match_load_options())
+            .where(Agency.id.in_(agency_ids))
+        )
+        return {agency.id: agency for agency in self.session.scalars(query)}
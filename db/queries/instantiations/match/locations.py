@@ -0,0 +1,66 @@
+from typing import Optional
+
+from sqlalchemy import Integer, String, and_, column, func, select, values
+
+from db.models.implementations.core.location.expanded import LocationExpanded
+from db.queries.builder.core import QueryBuilderBase
+
+# State, county and locality names
+LocationNames = tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class GetLocationIdsByNamesQueryBuilder(QueryBuilderBase):
+    """
+    Resolves many (state, county, locality) name tuples to location ids in a single query.
+    As with `DatabaseClient.get_location_id`, a name of None matches only a null name,
+    so ("Pennsylvania", None, None) resolves to the state itself.
+    Names are compared by equality rather than `IS NOT DISTINCT FROM`, so the inputs can be hash joined.
+    """
+
+    def __init__(self, locations: list[LocationNames]):
+        super().__init__()
+        self.locations = locations
+
+    def run(self) -> list[Optional[int]]:
+        """
+        :return: The id of each location, in the order given, or None if it does not exist
+        """
+        if len(self.locations) == 0:
+            return []
+        inputs = values(
+            column("ordinal", Integer),
+            column("state_name", String),
+            column("county_name", String),
+            column("locality_name", String),
+            name="inputs",
+        ).data(
+            [
+                (ordinal, state_name, county_name, locality_name)
+                for ordinal, (state_name, county_name, locality_name) in enumerate(
+                    self.locations
+                )
+            ]
+        )
+        query = (
+            select(inputs.c.ordinal, func.min(LocationExpanded.id))
+            .select_from(inputs)
+            .join(
+                LocationExpanded,
+                and_(
+                    *[
+                        func.coalesce(location_column, "")
+                        == func.coalesce(input_column, "")
+                        for location_column, input_column in (
+                            (LocationExpanded.state_name, inputs.c.state_name),
+                            (LocationExpanded.county_name, inputs.c.county_name),
+                            (LocationExpanded.locality_name, inputs.c.locality_name),
+                        )
+                    ]
+                ),
+            )
+            .group_by(inputs.c.ordinal)
+        )
+        location_ids: list[Optional[int]] = [None] * len(self.locations)
+        for ordinal, location_id in self.session.execute(query):
+            location_ids[ordinal] = location_id
+        return location_ids
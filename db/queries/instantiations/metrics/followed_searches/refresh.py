@@ -0,0 +1,224 @@
+from typing import Optional
+
+from sqlalchemy import Select, and_, case, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from db.enums import RequestStatus
+from db.models.implementations.core.data_request.core import DataRequest
+from db.models.implementations.core.data_source.core import DataSource
+from db.models.implementations.core.location.expanded import LocationExpanded
+from db.models.implementations.core.log.notification import NotificationLog
+from db.models.implementations.core.metrics.followed_searches_breakdown import (
+    MetricsFollowedSearchesBreakdown,
+)
+from db.models.implementations.links.location__data_request import (
+    LinkLocationDataRequest,
+)
+from db.models.implementations.links.location__data_source_view import (
+    LinkLocationDataSourceView,
+)
+from db.models.implementations.links.user__followed_location import (
+    LinkUserFollowedLocation,
+)
+from db.queries.builder.core import QueryBuilderBase
+from db.queries.ctes.dependent_location import DependentLocationCTE
+
+
+class RefreshMetricsFollowedSearchesBreakdownQueryBuilder(QueryBuilderBase):
+    """
+    Recomputes the followed searches breakdown,
+    either for all followed locations or only for the given locations.
+
+    Rows are upserted and locations no longer followed are deleted, without locking the table,
+    so refreshing a location in the same transaction as a follow only waits on that location's row.
+    """
+
+    def __init__(self, location_ids: Optional[list[int]] = None):
+        super().__init__()
+        self.location_ids = location_ids
+
+    def run(self) -> None:
+        breakdown = MetricsFollowedSearchesBreakdown
+        select_query = self._build_breakdown_query()
+        columns = [column.name for column in select_query.selected_columns]
+        upsert = insert(breakdown).from_select(columns, select_query)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[breakdown.location_id],
+            set_={
+                **{
+                    column: upsert.excluded[column]
+                    for column in columns
+                    if column != breakdown.location_id.name
+                },
+                breakdown.refreshed_at.name: func.now(),
+            },
+        )
+        self.session.execute(upsert)
+
+        self.session.execute(
+            delete(breakdown).where(
+                self._limit_to_locations(breakdown.location_id),
+                ~exists().where(
+                    LinkUserFollowedLocation.location_id == breakdown.location_id
+                ),
+            )
+        )
+
+    def _limit_to_locations(self, column):
+        if self.location_ids is None:
+            return True
+        return column.in_(self.location_ids)
+
+    def _build_breakdown_query(self) -> Select:
+        # Get last notification time
+        last_notification_query = (
+            select(NotificationLog.created_at)
+            .order_by(NotificationLog.created_at.desc())
+            .limit(1)
+            .cte("last_notification")
+        )
+
+        last_notification = last_notification_query.c.created_at
+
+        def count_distinct(field, label):
+            return func.count(func.distinct(field)).label(label)
+
+        # Dependent Location CTE
+        dlsq = DependentLocationCTE()
+
+        def maybe_limit(column, limit_to_before_last_notification):
+            """Maybe limit to before the last notification"""
+            return (
+                column < last_notification
+                if limit_to_before_last_notification
+                else True
+            )
+
+        def follower_count_subquery():
+            link = LinkUserFollowedLocation
+            return (
+                select(
+                    link.location_id.label("location_id"),
+                    count_distinct(link.user_id, "total_count"),
+                    count_distinct(
+                        case(
+                            (link.created_at < last_notification, link.user_id),
+                        ),
+                        "old_count",
+                    ),
+                )
+                .join(dlsq.query, link.location_id == dlsq.dependent_location_id)
+                .where(self._limit_to_locations(link.location_id))
+                .group_by(link.location_id)
+                .cte("follow_counts")
+            )
+
+        def source_count_subquery():
+            link = LinkLocationDataSourceView
+            ds = DataSource
+            return (
+                select(
+                    dlsq.location_id.label("location_id"),
+                    count_distinct(ds.id, "total_count"),
+                    count_distinct(
+                        case((ds.created_at < last_notification, ds.id)),
+                        "old_count",
+                    ),
+                )
+                .join(link, link.location_id == dlsq.dependent_location_id)
+                .join(ds, ds.id == link.data_source_id)
+                .where(self._limit_to_locations(dlsq.location_id))
+                .group_by(dlsq.location_id)
+                .cte("source_counts")
+            )
+
+        def requests_col(request_status: RequestStatus, limit: bool, label: str):
+            dr = DataRequest
+            return count_distinct(
+                case(
+                    (
+                        and_(
+                            dr.request_status == request_status.value,
+                            maybe_limit(dr.date_status_last_changed, limit),
+                        ),
+                        dr.id,
+                    )
+                ),
+                label=f"{label}_count",
+            )
+
+        def requests_count_subquery():
+            dr = DataRequest
+            rs = RequestStatus
+            link = LinkLocationDataRequest
+            return (
+                select(
+                    dlsq.location_id,
+                    requests_col(rs.READY_TO_START, False, "total_approved"),
+                    requests_col(rs.READY_TO_START, True, "old_approved"),
+                    requests_col(rs.COMPLETE, False, "total_complete"),
+                    requests_col(rs.COMPLETE, True, "old_complete"),
+                )
+                .join(link, link.location_id == dlsq.dependent_location_id)
+                .join(dr, dr.id == link.data_request_id)
+                .where(self._limit_to_locations(dlsq.location_id))
+                .group_by(dlsq.location_id)
+                .cte("request_counts")
+            )
+
+        def get_diff_v2(attr1, attr2, attribute_name):
+            return (func.coalesce(attr1, 0) - func.coalesce(attr2, 0)).label(
+                f"{attribute_name}_change"
+            )
+
+        follows = follower_count_subquery()
+        diff_follows = get_diff_v2(
+            follows.c.total_count, follows.c.old_count, "follower"
+        )
+
+        sources = source_count_subquery()
+        diff_sources = get_diff_v2(sources.c.total_count, sources.c.old_count, "source")
+
+        requests = requests_count_subquery()
+        diff_approved_requests = get_diff_v2(
+            requests.c.total_approved_count,
+            requests.c.old_approved_count,
+            "approved_requests",
+        )
+        diff_completed_requests = get_diff_v2(
+            requests.c.total_complete_count,
+            requests.c.old_complete_count,
+            "completed_requests",
+        )
+
+        def coalesce(attr, label):
+            return func.coalesce(attr, 0).label(label)
+
+        final_query = (
+            select(
+                follows.c.location_id,
+                LocationExpanded.full_display_name.label("location_name"),
+                coalesce(follows.c.total_count, "follower_count"),
+                diff_follows,
+                coalesce(sources.c.total_count, "source_count"),
+                diff_sources,
+                coalesce(requests.c.total_approved_count, "approved_requests_count"),
+                diff_approved_requests,
+                coalesce(requests.c.total_complete_count, "completed_requests_count"),
+                diff_completed_requests,
+            )
+            .select_from(follows)
+            .join(LocationExpanded, follows.c.location_id == LocationExpanded.id)
+        )
+
+        for subquery in [sources, requests]:
+            final_query = final_query.outerjoin(
+                subquery,
+                follows.c.location_id == subquery.c.location_id,
+            )
+
+        # The follower count must be nonzero.
+        # Ordered so that concurrent refreshes lock the rows they upsert in the same order
+        return final_query.where(
+            follows.c.total_count > 0,
+        ).order_by(follows.c.location_id)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import final, override
+
+from sqlalchemy import update
+
+from db.models.implementations.core.notification.queue.data_request import (
+    DataRequestUserNotificationQueue,
+)
+from db.models.implementations.core.notification.queue.data_source import (
+    DataSourceUserNotificationQueue,
+)
+from db.queries.builder.core import QueryBuilderBase
+
+
+@final
+class MarkNotificationsSentQueryBuilder(QueryBuilderBase):
+    """
+    Marks the given notification queue entries as sent.
+    Only the entries included in sent emails are marked,
+    so events queued while a batch was being sent remain pending.
+    """
+
+    def __init__(
+        self,
+        data_request_queue_ids: list[int],
+        data_source_queue_ids: list[int],
+    ):
+        super().__init__()
+        self.queue_ids = {
+            DataRequestUserNotificationQueue: data_request_queue_ids,
+            DataSourceUserNotificationQueue: data_source_queue_ids,
+        }
+
+    @override
+    def run(self) -> None:
+        sent_at = datetime.now()
+        for queue, queue_ids in self.queue_ids.items():
+            if len(queue_ids) == 0:
+                continue
+            self.execute(
+                update(queue).where(queue.id.in_(queue_ids)).values(sent_at=sent_at)
+            )
@@ -0,0 +1,130 @@
+from typing import final, override
+
+from sqlalchemy import select, union
+
+from db.dtos.event_batch import EventBatch
+from db.dtos.event_info import EventInfo
+from db.dtos.pending_event_batch import PendingEventBatch
+from db.enums import EntityType, EventType
+from db.models.implementations.core.data_request.core import DataRequest
+from db.models.implementations.core.data_source.core import DataSource
+from db.models.implementations.core.notification.pending.data_request import (
+    DataRequestPendingEventNotification,
+)
+from db.models.implementations.core.notification.pending.data_source import (
+    DataSourcePendingEventNotification,
+)
+from db.models.implementations.core.notification.queue.data_request import (
+    DataRequestUserNotificationQueue,
+)
+from db.models.implementations.core.notification.queue.data_source import (
+    DataSourceUserNotificationQueue,
+)
+from db.models.implementations.core.user.core import User
+from db.queries.builder.core import QueryBuilderBase
+
+
+@final
+class GetPendingEventBatchesQueryBuilder(QueryBuilderBase):
+    """
+    Loads the unsent events for a page of users, ordered by user ID.
+    Events are loaded with one query per queue for the whole page, rather than per user.
+    """
+
+    def __init__(self, limit: int, after_user_id: int | None = None):
+        super().__init__()
+        self.limit = limit
+        self.after_user_id = after_user_id
+
+    @override
+    def run(self) -> list[PendingEventBatch]:
+        batches: dict[int, PendingEventBatch] = {
+            user["id"]: PendingEventBatch(
+                event_batch=EventBatch(
+                    user_id=user["id"], user_email=user["email"], events=[]
+                ),
+                data_request_queue_ids=[],
+                data_source_queue_ids=[],
+            )
+            for user in self._get_users()
+        }
+        if len(batches) == 0:
+            return []
+
+        for row in self.mappings(self._build_data_request_events_query(batches)):
+            batch = batches[row["user_id"]]
+            batch.data_request_queue_ids.append(row["queue_id"])
+            batch.event_batch.events.append(
+                self._build_event_info(row, entity_type=EntityType.DATA_REQUEST)
+            )
+        for row in self.mappings(self._build_data_source_events_query(batches)):
+            batch = batches[row["user_id"]]
+            batch.data_source_queue_ids.append(row["queue_id"])
+            batch.event_batch.events.append(
+                self._build_event_info(row, entity_type=EntityType.DATA_SOURCE)
+            )
+        return list(batches.values())
+
+    def _get_users(self):
+        pending_user_ids = union(
+            select(DataRequestUserNotificationQueue.user_id).where(
+                DataRequestUserNotificationQueue.sent_at.is_(None)
+            ),
+            select(DataSourceUserNotificationQueue.user_id).where(
+                DataSourceUserNotificationQueue.sent_at.is_(None)
+            ),
+        ).subquery()
+        query = select(User.id, User.email).join(
+            pending_user_ids, pending_user_ids.c.user_id == User.id
+        )
+        if self.after_user_id is not None:
+            query = query.where(User.id > self.after_user_id)
+        return self.mappings(query.order_by(User.id).limit(self.limit))
+
+    @staticmethod
+    def _build_data_request_events_query(batches: dict[int, PendingEventBatch]):
+        queue = DataRequestUserNotificationQueue
+        event = DataRequestPendingEventNotification
+        return (
+            select(
+                queue.id.label("queue_id"),
+                queue.user_id,
+                event.id.label("event_id"),
+                event.event_type,
+                DataRequest.id.label("entity_id"),
+                DataRequest.title.label("entity_name"),
+            )
+            .join(event, event.id == queue.event_id)
+            .join(DataRequest, DataRequest.id == event.data_request_id)
+            .where(queue.sent_at.is_(None), queue.user_id.in_(batches.keys()))
+            .order_by(queue.id)
+        )
+
+    @staticmethod
+    def _build_data_source_events_query(batches: dict[int, PendingEventBatch]):
+        queue = DataSourceUserNotificationQueue
+        event = DataSourcePendingEventNotification
+        return (
+            select(
+                queue.id.label("queue_id"),
+                queue.user_id,
+                event.id.label("event_id"),
+                event.event_type,
+                DataSource.id.label("entity_id"),
+                DataSource.name.label("entity_name"),
+            )
+            .join(event, event.id == queue.event_id)
+            .join(DataSource, DataSource.id == event.data_source_id)
+            .where(queue.sent_at.is_(None), queue.user_id.in_(batches.keys()))
+            .order_by(queue.id)
+        )
+
+    @staticmethod
+    def _build_event_info(row, entity_type: EntityType) -> EventInfo:
+        return EventInfo(
+            event_id=row["event_id"],
+            event_type=EventType(row["event_type"]),
+            entity_id=row["entity_id"],
+            entity_type=entity_type,
+            entity_name=row["entity_name"],
+        )
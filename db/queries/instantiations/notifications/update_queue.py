@@ -1,6 +1,7 @@
 from typing import final
 
-from sqlalchemy import select, Executable, and_
+from sqlalchemy import Select, and_, cast, func, null, select
+from sqlalchemy.dialects.postgresql import insert
 
 from db.models.implementations.links.location__data_request import (
     LinkLocationDataRequest,
@@ -31,50 +32,56 @@ from db.queries.ctes.dependent_location import DependentLocationCTE
 
 @final
 class OptionallyUpdateUserNotificationQueueQueryBuilder(QueryBuilderBase):
-    def __init__(self):
+    """
+    Adds a queue entry for each user following a location with a pending event.
+
+    Entries are inserted server-side with `INSERT ... SELECT ... ON CONFLICT DO NOTHING`,
+    relying on the queues' unique (event_id, user_id) constraints to skip existing entries.
+
+    :param incremental: If True, only events newer than the latest event already queued are considered,
+        so the refresh scales with new events rather than with all pending events.
+        Users who follow a location after an event was queued are not queued for that event.
+    """
+
+    def __init__(self, incremental: bool = False):
         super().__init__()
         self.dependent_locations = DependentLocationCTE()
+        self.incremental = incremental
 
     def add_queue_entries(
         self,
         queue_model: type[
             DataRequestUserNotificationQueue | DataSourceUserNotificationQueue
         ],
-        query: Executable,
+        query: Select,
     ) -> None:
-        raw_results = self.session.execute(query).mappings().all()
-        for result in raw_results:
-            queue = queue_model(
-                user_id=result["user_id"],
-                event_id=result["event_id"],
+        if self.incremental:
+            watermark = select(
+                func.coalesce(func.max(queue_model.event_id), 0)
+            ).scalar_subquery()
+            event_id = query.selected_columns.event_id
+            query = query.where(event_id > watermark)
+        statement = (
+            insert(queue_model)
+            .from_select(
+                ["event_id", "user_id", "sent_at"],
+                query.add_columns(
+                    cast(null(), queue_model.sent_at.type).label("sent_at")
+                ),
             )
-            self.session.add(queue)
-        self.session.flush()
+            .on_conflict_do_nothing(index_elements=["event_id", "user_id"])
+        )
+        self.execute(statement)
 
     def run(self) -> None:
-        """Clear and repopulates the user notification queue with new notifications."""
-        # Get all data requests associated with the user's location that have a corresponding event
-        # (and that event is not already in user_notification_queue for that user)
-        data_request_query = self._build_data_request_query()
-
-        raw_results = self.session.execute(data_request_query).mappings().all()
-        for result in raw_results:
-            queue = DataRequestUserNotificationQueue(
-                user_id=result["user_id"],
-                event_id=result["event_id"],
-            )
-            self.session.add(queue)
-        self.session.flush()
-
-        data_source_query = self._build_data_source_query()
-
-        raw_results = self.session.execute(data_source_query).mappings().all()
-        for result in raw_results:
-            queue = DataSourceUserNotificationQueue(
-                user_id=result["user_id"],
-                event_id=result["event_id"],
-            )
-            self.session.add(queue)
+        """Adds new notifications to the user notification queues."""
+        # Data requests associated with the user's followed locations that have a corresponding event
+        self.add_queue_entries(
+            DataRequestUserNotificationQueue, self._build_data_request_query()
+        )
+        self.add_queue_entries(
+            DataSourceUserNotificationQueue, self._build_data_source_query()
+        )
 
     def _build_data_source_query(self):
         data_source_query = (
@@ -124,14 +131,6 @@ class OptionallyUpdateUserNotificationQueueQueryBuilder(QueryBuilderBase):
                     LinkFollowRecordType.record_type_id == DataSource.record_type_id,
                 ),
             )
-            .where(
-                # Event ID should not be in user_notification_queue for that user
-                DataSourcePendingEventNotification.id.notin_(
-                    select(DataSourceUserNotificationQueue.event_id).where(
-                        DataSourceUserNotificationQueue.user_id == User.id
-                    )
-                )
-            )
         )
         return data_source_query
 
@@ -166,13 +165,5 @@ class OptionallyUpdateUserNotificationQueueQueryBuilder(QueryBuilderBase):
                 DataRequestPendingEventNotification.data_request_id
                 == LinkLocationDataRequest.data_request_id,
             )
-            .where(
-                # Event ID should not be in user_notification_queue for that user
-                DataRequestPendingEventNotification.id.notin_(
-                    select(DataRequestUserNotificationQueue.event_id).where(
-                        DataRequestUserNotificationQueue.user_id == User.id
-                    )
-                )
-            )
         )
         return data_request_query
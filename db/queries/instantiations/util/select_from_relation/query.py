@@ -9,7 +9,6 @@ from db.helpers import get_offset
 from db.queries.instantiations.util.select_from_relation.format import (
     format_with_metadata,
 )
-from db.models.table_reference import convert_to_column_reference
 from db.queries.builder.core import QueryBuilderBase
 from db.subquery_logic import SubqueryParameters
 
@@ -49,12 +48,9 @@ class SelectFromRelationQueryBuilder(QueryBuilderBase):
             self.where_mappings
         )
         offset = get_offset(self.page)
-        column_references = convert_to_column_reference(
-            columns=self.columns, relation=self.relation_name
-        )
         query = DynamicQueryConstructor.create_selection_query(
             self.relation_name,
-            column_references,
+            self.columns,
             where_mappings,
             limit,
             offset,
@@ -62,16 +58,31 @@ class SelectFromRelationQueryBuilder(QueryBuilderBase):
             self.subquery_parameters,
             self.alias_mappings,
         )
-        if self.apply_uniqueness_constraints:
-            raw_results = self.session.execute(query()).mappings().unique().all()
+        if self.apply_uniqueness_constraints and self._may_return_duplicates():
+            raw_results = (
+                self.session.execute(query.statement, query.parameters)
+                .mappings()
+                .unique()
+                .all()
+            )
         else:
-            raw_results = self.session.execute(query()).mappings().all()
+            raw_results = (
+                self.session.execute(query.statement, query.parameters).mappings().all()
+            )
         results = self._process_results(
             raw_results=raw_results,
         )
 
         return results
 
+    def _may_return_duplicates(self) -> bool:
+        # Subqueries loaded in separate queries leave one row per primary entry
+        if not self.subquery_parameters:
+            return True
+        return any(
+            parameter.duplicates_primary_rows for parameter in self.subquery_parameters
+        )
+
     def _process_results(
         self,
         raw_results: Sequence[RowMapping],
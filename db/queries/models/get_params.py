@@ -14,3 +14,4 @@ class GetParams(BaseModel):
     page: Optional[int] = (1,)
     limit: Optional[int] = (PAGE_SIZE,)
     requested_columns: Optional[list[str]] = (None,)
+    cursor: Optional[str] = None
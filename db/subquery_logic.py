@@ -2,9 +2,10 @@ from functools import partialmethod
 from typing import Optional
 
 from pydantic import BaseModel
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql.base import ExecutableOption
 
+from db.enums import SubqueryLoadingStrategy
 from db.models.table_reference import convert_to_column_reference
 from middleware.enums import Relations
 
@@ -18,6 +19,7 @@ class SubqueryParameters(BaseModel):
     linking_column: str
     columns: Optional[list[str]] = None
     alias_mappings: Optional[dict[str, str]] = None
+    loading_strategy: SubqueryLoadingStrategy = SubqueryLoadingStrategy.SELECTIN
 
     def set_columns(self, columns: list[str]) -> None:
         self.columns = columns
@@ -26,7 +28,7 @@ class SubqueryParameters(BaseModel):
         """Creates a SQLAlchemy ExecutableOption for subquerying.
 
         :param primary_relation:
-        :return: ExecutableOption. Example: defaultload(DataSource.agencies).load_only(Agency.name)
+        :return: ExecutableOption. Example: selectinload(DataSource.agencies).load_only(Agency.name)
         """
         column_references = convert_to_column_reference(
             columns=self.columns, relation=self.relation_name
@@ -35,7 +37,30 @@ class SubqueryParameters(BaseModel):
             columns=[self.linking_column], relation=primary_relation
         )
 
-        return joinedload(*linking_column_reference).load_only(*column_references)
+        load = LOADERS[self.loading_strategy]
+        return load(*linking_column_reference).load_only(*column_references)
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Identifies the load option built by `build_subquery_load_option`.
+        """
+        columns = None if self.columns is None else tuple(self.columns)
+        return self.relation_name, self.linking_column, columns, self.loading_strategy
+
+    @property
+    def duplicates_primary_rows(self) -> bool:
+        """
+        Whether loading this subquery repeats primary relation rows for each related entry,
+        requiring them to be made unique.
+        """
+        return self.loading_strategy == SubqueryLoadingStrategy.JOINED
+
+
+LOADERS = {
+    SubqueryLoadingStrategy.SELECTIN: selectinload,
+    SubqueryLoadingStrategy.JOINED: joinedload,
+}
 
 
 class SubqueryParameterManager:
@@ -49,12 +74,14 @@ class SubqueryParameterManager:
         linking_column: str,
         columns: Optional[list[str]] = None,
         alias_mappings: Optional[dict[str, str]] = None,
+        loading_strategy: SubqueryLoadingStrategy = SubqueryLoadingStrategy.SELECTIN,
     ) -> SubqueryParameters:
         return SubqueryParameters(
             relation_name=relation.value,
             linking_column=linking_column,
             columns=columns,
             alias_mappings=alias_mappings,
+            loading_strategy=loading_strategy,
         )
 
     agencies = partialmethod(
@@ -1,9 +1,9 @@
-from typing import Any, Sequence
+from typing import Sequence
 
-from sqlalchemy import asc, select
+from sqlalchemy import select
 
 from db.dynamic_query_constructor import DynamicQueryConstructor
-from db.helpers import get_offset
+from db.helpers_.keyset_pagination import KeysetPage, KeysetPaginator
 from endpoints.instantiations.agencies_.get._shared.convert import (
     agency_to_get_agencies_output,
 )
@@ -21,11 +21,13 @@ class GetAgenciesQueryBuilder(QueryBuilderBase):
         super().__init__()
         self.params = params
 
-    def run(self) -> Any:
-        order_by_clause = DynamicQueryConstructor.get_sql_alchemy_order_by_clause(
-            order_by=self.params.order_by,
+    def run(self) -> KeysetPage:
+        paginator = KeysetPaginator(
             relation=Relations.AGENCIES.value,
-            default=asc(Agency.id),
+            order_by=self.params.order_by,
+            limit=self.params.limit,
+            page=self.params.page,
+            cursor=self.params.cursor,
         )
 
         load_options = DynamicQueryConstructor.agencies_get_load_options(
@@ -35,14 +37,10 @@ class GetAgenciesQueryBuilder(QueryBuilderBase):
         # TODO: This format can be extracted to a function (see get_data_sources)
         query = select(Agency)
 
-        query = (
-            query.options(*load_options)
-            .order_by(order_by_clause)
-            .limit(self.params.limit)
-            .offset(get_offset(self.params.page))
-        )
+        query = paginator.apply(query.options(*load_options))
 
         results: Sequence[Agency] = self.session.execute(query).scalars(Agency).all()
+        results, next_cursor = paginator.get_page(results)
         final_results = []
         for result in results:
             agency_dictionary = agency_to_get_agencies_output(
@@ -50,4 +48,4 @@ class GetAgenciesQueryBuilder(QueryBuilderBase):
             )
             final_results.append(agency_dictionary)
 
-        return final_results
+        return KeysetPage(results=final_results, next_cursor=next_cursor)
@@ -2,10 +2,12 @@ from marshmallow import fields
 
 from db.enums import ApprovalStatus
 from middleware.schema_and_dto.dtos.common.base import GetManyRequestsBaseSchema
+from middleware.schema_and_dto.schemas.common.fields import CURSOR_FIELD
 from middleware.schema_and_dto.util import get_query_metadata
 
 
 class GetManyAgenciesRequestsSchema(GetManyRequestsBaseSchema):
+    cursor = CURSOR_FIELD
     approval_status = fields.Enum(
         enum=ApprovalStatus,
         by_value=fields.Str,
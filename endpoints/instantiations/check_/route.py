@@ -2,12 +2,14 @@ from flask import Response
 
 from config import limiter
 from endpoints.schema_config.instantiations.checker import (
+    UniqueURLBatchCheckerEndpointSchemaConfig,
     UniqueURLCheckerEndpointSchemaConfig,
 )
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.auth.info.instantiations import NO_AUTH_INFO
 from middleware.decorators.endpoint_info import endpoint_info
 from middleware.primary_resource_logic.unique_url_checker import (
+    unique_url_batch_checker_wrapper,
     unique_url_checker_wrapper,
 )
 from endpoints.psycopg_resource import PsycopgResource
@@ -38,3 +40,25 @@ class UniqueURLChecker(PsycopgResource):
             wrapper_function=unique_url_checker_wrapper,
             schema_populate_parameters=UniqueURLCheckerEndpointSchemaConfig.get_schema_populate_parameters(),
         )
+
+
+@namespace_url_checker.route("/unique-url/batch")
+class UniqueURLBatchChecker(PsycopgResource):
+    @endpoint_info(
+        namespace=namespace_url_checker,
+        description="Check if each of many URLs is unique",
+        schema_config=SchemaConfigs.CHECKER_BATCH_POST,
+        auth_info=NO_AUTH_INFO,
+        response_info=ResponseInfo(
+            response_dictionary={
+                200: "OK. Returns the duplicate urls, if any, of each url.",
+                400: "Bad request. No URLs, or too many URLs, were provided.",
+                500: "Internal server error",
+            }
+        ),
+    )
+    def post(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=unique_url_batch_checker_wrapper,
+            schema_populate_parameters=UniqueURLBatchCheckerEndpointSchemaConfig.get_schema_populate_parameters(),
+        )
@@ -1,11 +1,11 @@
-from typing import Any, Optional, Sequence
+from typing import Optional, Sequence
 
-from sqlalchemy import asc, select
+from sqlalchemy import select
 
 from db.constants import PAGE_SIZE
 from db.db_client_dataclasses import OrderByParameters
 from db.dynamic_query_constructor import DynamicQueryConstructor
-from db.helpers import get_offset
+from db.helpers_.keyset_pagination import KeysetPage, KeysetPaginator
 from endpoints.instantiations.data_sources_.get.convert import (
     data_source_to_get_data_sources_output,
 )
@@ -23,6 +23,7 @@ class GetDataSourcesQueryBuilder(QueryBuilderBase):
         order_by: Optional[OrderByParameters] = None,
         page: Optional[int] = 1,
         limit: Optional[int] = PAGE_SIZE,
+        cursor: Optional[str] = None,
     ):
         super().__init__()
         self.data_sources_columns = data_sources_columns
@@ -30,12 +31,15 @@ class GetDataSourcesQueryBuilder(QueryBuilderBase):
         self.order_by = order_by
         self.page = page
         self.limit = limit
+        self.cursor = cursor
 
-    def run(self) -> Any:
-        order_by_clause = DynamicQueryConstructor.get_sql_alchemy_order_by_clause(
-            order_by=self.order_by,
+    def run(self) -> KeysetPage:
+        paginator = KeysetPaginator(
             relation=Relations.DATA_SOURCES.value,
-            default=asc(DataSourceExpanded.id),
+            order_by=self.order_by,
+            limit=self.limit,
+            page=self.page,
+            cursor=self.cursor,
         )
 
         load_options = DynamicQueryConstructor.data_sources_get_load_options(
@@ -45,13 +49,12 @@ class GetDataSourcesQueryBuilder(QueryBuilderBase):
 
         query = select(DataSourceExpanded)
 
-        query = (
-            query.options(*load_options).order_by(order_by_clause).limit(self.limit)
-        ).offset(get_offset(self.page))
+        query = paginator.apply(query.options(*load_options))
 
         results: Sequence[DataSourceExpanded] = (
             self.session.execute(query).scalars(DataSource).all()
         )
+        results, next_cursor = paginator.get_page(results)
         final_results = []
         for result in results:
             data_source_dictionary = data_source_to_get_data_sources_output(
@@ -61,4 +64,4 @@ class GetDataSourcesQueryBuilder(QueryBuilderBase):
             )
             final_results.append(data_source_dictionary)
 
-        return final_results
+        return KeysetPage(results=final_results, next_cursor=next_cursor)
@@ -1,12 +1,16 @@
 from flask import Response, make_response
 
 from db.client.core import DatabaseClient
+from db.helpers_.url_index import invalidate_normalized_url_index
 from endpoints.instantiations.data_sources_.post.request_.model import (
     PostDataSourceOuterRequest,
 )
 from endpoints.instantiations.data_sources_.post.request_.query import (
     PostDataSourceQuery,
 )
+from middleware.primary_resource_logic.search.cache import (
+    invalidate_search_results_cache,
+)
 
 
 def post_data_source_wrapper(
@@ -14,6 +18,8 @@ def post_data_source_wrapper(
     dto: PostDataSourceOuterRequest,
 ) -> Response:
     ds_id: int = db_client.run_query_builder(PostDataSourceQuery(dto))
+    invalidate_search_results_cache()
+    invalidate_normalized_url_index()
     return make_response(
         {
             "message": "Successfully created data source",
@@ -93,6 +93,7 @@ class CreateTestUserWithElevatedPermissions(PsycopgResource):
         )
         with setup_database_client() as db_client:
             user_post_results(db_client=db_client, dto=dto)
+            user_id = db_client.get_user_id(email=auto_user_email)
             for permission in [
                 PermissionsEnum.READ_ALL_USER_INFO,
                 PermissionsEnum.DB_WRITE,
@@ -100,12 +101,13 @@ class CreateTestUserWithElevatedPermissions(PsycopgResource):
                 PermissionsEnum.SOURCE_COLLECTOR,
             ]:
                 db_client.add_user_permission(
-                    user_id=db_client.get_user_id(email=auto_user_email),
+                    user_id=user_id,
                     permission=permission,
                 )
             access_info = AccessInfoPrimary(
                 access_type=AccessTypeEnum.JWT,
                 user_email=auto_user_email,
+                user_id=user_id,
             )
             api_key = create_api_key_for_user(
                 db_client=db_client, access_info=access_info
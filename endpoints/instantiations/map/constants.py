@@ -0,0 +1,2 @@
+# Materialized views backing the map payloads, refreshed by the scheduler
+MAP_MATERIALIZED_VIEWS = ["map_states", "map_counties", "map_localities"]
@@ -0,0 +1,12 @@
+from endpoints.instantiations.map.locations.queries.federal import GET_FEDERAL_QUERY
+from endpoints.instantiations.map.locations.queries.payload import (
+    MAP_LOCATIONS_JSON,
+    json_array_of,
+)
+
+GET_MAP_DATA_PAYLOAD_QUERY = f"""
+SELECT JSON_BUILD_OBJECT(
+    'locations', {MAP_LOCATIONS_JSON},
+    'sources', {json_array_of(GET_FEDERAL_QUERY)}
+)::TEXT
+"""
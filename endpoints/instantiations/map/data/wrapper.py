@@ -1,16 +1,21 @@
-from flask import Response, make_response
+from flask import Response
 
 from db.client.core import DatabaseClient
-from endpoints.instantiations.map.locations.queries.federal import GET_FEDERAL_QUERY
+from db.helpers_.materialized_views import add_materialized_view_refresh_listener
+from endpoints.instantiations.map.constants import MAP_MATERIALIZED_VIEWS
+from endpoints.instantiations.map.data.query import GET_MAP_DATA_PAYLOAD_QUERY
+from middleware.util.precomputed_payload import PrecomputedPayloadCache
+
+
+def get_map_data(db_client: DatabaseClient) -> bytes:
+    return db_client.get_json_payload(GET_MAP_DATA_PAYLOAD_QUERY)
+
+
+map_data_payload_cache = PrecomputedPayloadCache(build=get_map_data)
+add_materialized_view_refresh_listener(
+    MAP_MATERIALIZED_VIEWS, map_data_payload_cache.invalidate
+)
 
 
 def get_data_for_map_wrapper(db_client: DatabaseClient) -> Response:
-    results = {
-        "locations": {
-            "localities": db_client.get_map_localities(),
-            "counties": db_client.get_map_counties(),
-            "states": db_client.get_map_states(),
-        },
-        "sources": db_client.execute_raw_sql(GET_FEDERAL_QUERY),
-    }
-    return make_response(results)
+    return map_data_payload_cache.get(db_client).to_response()
@@ -0,0 +1,26 @@
+from endpoints.instantiations.map.locations.queries.counties import (
+    GET_MAP_COUNTIES_QUERY,
+)
+from endpoints.instantiations.map.locations.queries.localities import (
+    GET_MAP_LOCALITIES_QUERY,
+)
+from endpoints.instantiations.map.locations.queries.states import GET_MAP_STATES_QUERY
+
+
+def json_array_of(query: str) -> str:
+    """
+    Wraps a query in an expression aggregating its rows into a JSON array,
+    which is empty rather than null when the query returns no rows.
+    """
+    return f"(SELECT COALESCE(JSON_AGG(R), '[]'::JSON) FROM ({query}) R)"
+
+
+MAP_LOCATIONS_JSON = f"""
+JSON_BUILD_OBJECT(
+    'localities', {json_array_of(GET_MAP_LOCALITIES_QUERY)},
+    'counties', {json_array_of(GET_MAP_COUNTIES_QUERY)},
+    'states', {json_array_of(GET_MAP_STATES_QUERY)}
+)
+"""
+
+GET_MAP_LOCATIONS_PAYLOAD_QUERY = f"SELECT {MAP_LOCATIONS_JSON}::TEXT"
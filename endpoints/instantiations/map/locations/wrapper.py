@@ -1,13 +1,23 @@
-from flask import Response, make_response
+from flask import Response
 
 from db.client.core import DatabaseClient
+from db.helpers_.materialized_views import add_materialized_view_refresh_listener
+from endpoints.instantiations.map.constants import MAP_MATERIALIZED_VIEWS
+from endpoints.instantiations.map.locations.queries.payload import (
+    GET_MAP_LOCATIONS_PAYLOAD_QUERY,
+)
+from middleware.util.precomputed_payload import PrecomputedPayloadCache
+
+
+def get_map_locations(db_client: DatabaseClient) -> bytes:
+    return db_client.get_json_payload(GET_MAP_LOCATIONS_PAYLOAD_QUERY)
+
+
+map_locations_payload_cache = PrecomputedPayloadCache(build=get_map_locations)
+add_materialized_view_refresh_listener(
+    MAP_MATERIALIZED_VIEWS, map_locations_payload_cache.invalidate
+)
 
 
 def get_locations_for_map_wrapper(db_client: DatabaseClient) -> Response:
-    return make_response(
-        {
-            "localities": db_client.get_map_localities(),
-            "counties": db_client.get_map_counties(),
-            "states": db_client.get_map_states(),
-        }
-    )
+    return map_locations_payload_cache.get(db_client).to_response()
@@ -1,10 +1,14 @@
 from flask import Response
 
-from endpoints.schema_config.instantiations.match import MatchAgencyEndpointSchemaConfig
+from endpoints.schema_config.instantiations.match import (
+    MatchAgenciesBatchEndpointSchemaConfig,
+    MatchAgencyEndpointSchemaConfig,
+)
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.auth.info.instantiations import STANDARD_JWT_AUTH_INFO
 from middleware.decorators.endpoint_info import endpoint_info
 from middleware.primary_resource_logic.match import (
+    match_agencies_batch_wrapper,
     match_agency_wrapper,
 )
 from endpoints.psycopg_resource import PsycopgResource
@@ -36,3 +40,27 @@ class MatchAgencies(PsycopgResource):
             wrapper_function=match_agency_wrapper,
             schema_populate_parameters=MatchAgencyEndpointSchemaConfig.get_schema_populate_parameters(),
         )
+
+
+@namespace_match.route("/agencies")
+class MatchAgenciesBatch(PsycopgResource):
+    @endpoint_info(
+        namespace=namespace_match,
+        auth_info=STANDARD_JWT_AUTH_INFO,
+        schema_config=SchemaConfigs.MATCH_AGENCIES_BATCH,
+        response_info=ResponseInfo(
+            success_message="Found any possible matches for each entry."
+        ),
+        description="""
+        Matches many agencies at once, returning a result for each entry in the order given,
+        with the same statuses as `/match/agency`.
+        * Locations for all entries are resolved together, and all entries are matched in a single query
+        * Only agencies with a similarity of at least `similarity_threshold` (default 0.3) are returned
+        At most 1000 entries can be matched per request.
+        """,
+    )
+    def post(self, access_info: AccessInfoPrimary) -> Response:
+        return self.run_endpoint(
+            wrapper_function=match_agencies_batch_wrapper,
+            schema_populate_parameters=MatchAgenciesBatchEndpointSchemaConfig.get_schema_populate_parameters(),
+        )
@@ -5,6 +5,10 @@ from db.queries.instantiations.search.record import CreateSearchRecordQueryBuild
 from endpoints.instantiations.search.core.models.request import SearchRequestDTO
 from endpoints.instantiations.search.core.models.response import SearchResponseDTO
 from endpoints.instantiations.search.core.queries.core import SearchQueryBuilder
+from middleware.primary_resource_logic.search.cache import (
+    get_search_cache_key,
+    search_results_cache,
+)
 from middleware.primary_resource_logic.search.helpers import (
     create_search_record,
     get_explicit_record_categories,
@@ -34,11 +38,22 @@ def search_wrapper_v2(
     explicit_record_categories: list[RecordCategoryEnum] | None = (
         get_explicit_record_categories(dto.record_categories)
     )
-    search_results: SearchResponseDTO = db_client.run_query_builder(
-        SearchQueryBuilder(
-            location_id=dto.location_id,
-            record_categories=explicit_record_categories,
-            record_types=dto.record_types,
-        )
+    cache_key = get_search_cache_key(
+        dto.location_id,
+        explicit_record_categories,
+        dto.record_types,
+        SearchResponseDTO.__name__,
     )
+    # Read before the search, so results raced by an invalidation are not cached
+    cache_generation = search_results_cache.generation
+    search_results: SearchResponseDTO | None = search_results_cache.get(cache_key)
+    if search_results is None:
+        search_results = db_client.run_query_builder(
+            SearchQueryBuilder(
+                location_id=dto.location_id,
+                record_categories=explicit_record_categories,
+                record_types=dto.record_types,
+            )
+        )
+        search_results_cache.set(cache_key, search_results, generation=cache_generation)
     return search_results.model_dump(mode="json")
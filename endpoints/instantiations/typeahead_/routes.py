@@ -32,6 +32,8 @@ def get_typeahead_kwargs(db_client_method: Callable) -> dict:
         "schema_populate_parameters": SchemaPopulateParameters(
             schema=TypeaheadQuerySchema(),
             dto_class=TypeaheadDTO,
+            # The schema is generated from the DTO, so has already validated its fields
+            validate_dto=False,
         ),
         "db_client_method": db_client_method,
     }
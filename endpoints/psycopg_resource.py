@@ -6,9 +6,7 @@ from typing import Callable, Any, Union, Tuple, Dict
 from flask import Response
 from flask_restx import Resource
 
-from config import config
 from db.client.context_manager import setup_database_client
-from db.helpers_.psycopg import initialize_psycopg_connection
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.core import (
     populate_schema_with_request_content,
 )
@@ -29,9 +27,9 @@ def handle_exceptions(
 
     The decorated function handles any exceptions raised
     by the original function. If an exception occurs, the
-    decorator performs a rollback on the psycopg connection,
-    prints the error message, and returns a dictionary with
-    the error message and an HTTP status code of 500.
+    decorator prints the error message and re-raises the exception.
+    Database transactions are rolled back by the database client
+    before its pooled connection is returned.
 
     Example usage:
     ```
@@ -48,8 +46,6 @@ def handle_exceptions(
         try:
             return func(self, *args, **kwargs)
         except Exception as e:
-            self.get_connection().rollback()
-
             message = _get_message_from_exception(e)
             print(message)
 
@@ -73,25 +69,6 @@ class PsycopgResource(Resource):
         """
         super().__init__(*args, **kwargs)
 
-    def connection_is_closed(self) -> bool:
-        """
-        Per https://www.psycopg.org/docs/connection.html#connection.closed
-        a connection is open is the integer attribute is 0,
-        closed or broken of the integer attribute is nonzero
-
-        A connection is only determined to be closed after
-        an operation has been tried and failed.
-        Thus, in the case of a closed connection, the operation will fail
-        on the first run, then succeed on the second run.
-        :return:
-        """
-        return config.connection.closed != 0
-
-    def get_connection(self):
-        if self.connection_is_closed():
-            config.connection = initialize_psycopg_connection()
-        return config.connection
-
     def run_endpoint(
         self,
         wrapper_function: Callable[..., Any],
@@ -106,6 +83,7 @@ class PsycopgResource(Resource):
         dto = populate_schema_with_request_content(
             schema=schema_populate_parameters.schema,
             dto_class=schema_populate_parameters.dto_class,
+            validate_dto=schema_populate_parameters.validate_dto,
         )
         with setup_database_client() as db_client:
             response = wrapper_function(db_client, dto=dto, **wrapper_kwargs)
@@ -66,6 +66,7 @@ from endpoints.schema_config.instantiations.auth.github.oauth import (
 )
 from endpoints.schema_config.instantiations.auth.login import LoginEndpointSchemaConfig
 from endpoints.schema_config.instantiations.checker import (
+    UniqueURLBatchCheckerEndpointSchemaConfig,
     UniqueURLCheckerEndpointSchemaConfig,
 )
 from endpoints.schema_config.instantiations.contact import (
@@ -122,7 +123,10 @@ from endpoints.schema_config.instantiations.locations.data_requests import (
 from endpoints.schema_config.instantiations.locations.get_many import (
     LocationsGetManyEndpointSchemaConfig,
 )
-from endpoints.schema_config.instantiations.match import MatchAgencyEndpointSchemaConfig
+from endpoints.schema_config.instantiations.match import (
+    MatchAgenciesBatchEndpointSchemaConfig,
+    MatchAgencyEndpointSchemaConfig,
+)
 from endpoints.schema_config.instantiations.metrics.followed_searches.aggregate import (
     MetricsFollowedSearchesAggregateGetEndpointSchemaConfig,
 )
@@ -246,6 +250,7 @@ class SchemaConfigs(Enum):
     # endregion
     # region Checker
     CHECKER_GET = UniqueURLCheckerEndpointSchemaConfig
+    CHECKER_BATCH_POST = UniqueURLBatchCheckerEndpointSchemaConfig
     # endregion
     # region Notifications
     NOTIFICATIONS_POST = NotificationsPostEndpointSchemaConfig
@@ -280,6 +285,7 @@ class SchemaConfigs(Enum):
 
     # region Match
     MATCH_AGENCY = MatchAgencyEndpointSchemaConfig
+    MATCH_AGENCIES_BATCH = MatchAgenciesBatchEndpointSchemaConfig
     # endregion
 
     # region Location
@@ -1,5 +1,8 @@
 from endpoints.schema_config.config.core import EndpointSchemaConfig
 from middleware.primary_resource_logic.unique_url_checker import (
+    UniqueURLBatchCheckerRequestDTO,
+    UniqueURLBatchCheckerRequestSchema,
+    UniqueURLBatchCheckerResponseOuterSchema,
     UniqueURLCheckerRequestSchema,
     UniqueURLCheckerResponseOuterSchema,
     UniqueURLCheckerRequestDTO,
@@ -10,3 +13,9 @@ UniqueURLCheckerEndpointSchemaConfig = EndpointSchemaConfig(
     primary_output_schema=UniqueURLCheckerResponseOuterSchema(),
     input_dto_class=UniqueURLCheckerRequestDTO,
 )
+
+UniqueURLBatchCheckerEndpointSchemaConfig = EndpointSchemaConfig(
+    input_schema=UniqueURLBatchCheckerRequestSchema(),
+    primary_output_schema=UniqueURLBatchCheckerResponseOuterSchema(),
+    input_dto_class=UniqueURLBatchCheckerRequestDTO,
+)
@@ -1,10 +1,25 @@
 from endpoints.schema_config.config.core import EndpointSchemaConfig
-from middleware.schema_and_dto.dtos.match.request import AgencyMatchRequestDTO
-from middleware.schema_and_dto.schemas.match.request import AgencyMatchSchema
-from middleware.schema_and_dto.schemas.match.response import MatchAgencyResponseSchema
+from middleware.schema_and_dto.dtos.match.request import (
+    AgencyMatchBatchRequestDTO,
+    AgencyMatchRequestDTO,
+)
+from middleware.schema_and_dto.schemas.match.request import (
+    AgencyMatchBatchSchema,
+    AgencyMatchSchema,
+)
+from middleware.schema_and_dto.schemas.match.response import (
+    MatchAgenciesBatchResponseSchema,
+    MatchAgencyResponseSchema,
+)
 
 MatchAgencyEndpointSchemaConfig = EndpointSchemaConfig(
     input_schema=AgencyMatchSchema(),
     input_dto_class=AgencyMatchRequestDTO,
     primary_output_schema=MatchAgencyResponseSchema(),
 )
+
+MatchAgenciesBatchEndpointSchemaConfig = EndpointSchemaConfig(
+    input_schema=AgencyMatchBatchSchema(),
+    input_dto_class=AgencyMatchBatchRequestDTO,
+    primary_output_schema=MatchAgenciesBatchResponseSchema(),
+)
@@ -5,6 +5,7 @@ from endpoints.v3.permissions.user._shared.get_permission import (
 from endpoints.v3.permissions.user.add.query import AddUserPermissionQueryBuilder
 from middleware.enums import PermissionsEnum
 from middleware.schema_and_dto.dtos.common_dtos import MessageDTO
+from middleware.security.api_key.cache import api_key_auth_cache
 
 
 def add_user_permission_wrapper(
@@ -19,4 +20,5 @@ def add_user_permission_wrapper(
             permission_id=permission_id,
         )
     )
+    api_key_auth_cache.invalidate_user(user_id)
     return MessageDTO(message="Permission successfully added.")
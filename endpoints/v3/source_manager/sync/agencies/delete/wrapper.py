@@ -5,6 +5,9 @@ from endpoints.v3.source_manager.sync.agencies.delete.query import (
 from endpoints.v3.source_manager.sync.shared.models.request.delete import (
     SourceManagerDeleteRequest,
 )
+from middleware.primary_resource_logic.search.cache import (
+    invalidate_search_results_cache,
+)
 from middleware.schema_and_dto.dtos.common_dtos import MessageDTO
 
 
@@ -13,4 +16,5 @@ def source_manager_delete_agencies(
 ) -> MessageDTO:
     db_client = DatabaseClient()
     db_client.run_query_builder(SourceManagerDeleteAgenciesQueryBuilder(request))
+    invalidate_search_results_cache()
     return MessageDTO(message="Sync completed successfully")
@@ -1,3 +1,4 @@
+from db.helpers_.url_index import invalidate_normalized_url_index
 from endpoints.v3.source_manager.sync.data_sources.add.query import (
     SourceManagerAddDataSourcesQueryBuilder,
 )
@@ -13,4 +14,6 @@ from endpoints.v3.source_manager.sync.shared.models.response.add import (
 def source_manager_add_data_sources(
     request: AddDataSourcesOuterRequest,
 ) -> SourceManagerSyncAddOuterResponse:
-    return run_sync_query_builder(SourceManagerAddDataSourcesQueryBuilder(request))
+    response = run_sync_query_builder(SourceManagerAddDataSourcesQueryBuilder(request))
+    invalidate_normalized_url_index()
+    return response
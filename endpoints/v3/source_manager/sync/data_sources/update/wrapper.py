@@ -1,3 +1,4 @@
+from db.helpers_.url_index import invalidate_normalized_url_index
 from endpoints.v3.source_manager.sync.data_sources.update.query import (
     SourceManagerUpdateDataSourcesQueryBuilder,
 )
@@ -11,6 +12,8 @@ from middleware.schema_and_dto.dtos.common_dtos import MessageDTO
 def source_manager_update_data_sources(
     request: UpdateDataSourcesOuterRequest,
 ) -> MessageDTO:
-    return run_sync_query_builder(
+    response = run_sync_query_builder(
         query_builder=SourceManagerUpdateDataSourcesQueryBuilder(request)
     )
+    invalidate_normalized_url_index()
+    return response
@@ -0,0 +1,90 @@
+"""
+Compares the JSON serialization used for responses against Flask's default provider,
+on payloads shaped like the largest responses (data source pages, search results and map data).
+
+Run with `pytest manual_tests/test_json_serialization_benchmark.py -s` to print the timings.
+"""
+
+import random
+import timeit
+from datetime import date, datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from middleware.enums import JurisdictionType, RecordTypesEnum
+from middleware.util.json_serialization import FastJSONProvider
+
+ROWS = 5_000
+REPEATS = 5
+
+
+class LegacyJSONProvider(DefaultJSONProvider):
+    # The provider previously used by the app
+    def default(self, o):
+        if isinstance(o, date) or isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def get_data_source_rows() -> list[dict]:
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            "id": i,
+            "name": f"Data Source {i}",
+            "description": "A description of the data source. " * 5,
+            "source_url": f"https://example.com/source/{i}",
+            "record_type": random.choice(list(RecordTypesEnum)).value,
+            "record_formats": ["CSV", "PDF"],
+            "coverage_start": (start + timedelta(days=i)).date(),
+            "coverage_end": None,
+            "agency_supplied": bool(i % 2),
+            "agency_name": f"Agency {i % 100}",
+            "municipality": "Pittsburgh",
+            "state_iso": "PA",
+            "jurisdiction_type": JurisdictionType.LOCAL.value,
+            "created_at": start + timedelta(hours=i),
+            "updated_at": start + timedelta(hours=i, minutes=5),
+        }
+        for i in range(ROWS)
+    ]
+
+
+def get_map_rows() -> list[dict]:
+    return [
+        {
+            "location_id": i,
+            "name": f"Locality {i}",
+            "county_name": f"County {i % 50}",
+            "coordinates": {"lat": 40.0 + i / 1000, "lng": -80.0 - i / 1000},
+            "county_fips": f"{i % 1000:05d}",
+            "state_iso": "PA",
+            "source_count": i % 17,
+        }
+        for i in range(ROWS)
+    ]
+
+
+def benchmark(provider: DefaultJSONProvider, payload: dict) -> float:
+    return min(timeit.repeat(lambda: provider.dumps(payload), number=1, repeat=REPEATS))
+
+
+def test_json_serialization_benchmark():
+    app = Flask(__name__)
+    legacy = LegacyJSONProvider(app)
+    fast = FastJSONProvider(app)
+
+    payloads = {
+        "data sources": {"metadata": {"count": ROWS}, "data": get_data_source_rows()},
+        "map data": {"locations": {"localities": get_map_rows()}, "sources": []},
+    }
+    for name, payload in payloads.items():
+        legacy_seconds = benchmark(legacy, payload)
+        fast_seconds = benchmark(fast, payload)
+        print(
+            f"{name}: legacy {legacy_seconds * 1000:.1f} ms, "
+            f"fast {fast_seconds * 1000:.1f} ms "
+            f"({legacy_seconds / fast_seconds:.1f}x)"
+        )
+        assert fast_seconds < legacy_seconds
@@ -1,8 +1,8 @@
-from middleware.column_permission.mapping import ROLE_COLUMN_PERMISSIONS
+from middleware.column_permission.matrix import COLUMN_PERMISSION_MATRIX
 
 
 def create_column_permissions_string_table(relation: str) -> str:
-    permissions = ROLE_COLUMN_PERMISSIONS[relation]
+    permissions = COLUMN_PERMISSION_MATRIX.get_permission_levels(relation)
     # Get all unique roles
     roles = sorted({role for perms in permissions.values() for role in perms})
 
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+from db.enums import ColumnPermissionEnum, RelationRoleEnum
+from middleware.column_permission.mapping import ROLE_COLUMN_PERMISSIONS
+
+# The column permission levels which grant each user permission
+GRANTING_PERMISSION_LEVELS = {
+    ColumnPermissionEnum.READ: frozenset({"READ", "WRITE"}),
+    ColumnPermissionEnum.WRITE: frozenset({"WRITE"}),
+    ColumnPermissionEnum.NONE: frozenset(),
+}
+
+
+@dataclass(frozen=True)
+class PermittedColumns:
+    """
+    The columns of a relation a role has a given permission for.
+
+    :param columns: The permitted columns, in the order they are defined in the mapping.
+    :param column_set: The permitted columns, for membership checks.
+    """
+
+    columns: tuple[str, ...]
+    column_set: frozenset[str]
+
+    def get_invalid_columns(self, requested_columns: list[str]) -> list[str]:
+        """
+        Returns the requested columns which are not permitted, in the order requested
+        """
+        if self.column_set.issuperset(requested_columns):
+            return []
+        return [column for column in requested_columns if column not in self.column_set]
+
+
+class ColumnPermissionMatrix:
+    """
+    Column permissions for each relation, role and permission, compiled once from a
+    `ROLE_COLUMN_PERMISSIONS`-style mapping so that lookups do not walk the mapping.
+    """
+
+    def __init__(self, role_column_permissions: dict[str, dict[str, dict[str, str]]]):
+        self._permission_levels: dict[str, dict[str, dict[str, str]]] = {
+            relation: {column: dict(roles) for column, roles in columns.items()}
+            for relation, columns in role_column_permissions.items()
+        }
+        self._permitted_columns: dict[
+            tuple[str, RelationRoleEnum, ColumnPermissionEnum], PermittedColumns
+        ] = {}
+        for relation, columns in self._permission_levels.items():
+            for role in RelationRoleEnum:
+                for permission, granting_levels in GRANTING_PERMISSION_LEVELS.items():
+                    permitted = tuple(
+                        column
+                        for column, roles in columns.items()
+                        if roles.get(role.value, "NONE") in granting_levels
+                    )
+                    self._permitted_columns[(relation, role, permission)] = (
+                        PermittedColumns(
+                            columns=permitted, column_set=frozenset(permitted)
+                        )
+                    )
+
+    def get(
+        self,
+        relation: str,
+        role: RelationRoleEnum,
+        user_permission: ColumnPermissionEnum,
+    ) -> PermittedColumns:
+        return self._permitted_columns[(relation, role, user_permission)]
+
+    def get_permission_levels(self, relation: str) -> dict[str, dict[str, str]]:
+        """
+        Returns each column of the relation, mapped to its permission level for each role
+        """
+        return self._permission_levels[relation]
+
+
+COLUMN_PERMISSION_MATRIX = ColumnPermissionMatrix(ROLE_COLUMN_PERMISSIONS)
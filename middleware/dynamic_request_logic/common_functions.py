@@ -27,12 +27,20 @@ def check_for_id(
         where_mappings=id_info.where_mappings,
         columns=[id_info.id_column_name],
     )
-    if len(result) == 0:
-        raise NotFound(f"Entry for {id_info.where_mappings} not found.")
+    raise_if_not_found(results=result, id_info=id_info)
 
     return result[0][id_info.id_column_name]
 
 
+def raise_if_not_found(results: list, id_info: IDInfo) -> None:
+    """
+    Abort if a query for the given ID returned no results.
+    Lets lookups by ID check for existence with the same query that fetches the entry.
+    """
+    if len(results) == 0:
+        raise NotFound(f"Entry for {id_info.where_mappings} not found.")
+
+
 def optionally_get_permitted_columns_to_subquery_parameters_(
     mp: MiddlewareParameters, relation_role: RelationRoleEnum
 ):
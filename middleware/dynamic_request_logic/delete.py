@@ -1,6 +1,6 @@
 from typing import Optional
 
-from werkzeug.exceptions import Forbidden
+from werkzeug.exceptions import Forbidden, NotFound
 
 from middleware.common_response_formatting import message_response
 from middleware.custom_dataclasses import DeferredFunction
@@ -24,11 +24,24 @@ def delete_entry(
 ):
     mp = middleware_parameters
 
-    entry_id = check_for_id(
-        table_name=mp.relation,
-        id_info=id_info,
-        db_client=mp.db_client,
-    )
+    if not _is_identified_by_id_only(id_info):
+        # The entry's ID must first be looked up from its other columns
+        entry_id = check_for_id(
+            table_name=mp.relation,
+            id_info=id_info,
+            db_client=mp.db_client,
+        )
+    else:
+        entry_id = id_info.where_mappings[id_info.id_column_name]
+        # Existence is instead checked by the number of rows deleted;
+        # it is only looked up here if needed to distinguish a missing entry from a forbidden one
+        if permission_checking_function is not None:
+            permission_checking_function = DeferredFunction(
+                _check_for_id_if_not_permitted,
+                check_function=permission_checking_function,
+                mp=mp,
+                id_info=id_info,
+            )
 
     call_if_not_none(
         obj=permission_checking_function,
@@ -37,7 +50,24 @@ def delete_entry(
         entry_name=mp.entry_name,
     )
 
-    mp.db_client_method(
+    deleted_count = mp.db_client_method(
         mp.db_client, id_column_name=id_info.id_column_name, id_column_value=entry_id
     )
+    if deleted_count == 0:
+        raise NotFound(f"Entry for {id_info.where_mappings} not found.")
     return message_response(f"{mp.entry_name} deleted.")
+
+
+def _is_identified_by_id_only(id_info: IDInfo) -> bool:
+    return list(id_info.where_mappings.keys()) == [id_info.id_column_name]
+
+
+def _check_for_id_if_not_permitted(
+    check_function: DeferredFunction,
+    mp: MiddlewareParameters,
+    id_info: IDInfo,
+) -> bool:
+    if check_function.execute():
+        return True
+    check_for_id(table_name=mp.relation, id_info=id_info, db_client=mp.db_client)
+    return False
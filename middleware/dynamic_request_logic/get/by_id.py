@@ -17,8 +17,8 @@ from middleware.common_response_formatting import (
     message_response,
 )
 from middleware.dynamic_request_logic.common_functions import (
-    check_for_id,
     optionally_get_permitted_columns_to_subquery_parameters_,
+    raise_if_not_found,
 )
 from middleware.dynamic_request_logic.supporting_classes import (
     MiddlewareParameters,
@@ -58,14 +58,6 @@ def get_by_id(
         pass
 
     mp = middleware_parameters
-    check_for_id(
-        db_client=mp.db_client,
-        table_name=mp.relation,
-        id_info=IDInfo(
-            id_column_value=id,
-            id_column_name=id_column_name,
-        ),
-    )
     relation_role = relation_role_parameters.get_relation_role_from_parameters(
         access_info=mp.access_info,
     )
@@ -84,4 +76,12 @@ def get_by_id(
         where_mappings=[WhereMapping(column=id_column_name, value=id)],
         subquery_parameters=mp.subquery_parameters,
     )
+    # Existence is checked against the fetched entry, rather than in a separate query
+    raise_if_not_found(
+        results=results,
+        id_info=IDInfo(
+            id_column_value=id,
+            id_column_name=id_column_name,
+        ),
+    )
     return results_dependent_response(mp.entry_name, results)
@@ -7,7 +7,7 @@ from db.db_client_dataclasses import WhereMapping
 from db.enums import RelationRoleEnum, ColumnPermissionEnum
 from db.subquery_logic import SubqueryParameterManager
 from middleware.column_permission.core import get_permitted_columns
-from middleware.dynamic_request_logic.common_functions import check_for_id
+from middleware.dynamic_request_logic.common_functions import raise_if_not_found
 from middleware.dynamic_request_logic.supporting_classes import IDInfo
 from middleware.enums import Relations
 from middleware.schema_and_dto.dtos.common.base import GetByIDBaseDTO
@@ -34,13 +34,6 @@ def get_related_resource(
     # Technically, it'd make more sense as "grrp",
     # but "gerp" rolls off the tongue better
     gerp = get_related_resources_parameters
-    check_for_id(
-        table_name=gerp.primary_relation.value,
-        id_info=IDInfo(
-            id_column_value=int(gerp.dto.resource_id),
-        ),
-        db_client=gerp.db_client,
-    )
     if permitted_columns is None:
         permitted_columns = get_permitted_columns(
             relation=gerp.related_relation.value,
@@ -68,6 +61,10 @@ def get_related_resource(
         subquery_parameters=subquery_parameters,
         build_metadata=True,
     )
+    raise_if_not_found(
+        results=results["data"],
+        id_info=IDInfo(id_column_value=int(gerp.dto.resource_id)),
+    )
 
     _format_results(gerp, results)
 
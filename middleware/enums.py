@@ -106,6 +106,7 @@ class Relations(Enum):
     NOTIFICATION_LOG = "notification_log"
     LINK_LOCATIONS_DATA_SOURCES_VIEW = "link_locations_data_sources_view"
     DISTINCT_SOURCE_URLS = "distinct_source_urls"
+    METRICS_FOLLOWED_SEARCHES_BREAKDOWN = "metrics_followed_searches_breakdown"
 
 
 class OperationType(Enum):
@@ -1,7 +1,9 @@
 from flask import Response, make_response
+from werkzeug.exceptions import BadRequest
 
 from db.client.core import DatabaseClient
 from db.db_client_dataclasses import OrderByParameters
+from db.helpers_.keyset_pagination import InvalidCursorError
 from db.subquery_logic import SubqueryParameterManager
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.common_response_formatting import (
@@ -25,20 +27,24 @@ def get_agencies(
     :return: A response object with the relevant agency information and status code.
     """
 
-    results = db_client.get_agencies(
-        order_by=OrderByParameters.construct_from_args(
-            sort_by=dto.sort_by, sort_order=dto.sort_order
-        ),
-        page=dto.page,
-        limit=dto.limit,
-        requested_columns=dto.requested_columns,
-    )
+    try:
+        page = db_client.get_agencies(
+            order_by=OrderByParameters.construct_from_args(
+                sort_by=dto.sort_by, sort_order=dto.sort_order
+            ),
+            page=dto.page,
+            limit=dto.limit,
+            requested_columns=dto.requested_columns,
+            cursor=dto.cursor,
+        )
+    except InvalidCursorError as e:
+        raise BadRequest(str(e))
 
     return make_response(
         {
-            "metadata": {"count": len(results)},
+            "metadata": {"count": len(page.results), "next_cursor": page.next_cursor},
             "message": "Successfully retrieved agencies",
-            "data": results,
+            "data": page.results,
         }
     )
 
@@ -43,8 +43,8 @@ def create_api_key_for_user(
 
 def api_key_is_associated_with_user(db_client: DatabaseClient, raw_key: str) -> bool:
     api_key = ApiKey(raw_key)
-    user_identifiers = db_client.get_user_by_api_key(api_key.key_hash)
-    return user_identifiers is not None
+    identity = db_client.get_user_identity_by_api_key(api_key.key_hash)
+    return identity is not None
 
 
 def check_api_key_associated_with_user(db_client: DatabaseClient, raw_key: str) -> None:
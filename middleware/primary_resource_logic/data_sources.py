@@ -2,10 +2,12 @@ from typing import Optional
 
 from flask import make_response, Response
 from pydantic import BaseModel
+from werkzeug.exceptions import BadRequest
 
 from db.client.core import DatabaseClient
 from db.db_client_dataclasses import OrderByParameters
 from db.enums import ApprovalStatus, RelationRoleEnum, ColumnPermissionEnum
+from db.helpers_.keyset_pagination import InvalidCursorError
 from middleware.column_permission.core import get_permitted_columns
 from middleware.dynamic_request_logic.get.many import (
     optionally_limit_to_requested_columns,
@@ -22,6 +24,7 @@ RELATION = Relations.DATA_SOURCES.value
 class DataSourcesGetManyRequestDTO(GetManyBaseDTO):
     approval_status: ApprovalStatus = ApprovalStatus.APPROVED
     page_number: int = 1
+    cursor: Optional[str] = None
 
 
 class DataSourcesColumnRequestObject(BaseModel):
@@ -71,20 +74,24 @@ def get_data_sources_wrapper(
         access_info=access_info, requested_columns=dto.requested_columns
     )
 
-    results = db_client.get_data_sources(
-        data_sources_columns=cro.data_sources_columns,
-        data_requests_columns=cro.data_requests_columns,
-        order_by=OrderByParameters.construct_from_args(
-            sort_by=dto.sort_by, sort_order=dto.sort_order
-        ),
-        page=dto.page,
-        limit=dto.limit,
-    )
+    try:
+        page = db_client.get_data_sources(
+            data_sources_columns=cro.data_sources_columns,
+            data_requests_columns=cro.data_requests_columns,
+            order_by=OrderByParameters.construct_from_args(
+                sort_by=dto.sort_by, sort_order=dto.sort_order
+            ),
+            page=dto.page,
+            limit=dto.limit,
+            cursor=dto.cursor,
+        )
+    except InvalidCursorError as e:
+        raise BadRequest(str(e))
 
     return make_response(
         {
-            "metadata": {"count": len(results)},
+            "metadata": {"count": len(page.results), "next_cursor": page.next_cursor},
             "message": "Successfully retrieved data sources",
-            "data": results,
+            "data": page.results,
         }
     )
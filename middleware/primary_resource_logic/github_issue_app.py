@@ -6,21 +6,25 @@ from typing import Optional
 
 from flask import Response
 
+from db.dtos.data_request_github_update import DataRequestGithubUpdate
 from db.dtos.data_request_info_for_github import DataRequestInfoForGithub
 from db.client.core import DatabaseClient
 from db.enums import RequestStatus
 from middleware.common_response_formatting import message_response
 from middleware.enums import RecordTypesEnum
-from middleware.schema_and_dto.dtos.data_requests.put import (
-    DataRequestsPutDTO,
-    DataRequestsPutOuterDTO,
-)
 from middleware.schema_and_dto.dtos.github.issue import GithubIssueURLInfosDTO
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.third_party_interaction_logic.github.helpers import (
     get_github_issue_project_statuses,
 )
-from middleware.third_party_interaction_logic.github.issue_info import GithubIssueInfo
+from middleware.third_party_interaction_logic.github.constants import (
+    GH_MUTATION_BATCH_SIZE,
+)
+from middleware.third_party_interaction_logic.github.issue_info import (
+    ExistingGithubIssueInfo,
+    GithubIssueInfo,
+    NewGithubIssueInfo,
+)
 from middleware.third_party_interaction_logic.github.issue_manager import (
     GithubIssueManager,
 )
@@ -51,6 +55,26 @@ def get_github_issue_body(
     return full_text
 
 
+def get_unrecorded_github_issues(
+    db_client: DatabaseClient, gim: GithubIssueManager
+) -> dict[tuple[str, str], ExistingGithubIssueInfo]:
+    """
+    Gets the recently created GitHub issues not linked to any data request,
+    such as those created by a sync whose response from GitHub was lost.
+
+    :return: The issues, by their title and body
+    """
+    recent_issue_infos = gim.get_recent_issues()
+    recorded_issue_numbers = db_client.get_recorded_github_issue_numbers(
+        issue_numbers=[info.number for info in recent_issue_infos]
+    )
+    return {
+        (info.title, info.body): info
+        for info in recent_issue_infos
+        if info.number not in recorded_issue_numbers
+    }
+
+
 def add_ready_data_requests_as_github_issues(
     db_client: DatabaseClient,
 ) -> list[GithubIssueInfo]:
@@ -66,32 +90,58 @@ def add_ready_data_requests_as_github_issues(
         return []
 
     gim = GithubIssueManager()
-    # Add each data request as a GitHub issue
+    unrecorded_issue_infos = get_unrecorded_github_issues(db_client, gim)
+    # Add data requests as GitHub issues in batches,
+    # recording each batch's issues before creating the next
     github_issue_infos = []
-    for data_request in data_requests:
-        github_issue_info = gim.create_issue_with_status(
-            title=get_github_issue_title(
-                submission_notes=data_request.title,
-            ),
-            body=get_github_issue_body(
-                submission_notes=data_request.submission_notes,
-                data_requirements=data_request.data_requirements,
-                locations=data_request.locations,
-            ),
-            status=RequestStatus.READY_TO_START,
-            record_types=data_request.record_types or [],
-        )
-
-        # Update the data request with the github issue url
-        db_client.create_data_request_github_info(
-            column_value_mappings={
-                "data_request_id": data_request.id,
-                "github_issue_url": github_issue_info.url,
-                "github_issue_number": github_issue_info.number,
-            },
+    for start in range(0, len(data_requests), GH_MUTATION_BATCH_SIZE):
+        batch = data_requests[start : start + GH_MUTATION_BATCH_SIZE]
+        batch_issue_infos = []
+        data_requests_to_create = []
+        new_issues = []
+        for data_request in batch:
+            new_issue = NewGithubIssueInfo(
+                title=get_github_issue_title(
+                    submission_notes=data_request.title,
+                ),
+                body=get_github_issue_body(
+                    submission_notes=data_request.submission_notes,
+                    data_requirements=data_request.data_requirements,
+                    locations=data_request.locations,
+                ),
+                record_types=data_request.record_types or [],
+            )
+            # Reuse an issue created for this data request by an earlier, failed sync
+            github_issue_info = unrecorded_issue_infos.pop(
+                (new_issue.title, new_issue.body), None
+            )
+            if github_issue_info is not None:
+                github_issue_info.data_request_id = data_request.id
+                batch_issue_infos.append(github_issue_info)
+                continue
+            data_requests_to_create.append(data_request)
+            new_issues.append(new_issue)
+
+        created_issue_infos, errors = gim.create_issues(new_issues=new_issues)
+        for data_request, github_issue_info in zip(
+            data_requests_to_create, created_issue_infos
+        ):
+            if github_issue_info is None:
+                continue
+            github_issue_info.data_request_id = data_request.id
+            batch_issue_infos.append(github_issue_info)
+
+        # Update the data requests with their github issue urls,
+        # even if some of the batch failed, so that the next sync does not recreate them
+        db_client.create_data_requests_github_issue_info(issue_infos=batch_issue_infos)
+        github_issue_infos.extend(batch_issue_infos)
+
+        # Reused issues are also added, in case the earlier sync failed before adding them
+        errors += gim.assign_issues_to_project_with_status(
+            issues=batch_issue_infos, status=RequestStatus.READY_TO_START
         )
-        github_issue_info.data_request_id = data_request.id
-        github_issue_infos.append(github_issue_info)
+        if errors:
+            raise ValueError(f"Failed to add data requests as GitHub issues: {errors}")
 
     return github_issue_infos
 
@@ -136,7 +186,7 @@ def synchronize_github_issues_with_data_requests(
     )
 
     # Update in the database data requests whose GitHub issue status has changed
-    requests_updated = 0
+    updates: list[DataRequestGithubUpdate] = []
     for dri in data_requests_with_issues:
         gipi_info = gipi.get_info(issue_number=dri.github_issue_number)
         request_status = gipi.get_project_status(issue_number=dri.github_issue_number)
@@ -146,18 +196,16 @@ def synchronize_github_issues_with_data_requests(
         ):
             continue
 
-        db_client.update_data_request_v2(
-            data_request_id=int(dri.data_request_id),
-            dto=DataRequestsPutOuterDTO(
-                entry_data=DataRequestsPutDTO(
-                    request_status=request_status,
-                    record_types_required=gipi_info.record_types,
-                )
-            ),
-            bypass_permissions=True,
+        updates.append(
+            DataRequestGithubUpdate(
+                data_request_id=int(dri.data_request_id),
+                request_status=request_status,
+                record_types_required=gipi_info.record_types,
+            )
         )
 
-        requests_updated += 1
+    db_client.update_data_requests_from_github(updates=updates)
+    requests_updated = len(updates)
 
     # Add data requests to GitHub
     requests_added: list[GithubIssueInfo] = add_ready_data_requests_as_github_issues(
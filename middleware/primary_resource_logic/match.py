@@ -2,14 +2,19 @@ from enum import Enum
 from typing import Optional
 
 from flask import Response, make_response
+from werkzeug.exceptions import BadRequest
 
 from db.client.core import DatabaseClient
 from db.db_client_dataclasses import WhereMapping
+from db.dtos.agency_match_input import AgencyMatchInput
 from middleware.schema_and_dto.dtos.match.response import (
     AgencyMatchResponseOuterDTO,
     AgencyMatchResponseInnerDTO,
 )
-from middleware.schema_and_dto.dtos.match.request import AgencyMatchRequestDTO
+from middleware.schema_and_dto.dtos.match.request import (
+    AgencyMatchBatchRequestDTO,
+    AgencyMatchRequestDTO,
+)
 
 
 class AgencyMatchStatus(Enum):
@@ -19,6 +24,7 @@ class AgencyMatchStatus(Enum):
 
 
 SIMILARITY_THRESHOLD = 80
+MAX_BATCH_MATCH_ENTRIES = 1000
 
 
 def get_agency_match_message(status: AgencyMatchStatus):
@@ -72,6 +78,63 @@ def try_matching_agency(
     entries: list[AgencyMatchResponseInnerDTO] = db_client.get_similar_agencies(
         name=dto.name, location_id=location_id
     )
+    return _match_response(entries)
+
+
+def match_agencies_batch_wrapper(
+    db_client: DatabaseClient, dto: AgencyMatchBatchRequestDTO
+) -> Response:
+    if len(dto.entries) > MAX_BATCH_MATCH_ENTRIES:
+        raise BadRequest(
+            f"At most {MAX_BATCH_MATCH_ENTRIES} entries can be matched per request."
+        )
+    if not 0 <= dto.similarity_threshold <= 1:
+        raise BadRequest("similarity_threshold must be between 0 and 1.")
+    results = try_matching_agencies(db_client=db_client, dto=dto)
+    return make_response(
+        {
+            "message": "Matched agencies for all entries.",
+            "results": [result.to_json() for result in results],
+        }
+    )
+
+
+def try_matching_agencies(
+    db_client: DatabaseClient, dto: AgencyMatchBatchRequestDTO
+) -> list[AgencyMatchResponse]:
+    """
+    Matches each entry as `try_matching_agency` would,
+    resolving all locations in one query and all matches in another.
+    Matches are limited to agencies at least as similar as the request's threshold.
+    """
+    located_entries = [entry for entry in dto.entries if entry.has_location_data()]
+    location_ids = iter(
+        db_client.get_location_ids_by_names(
+            [(entry.state, entry.county, entry.locality) for entry in located_entries]
+        )
+    )
+
+    results: list[Optional[AgencyMatchResponse]] = []
+    inputs: list[AgencyMatchInput] = []
+    input_indices: list[int] = []
+    for entry in dto.entries:
+        location_id = next(location_ids) if entry.has_location_data() else None
+        if location_id is None and entry.has_location_data():
+            results.append(_no_match_response())
+            continue
+        input_indices.append(len(results))
+        inputs.append(AgencyMatchInput(name=entry.name, location_id=location_id))
+        results.append(None)
+
+    matches = db_client.get_similar_agencies_batch(
+        inputs=inputs, similarity_threshold=dto.similarity_threshold
+    )
+    for index, entries in zip(input_indices, matches):
+        results[index] = _match_response(entries)
+    return results
+
+
+def _match_response(entries: list[AgencyMatchResponseInnerDTO]) -> AgencyMatchResponse:
     if len(entries) == 0:
         return _no_match_response()
 
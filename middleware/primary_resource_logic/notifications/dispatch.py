@@ -0,0 +1,136 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable
+
+import requests
+
+from db.client.core import DatabaseClient
+from db.dtos.event_batch import EventBatch
+from db.dtos.pending_event_batch import PendingEventBatch
+
+# Errors rendering (`ValueError`) or sending (`requests.RequestException`) one user's email,
+# which are recorded as failures for that user rather than stopping the dispatch
+SEND_ERRORS = (requests.RequestException, ValueError)
+
+
+@dataclass
+class NotificationDispatchResult:
+    """
+    :param sent: The number of users successfully notified.
+    :param failed: Error messages for users whose notifications could not be sent, by user ID.
+    :param elapsed_seconds: The wall-clock duration of the dispatch.
+    """
+
+    sent: int = 0
+    failed: dict[int, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def users_per_second(self) -> float:
+        if self.elapsed_seconds == 0:
+            return 0.0
+        return (self.sent + len(self.failed)) / self.elapsed_seconds
+
+
+class NotificationDispatcher:
+    """
+    Sends pending notifications to all users with unsent events.
+
+    Users are loaded a page at a time, and each user's email is rendered and sent
+    on a thread pool, so the dispatch is bound by the mail provider's throughput
+    rather than by one request round trip per user.
+    Successfully sent events are marked as sent in batches; events for users whose
+    emails fail remain unsent, and are picked up by the next dispatch.
+    """
+
+    def __init__(
+        self,
+        db_client: DatabaseClient,
+        send: Callable[[EventBatch], None],
+        max_workers: int = 8,
+        page_size: int = 500,
+        mark_sent_batch_size: int = 100,
+    ):
+        """
+        :param send: Renders and sends the email for an event batch. Called from worker threads.
+        """
+        self.db_client = db_client
+        self.send = send
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.mark_sent_batch_size = mark_sent_batch_size
+
+    def dispatch(self) -> NotificationDispatchResult:
+        result = NotificationDispatchResult()
+        start = time.perf_counter()
+        after_user_id = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                page = self.db_client.get_pending_event_batches(
+                    limit=self.page_size, after_user_id=after_user_id
+                )
+                if len(page) == 0:
+                    break
+                self._dispatch_page(executor, page=page, result=result)
+                after_user_id = page[-1].event_batch.user_id
+
+        result.elapsed_seconds = time.perf_counter() - start
+        print(
+            f"Sent notifications to {result.sent} users "
+            f"({len(result.failed)} failed) in {result.elapsed_seconds:.2f}s "
+            f"({result.users_per_second:.1f} users/s)"
+        )
+        return result
+
+    def _dispatch_page(
+        self,
+        executor: ThreadPoolExecutor,
+        page: list[PendingEventBatch],
+        result: NotificationDispatchResult,
+    ) -> None:
+        futures = {
+            executor.submit(self.send, pending.event_batch): pending for pending in page
+        }
+        sent: list[PendingEventBatch] = []
+        try:
+            for future in as_completed(futures):
+                pending = futures.pop(future)
+                try:
+                    future.result()
+                except SEND_ERRORS as e:
+                    result.failed[pending.event_batch.user_id] = str(e)
+                    continue
+                sent.append(pending)
+                if len(sent) >= self.mark_sent_batch_size:
+                    self._mark_sent(sent)
+                    result.sent += len(sent)
+                    sent = []
+        except BaseException:
+            # Queued sends are cancelled, and those already running are waited for,
+            # so that every email sent before an unexpected error is marked below
+            for future in futures:
+                future.cancel()
+            for future, pending in futures.items():
+                if not future.cancelled() and future.exception() is None:
+                    sent.append(pending)
+            raise
+        finally:
+            # Also marked when an unexpected error is raised, so these emails are not sent again
+            if len(sent) > 0:
+                self._mark_sent(sent)
+                result.sent += len(sent)
+
+    def _mark_sent(self, sent: list[PendingEventBatch]) -> None:
+        self.db_client.mark_notifications_sent(
+            data_request_queue_ids=[
+                queue_id
+                for pending in sent
+                for queue_id in pending.data_request_queue_ids
+            ],
+            data_source_queue_ids=[
+                queue_id
+                for pending in sent
+                for queue_id in pending.data_source_queue_ids
+            ],
+        )
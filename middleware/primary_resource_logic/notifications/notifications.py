@@ -4,6 +4,9 @@ from flask import Response, make_response
 from werkzeug.exceptions import InternalServerError
 
 from db.client.core import DatabaseClient
+from middleware.primary_resource_logic.notifications.dispatch import (
+    NotificationDispatcher,
+)
 from middleware.primary_resource_logic.notifications.email.builder import (
     NotificationEmailBuilder,
 )
@@ -31,23 +34,25 @@ def send_notifications(
 ) -> Response:
     """Sends notifications to all users."""
     db_client.optionally_update_user_notification_queue()
-    next_event_batch = db_client.get_next_user_event_batch()
-    count = 0
-    while next_event_batch is not None:
-        try:
-            format_and_send_notifications(event_batch=next_event_batch)
-            db_client.mark_user_events_as_sent(next_event_batch.user_id)
-            count += 1
-            next_event_batch = db_client.get_next_user_event_batch()
-        except Exception as e:
-            raise InternalServerError(
-                f"Error sending notification for event batch for user {next_event_batch.user_id}: "
-                + f"{e}. Sent {count} batches prior to this error."
-            )
-
-    db_client.add_to_notification_log(user_count=count)
+    dispatcher = NotificationDispatcher(
+        db_client=db_client,
+        send=lambda event_batch: format_and_send_notifications(event_batch=event_batch),
+    )
+    result = dispatcher.dispatch()
+
+    db_client.add_to_notification_log(user_count=result.sent)
+    # Changes in the breakdown are counted since the last notification
+    db_client.refresh_metrics_followed_searches_breakdown()
+    if len(result.failed) > 0:
+        errors = "; ".join(
+            f"user {user_id}: {error}" for user_id, error in result.failed.items()
+        )
+        raise InternalServerError(
+            f"Error sending notifications for {len(result.failed)} users ({errors}). "
+            + f"Sent {result.sent} batches successfully."
+        )
     return make_response(
-        {"message": "Notifications sent successfully.", "count": count}
+        {"message": "Notifications sent successfully.", "count": result.sent}
     )
 
 
@@ -0,0 +1,59 @@
+from enum import Enum
+from typing import Any, Hashable, Sequence
+
+from db.helpers_.lru_cache import LRUCache
+from middleware.enums import RecordTypesEnum
+from utilities.enums import RecordCategoryEnum
+
+
+def _normalize_enums(values: Sequence[Enum] | None) -> tuple[str, ...] | None:
+    if values is None:
+        return None
+    return tuple(sorted({value.value for value in values}))
+
+
+def get_search_cache_key(
+    location_id: int | None,
+    record_categories: list[RecordCategoryEnum] | None = None,
+    record_types: list[RecordTypesEnum] | None = None,
+    *extra: Hashable,
+) -> tuple:
+    """
+    Builds a cache key for a location and record filter search.
+    Record categories and types are order- and duplicate-insensitive,
+    so equivalent requests share an entry.
+
+    :param extra: Additional values distinguishing otherwise identical searches,
+        such as the shape of the cached result.
+    """
+    return (
+        location_id,
+        _normalize_enums(record_categories),
+        _normalize_enums(record_types),
+        *extra,
+    )
+
+
+class SearchResultsCache(LRUCache[tuple, Any]):
+    """
+    A bounded, thread-safe TTL cache of search results, keyed by `get_search_cache_key`.
+
+    Entries are cleared whenever data sources, agencies or their links change in this process;
+    the TTL bounds staleness across worker processes, which do not share the cache.
+    Cached values are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300):
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds)
+
+
+search_results_cache = SearchResultsCache()
+
+
+def invalidate_search_results_cache() -> None:
+    """
+    Clears cached search results.
+    Call once any change to data sources, agencies, or the links between them and locations
+    is committed, so that searches cannot cache the rows it replaced.
+    """
+    search_results_cache.clear()
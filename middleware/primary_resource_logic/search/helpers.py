@@ -1,14 +1,16 @@
 from csv import DictWriter
-from io import BytesIO, StringIO
-from typing import Optional
+from io import StringIO
+from typing import Iterable, Iterator, Optional
 
-from flask import make_response, send_file
+from flask import Response, make_response, stream_with_context
 from werkzeug.exceptions import BadRequest
 
 from middleware.enums import JurisdictionSimplified, OutputFormatEnum
 from middleware.util.datetime import get_datetime_now
 from utilities.enums import RecordCategoryEnum
 
+CSV_CHUNK_SIZE = 64 * 1024
+
 
 def get_jurisdiction_type_enum(
     jurisdiction_type_str: str,
@@ -72,14 +74,29 @@ def format_search_results(search_results: list[dict]) -> dict:
     return response
 
 
-def format_as_csv(ld: list[dict]) -> BytesIO:
-    string_output = StringIO()
-    writer = DictWriter(string_output, fieldnames=list(ld[0].keys()))
+def stream_as_csv(
+    rows: Iterable[dict], chunk_size: int = CSV_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yields rows as UTF-8 encoded CSV, in chunks of roughly `chunk_size` characters,
+    so only one chunk of the output is held in memory at a time.
+    The header is taken from the keys of the first row; no rows produce no output.
+    """
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+    buffer = StringIO()
+    writer = DictWriter(buffer, fieldnames=list(first_row.keys()))
     writer.writeheader()
-    writer.writerows(ld)
-    string_output.seek(0)
-    bytes_output = string_output.getvalue().encode("utf-8")
-    return BytesIO(bytes_output)
+    writer.writerow(first_row)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
 
 
 def create_search_record(access_info, db_client, dto):
@@ -92,7 +109,9 @@ def create_search_record(access_info, db_client, dto):
     )
 
 
-def send_search_results(search_results: list[dict], output_format: OutputFormatEnum):
+def send_search_results(
+    search_results: Iterable[dict], output_format: OutputFormatEnum
+):
     if output_format == OutputFormatEnum.JSON:
         return send_as_json(search_results)
     if output_format == OutputFormatEnum.CSV:
@@ -105,12 +124,13 @@ def send_as_json(search_results):
     return make_response(formatted_search_results)
 
 
-def send_as_csv(search_results):
+def send_as_csv(search_results: Iterable[dict]) -> Response:
     filename = f"search_results-{get_datetime_now()}.csv"
-    csv_stream = format_as_csv(ld=search_results)
-    return send_file(
-        csv_stream, download_name=filename, mimetype="text/csv", as_attachment=True
+    response = Response(
+        stream_with_context(stream_as_csv(search_results)), mimetype="text/csv"
     )
+    response.headers.set("Content-Disposition", "attachment", filename=filename)
+    return response
 
 
 def get_explicit_record_categories(
@@ -1,10 +1,16 @@
 from flask import Response
 
 from db.client.core import DatabaseClient
+from middleware.enums import OutputFormatEnum
+from middleware.primary_resource_logic.search.cache import (
+    get_search_cache_key,
+    search_results_cache,
+)
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.primary_resource_logic.search.helpers import (
     create_search_record,
     get_explicit_record_categories,
+    send_as_csv,
     send_search_results,
 )
 from middleware.schema_and_dto.dtos.search.request import SearchRequestsDTO
@@ -17,12 +23,29 @@ def search_wrapper(
 ) -> Response:
     create_search_record(access_info, db_client, dto)
     explicit_record_categories = get_explicit_record_categories(dto.record_categories)
-    search_results = db_client.search_with_location_and_record_type(
-        location_id=dto.location_id,
-        record_categories=explicit_record_categories,
-        record_types=dto.record_types,
-        # Pass modified record categories, which breaks down ALL into individual categories
+    cache_key = get_search_cache_key(
+        dto.location_id, explicit_record_categories, dto.record_types
     )
+    # Read before the search, so results raced by an invalidation are not cached
+    cache_generation = search_results_cache.generation
+    search_results = search_results_cache.get(cache_key)
+    if search_results is None and dto.output_format == OutputFormatEnum.CSV:
+        # Stream uncached exports straight from the database rather than materializing them
+        return send_as_csv(
+            db_client.stream_search_with_location_and_record_type(
+                location_id=dto.location_id,
+                record_categories=explicit_record_categories,
+                record_types=dto.record_types,
+            )
+        )
+    if search_results is None:
+        search_results = db_client.search_with_location_and_record_type(
+            location_id=dto.location_id,
+            record_categories=explicit_record_categories,
+            record_types=dto.record_types,
+            # Pass modified record categories, which breaks down ALL into individual categories
+        )
+        search_results_cache.set(cache_key, search_results, generation=cache_generation)
     return send_search_results(
         search_results=search_results,
         output_format=dto.output_format,
@@ -1,5 +1,5 @@
 from flask import Response, make_response
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 from pydantic import BaseModel
 
 from db.client.core import DatabaseClient
@@ -22,6 +22,31 @@ class UniqueURLCheckerRequestDTO(BaseModel):
     url: str
 
 
+MAX_BATCH_URLS = 1000
+
+
+class UniqueURLBatchCheckerRequestSchema(Schema):
+    urls = fields.List(
+        fields.Str(
+            required=True,
+            metadata={
+                "description": "A URL to check.",
+                "source": SourceMappingEnum.JSON,
+            },
+        ),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_URLS),
+        metadata={
+            "description": f"The URLs to check, at most {MAX_BATCH_URLS}.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
+class UniqueURLBatchCheckerRequestDTO(BaseModel):
+    urls: list[str]
+
+
 class UniqueURLCheckerResponseInnerSchema(Schema):
     original_url = fields.Str(
         required=True,
@@ -58,7 +83,52 @@ class UniqueURLCheckerResponseOuterSchema(Schema):
     )
 
 
+class UniqueURLBatchCheckerResponseInnerSchema(UniqueURLCheckerResponseOuterSchema):
+    url = fields.Str(
+        required=True,
+        metadata={
+            "description": "The URL checked, as given.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
+class UniqueURLBatchCheckerResponseOuterSchema(Schema):
+    results = fields.List(
+        fields.Nested(
+            UniqueURLBatchCheckerResponseInnerSchema,
+            required=True,
+            metadata={
+                "description": "The duplicates of a URL.",
+                "source": SourceMappingEnum.JSON,
+            },
+        ),
+        required=True,
+        metadata={
+            "description": "The duplicates of each URL, in the order given.",
+            "source": SourceMappingEnum.JSON,
+        },
+    )
+
+
 def unique_url_checker_wrapper(
     db_client: DatabaseClient, dto: UniqueURLCheckerRequestDTO
 ) -> Response:
     return make_response({"duplicates": db_client.check_for_url_duplicates(dto.url)})
+
+
+def unique_url_batch_checker_wrapper(
+    db_client: DatabaseClient, dto: UniqueURLBatchCheckerRequestDTO
+) -> Response:
+    normalized_urls = [normalize_url(url) for url in dto.urls]
+    duplicates = db_client.check_for_url_duplicates_bulk(
+        list(dict.fromkeys(normalized_urls))
+    )
+    return make_response(
+        {
+            "results": [
+                {"url": url, "duplicates": duplicates[normalized_url]}
+                for url, normalized_url in zip(dto.urls, normalized_urls)
+            ]
+        }
+    )
@@ -1,4 +1,5 @@
 from db.client.core import DatabaseClient
+from db.helpers_.engine import get_pool_metrics
 from middleware.miscellaneous.table_count_logic import TableCountReferenceManager
 from middleware.third_party_interaction_logic.discord import DiscordPoster
 
@@ -21,6 +22,7 @@ def check_database_health():
     print("Checking database health...")
     db_client = DatabaseClient()
     check_database_health_inner(db_client)
+    print(f"Database connection pool metrics: {get_pool_metrics()}")
 
 
 def check_database_health_inner(db_client):
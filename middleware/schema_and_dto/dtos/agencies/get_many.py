@@ -6,3 +6,4 @@ from middleware.schema_and_dto.dtos.common.base import GetManyBaseDTO
 
 class AgenciesGetManyDTO(GetManyBaseDTO):
     approval_status: Optional[ApprovalStatus] = None
+    cursor: Optional[str] = None
@@ -3,6 +3,9 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from middleware.schema_and_dto.dtos._helpers import default_field_not_required
+from middleware.schema_and_dto.dynamic.pydantic_to_marshmallow.generator.models.metadata import (
+    MetadataInfo,
+)
 
 
 class AgencyMatchRequestDTO(BaseModel):
@@ -25,3 +28,18 @@ class AgencyMatchRequestDTO(BaseModel):
             or self.county is not None
             or self.locality is not None
         )
+
+
+# The default `pg_trgm` similarity threshold
+DEFAULT_BATCH_MATCH_SIMILARITY_THRESHOLD = 0.3
+
+
+class AgencyMatchBatchRequestDTO(BaseModel):
+    entries: list[AgencyMatchRequestDTO] = Field(
+        description="The agencies to match. Each entry is matched independently.",
+    )
+    similarity_threshold: float = Field(
+        default=DEFAULT_BATCH_MATCH_SIMILARITY_THRESHOLD,
+        description="The minimum similarity, between 0 and 1, of agencies to return as matches.",
+        json_schema_extra=MetadataInfo(required=False),
+    )
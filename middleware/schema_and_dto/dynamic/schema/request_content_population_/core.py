@@ -1,32 +1,38 @@
 from marshmallow import Schema
 from pydantic import BaseModel
 
+from middleware.schema_and_dto.dynamic.schema.request_content_population_ import (
+    helpers,
+)
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.helpers import (
-    get_source_data_info_from_sources,
     validate_data,
-    _apply_transformation_functions_to_dict,
     setup_dto_class,
 )
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.plan import (
+    get_request_parsing_plan,
+)
 
 
 def populate_schema_with_request_content(
-    schema: Schema, dto_class: type[BaseModel]
+    schema: Schema, dto_class: type[BaseModel], validate_dto: bool = True
 ) -> BaseModel:
     """
     Populates a marshmallow schema with request content, given custom arguments in the schema fields
     Custom arguments include:
     * source: The source in the request the data will be pulled from
     * transformation_function (optional): A function that will be applied to the data
+    :param validate_dto: Whether the DTO validates the data again after the schema.
+        Only disable for schemas generated from the DTO, whose validation already matches it.
     :return:
     """
-    # Get all declared fields from the schema
-    fields = schema.fields
-    source_data_info = get_source_data_info_from_sources(schema)
-    intermediate_data = validate_data(source_data_info.data, schema)
-    _apply_transformation_functions_to_dict(fields, intermediate_data)
+    plan = get_request_parsing_plan(schema)
+    data = helpers._get_data_from_sources(plan.fields_by_source)
+    intermediate_data = validate_data(data, schema)
+    plan.apply_transformation_functions(intermediate_data)
 
     return setup_dto_class(
         data=intermediate_data,
         dto_class=dto_class,
-        nested_dto_info_list=source_data_info.nested_dto_info_list,
+        nested_dto_info_list=plan.nested_dto_info_list,
+        validate=validate_dto,
     )
@@ -1,20 +1,11 @@
-from collections import defaultdict
-from typing import Any
-
 import marshmallow
 from marshmallow import Schema
 from pydantic import BaseModel, ValidationError
 from werkzeug.exceptions import BadRequest
 
-from middleware.schema_and_dto.dynamic.schema.request_content_population_.exceptions import (
-    InvalidSourceMappingError,
-)
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.models.nested_dto import (
     NestedDTOInfo,
 )
-from middleware.schema_and_dto.dynamic.schema.request_content_population_.models.source_data import (
-    SourceDataInfo,
-)
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.source_extraction.core import (
     get_data_from_source,
 )
@@ -22,9 +13,6 @@ from middleware.schema_and_dto.dynamic.schema.request_content_population_.types
     JSONDict,
     ValidatedDict,
 )
-from middleware.schema_and_dto.dynamic.schema.request_content_population_.util import (
-    _get_required_argument,
-)
 from utilities.enums import SourceMappingEnum
 
 
@@ -32,16 +20,25 @@ def setup_dto_class(
     data: ValidatedDict,
     dto_class: type[BaseModel],
     nested_dto_info_list: list[NestedDTOInfo],
+    validate: bool = True,
 ) -> BaseModel:
-    """Setup DTO class based on data and nested DTO info list."""
+    """
+    Setup DTO class based on data and nested DTO info list.
+
+    :param validate: Whether to validate the data against the DTOs.
+        If False, the DTOs are constructed from the data as is,
+        which is only safe when the schema's validation already guarantees the DTOs' types.
+    """
     try:
         for nested_dto_info in nested_dto_info_list:
             if nested_dto_info.key in data:
-                nested_dto = nested_dto_info.class_(**data[nested_dto_info.key])
+                nested_dto = _construct_dto(
+                    nested_dto_info.class_, data[nested_dto_info.key], validate
+                )
                 data[nested_dto_info.key] = nested_dto
             else:
                 data[nested_dto_info.key] = None
-        return dto_class(**data)
+        return _construct_dto(dto_class, data, validate)
     except ValidationError as e:
         # Extract the error message from the first validation error
         errors = e.errors()
@@ -52,6 +49,15 @@ def setup_dto_class(
         raise BadRequest(str(e))
 
 
+def _construct_dto(
+    dto_class: type[BaseModel], data: ValidatedDict, validate: bool
+) -> BaseModel:
+    # Non-pydantic DTO classes (such as dataclasses) do not validate either way
+    if validate or not issubclass(dto_class, BaseModel):
+        return dto_class(**data)
+    return dto_class.model_construct(**data)
+
+
 def validate_data(data: JSONDict, schema_obj: Schema) -> ValidatedDict:
     """Validate data against the schema and perform type coercions."""
     try:
@@ -61,80 +67,17 @@ def validate_data(data: JSONDict, schema_obj: Schema) -> ValidatedDict:
     return intermediate_data  # pyright: ignore [reportUnknownVariableType]
 
 
-def get_nested_dto_info_list(schema: Schema) -> list[NestedDTOInfo]:
-    """Get information on nested DTOs in the schema."""
-    nested_dto_info_list = []
-    for field_name, field_value in schema.fields.items():
-        if not isinstance(field_value, marshmallow.fields.Nested):
-            continue
-        metadata = field_value.metadata
-        source: SourceMappingEnum = _get_required_argument("source", metadata, schema)
-        _check_for_errors(metadata=metadata, source=source)
-        nested_dto_class = metadata["nested_dto_class"]
-        nested_dto_info_list.append(
-            NestedDTOInfo(key=field_name, class_=nested_dto_class)
-        )
-
-    return nested_dto_info_list
-
-
-def _get_data_from_sources(schema: Schema) -> JSONDict:
-    """Get extract request data from request sources specified in the schema and field metadata."""
-    field_by_source: dict[SourceMappingEnum, list[str]] = defaultdict(list)
-    for field_name, field_value in schema.fields.items():
-        metadata: dict[str, SourceMappingEnum | str] = field_value.metadata
-        source: SourceMappingEnum = _get_required_argument(
-            argument_name="source", metadata=metadata, schema_class=schema
-        )
-        field_by_source[source].append(field_name)
-
+def _get_data_from_sources(
+    fields_by_source: dict[SourceMappingEnum, frozenset[str]],
+) -> JSONDict:
+    """Extract request data from each request source, given the fields expected from it."""
     full_data: JSONDict = {}
 
-    for source in field_by_source:
+    for source, fields in fields_by_source.items():
         data = get_data_from_source(
             source=source,
-            fields=field_by_source[source],
+            fields=fields,
         )
         full_data.update(data)
 
     return full_data
-
-
-def get_source_data_info_from_sources(schema: Schema) -> SourceDataInfo:
-    """Get data from sources specified in the schema and field metadata."""
-    data = _get_data_from_sources(schema=schema)
-    nested_dto_info_list = get_nested_dto_info_list(schema=schema)
-    return SourceDataInfo(data=data, nested_dto_info_list=nested_dto_info_list)
-
-
-def _check_for_errors(metadata: dict[str, Any], source: SourceMappingEnum):
-    if source != SourceMappingEnum.JSON:
-        raise InvalidSourceMappingError(
-            "Nested fields can only be populated from JSON sources"
-        )
-    if "nested_dto_class" not in metadata:
-        raise InvalidSourceMappingError(
-            "Nested fields must have a 'nested_dto_class' metadata"
-        )
-
-
-def _apply_transformation_functions_to_dict(
-    fields: dict, intermediate_data: ValidatedDict
-):
-    """
-    Apply transformation functions to the data,
-    based on the transformation functions, if any, located within the metadata
-    :param fields:
-    :param intermediate_data:
-    :return:
-    """
-    for field_name, field_value in fields.items():
-        # if transformation functions, apply them
-        metadata = field_value.metadata
-        transformation_function: callable = metadata.get(  # pyright: ignore[reportGeneralTypeIssues]
-            "transformation_function", None
-        )
-        if transformation_function is not None and field_name in intermediate_data:
-            intermediate_data[field_name] = transformation_function(
-                intermediate_data[field_name]
-            )
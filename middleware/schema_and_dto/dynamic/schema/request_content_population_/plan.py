@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+import marshmallow
+from marshmallow import Schema
+
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.exceptions import (
+    InvalidSourceMappingError,
+)
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.models.nested_dto import (
+    NestedDTOInfo,
+)
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.types import (
+    ValidatedDict,
+)
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.util import (
+    _get_required_argument,
+)
+from utilities.enums import SourceMappingEnum
+
+
+@dataclass(frozen=True)
+class RequestParsingPlan:
+    """
+    What populating a DTO from a request needs to know about a schema's fields,
+    read once from the field metadata rather than on every request.
+
+    :param fields_by_source: The names of the fields populated from each request source.
+    :param nested_dto_info_list: The nested DTOs to construct, for each nested field.
+    :param transformation_functions: The function applied to each field's validated value, if any.
+    """
+
+    fields_by_source: dict[SourceMappingEnum, frozenset[str]]
+    nested_dto_info_list: list[NestedDTOInfo]
+    transformation_functions: dict[str, Callable]
+
+    def apply_transformation_functions(self, intermediate_data: ValidatedDict) -> None:
+        for (
+            field_name,
+            transformation_function,
+        ) in self.transformation_functions.items():
+            if field_name in intermediate_data:
+                intermediate_data[field_name] = transformation_function(
+                    intermediate_data[field_name]
+                )
+
+
+def _check_for_errors(metadata: dict, source: SourceMappingEnum):
+    if source != SourceMappingEnum.JSON:
+        raise InvalidSourceMappingError(
+            "Nested fields can only be populated from JSON sources"
+        )
+    if "nested_dto_class" not in metadata:
+        raise InvalidSourceMappingError(
+            "Nested fields must have a 'nested_dto_class' metadata"
+        )
+
+
+def build_request_parsing_plan(schema: Schema) -> RequestParsingPlan:
+    fields_by_source: dict[SourceMappingEnum, set[str]] = {}
+    nested_dto_info_list = []
+    transformation_functions = {}
+    for field_name, field_value in schema.fields.items():
+        metadata = field_value.metadata
+        source: SourceMappingEnum = _get_required_argument(
+            argument_name="source", metadata=metadata, schema_class=schema
+        )
+        fields_by_source.setdefault(source, set()).add(field_name)
+
+        if isinstance(field_value, marshmallow.fields.Nested):
+            _check_for_errors(metadata=metadata, source=source)
+            nested_dto_info_list.append(
+                NestedDTOInfo(key=field_name, class_=metadata["nested_dto_class"])
+            )
+
+        transformation_function = metadata.get("transformation_function", None)
+        if transformation_function is not None:
+            transformation_functions[field_name] = transformation_function
+
+    return RequestParsingPlan(
+        fields_by_source={
+            source: frozenset(field_names)
+            for source, field_names in fields_by_source.items()
+        },
+        nested_dto_info_list=nested_dto_info_list,
+        transformation_functions=transformation_functions,
+    )
+
+
+def _get_plan_key(schema: Schema) -> Hashable:
+    # `only` and `exclude` are the instance options which change a schema's fields
+    only = None if schema.only is None else frozenset(schema.only)
+    return type(schema), only, frozenset(schema.exclude)
+
+
+_REQUEST_PARSING_PLANS: dict[Hashable, RequestParsingPlan] = {}
+
+
+def get_request_parsing_plan(schema: Schema) -> RequestParsingPlan:
+    """
+    Returns the parsing plan for the schema, building and caching it on first use.
+    Schemas with invalid field metadata raise on every use, as their plans are not cached.
+    """
+    key = _get_plan_key(schema)
+    plan = _REQUEST_PARSING_PLANS.get(key)
+    if plan is None:
+        plan = build_request_parsing_plan(schema)
+        _REQUEST_PARSING_PLANS[key] = plan
+    return plan
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.source_extraction.validate import (
     validate_fields,
@@ -9,12 +10,12 @@ from middleware.schema_and_dto.dynamic.schema.request_content_population_.types
 
 
 class SourceExtractorBase(ABC):
-    def __init__(self, expected_fields: list[str]):
-        self.expected_fields: list[str] = expected_fields
+    def __init__(self, expected_fields: Collection[str]):
+        self.expected_fields: Collection[str] = expected_fields
         self._data: dict[str, JSONDict] = self._extract()
         validate_fields(
             expected_fields=self.expected_fields,
-            actual_fields=list(self._data.keys()),
+            actual_fields=self._data.keys(),
         )
 
     @abstractmethod
@@ -1,3 +1,5 @@
+from typing import Collection
+
 from middleware.schema_and_dto.dynamic.schema.request_content_population_.source_extraction.mapping import (
     EXTRACTOR_MAPPING,
 )
@@ -7,7 +9,9 @@ from middleware.schema_and_dto.dynamic.schema.request_content_population_.types
 from utilities.enums import SourceMappingEnum
 
 
-def get_data_from_source(source: SourceMappingEnum, fields: list[str]) -> JSONDict:
+def get_data_from_source(
+    source: SourceMappingEnum, fields: Collection[str]
+) -> JSONDict:
     extractor_class = EXTRACTOR_MAPPING[source]
     extractor = extractor_class(
         expected_fields=fields,
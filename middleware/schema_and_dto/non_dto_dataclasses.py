@@ -19,6 +19,8 @@ class FlaskRestxDocInfo:
 class SchemaPopulateParameters:
     schema: type[Schema] | Schema
     dto_class: type[BaseModel]
+    # Whether the DTO validates the data again after the schema
+    validate_dto: bool = True
 
 
 class DTOPopulateParameters(BaseModel):
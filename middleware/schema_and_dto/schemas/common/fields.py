@@ -12,6 +12,16 @@ PAGE_FIELD = fields.Integer(
     },
 )
 
+CURSOR_FIELD = fields.Str(
+    required=False,
+    metadata={
+        "description": "The `next_cursor` returned in the metadata of the previous page. "
+        "If provided, results resume after that page, and `page` is ignored. "
+        "Faster than `page` for deep pages; must be used with the same sort parameters.",
+        "source": SourceMappingEnum.QUERY_ARGS,
+    },
+)
+
 SORT_ORDER_FIELD = fields.Enum(
     required=False,
     enum=SortOrder,
@@ -47,3 +47,16 @@ class MatchAgencyResponseSchema(MessageSchema):
         required=False,
         metadata=get_json_metadata("The list of results, if any"),
     )
+
+
+class MatchAgenciesBatchResponseSchema(MessageSchema):
+    results = fields.List(
+        fields.Nested(
+            MatchAgencyResponseSchema(),
+            metadata=get_json_metadata("The match result for an entry"),
+        ),
+        required=True,
+        metadata=get_json_metadata(
+            "The match results for each entry, in the order of the entries"
+        ),
+    )
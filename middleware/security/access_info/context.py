@@ -0,0 +1,21 @@
+from flask import g, has_request_context
+
+from middleware.security.access_info.base import AccessInfoBase
+
+
+def set_request_access_info(access_info: AccessInfoBase | None) -> None:
+    """
+    Stores the access info resolved at authentication time for the current request,
+    so downstream logic can read the caller's identity without querying the database.
+    """
+    if has_request_context():
+        g.access_info = access_info
+
+
+def get_request_access_info() -> AccessInfoBase | None:
+    """
+    Returns the access info resolved for the current request, if any.
+    """
+    if not has_request_context():
+        return None
+    return g.get("access_info")
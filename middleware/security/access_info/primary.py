@@ -1,6 +1,7 @@
 from db.client.core import DatabaseClient
 from middleware.enums import PermissionsEnum
 from middleware.security.access_info.base import AccessInfoBase
+from middleware.security.access_info.context import get_request_access_info
 
 
 class AccessInfoPrimary(AccessInfoBase):
@@ -13,7 +14,21 @@ class AccessInfoPrimary(AccessInfoBase):
     permissions: list[PermissionsEnum] | None = None
 
     def get_user_id(self) -> int | None:
-        if self.user_id is None:
+        """
+        Returns the user id resolved at authentication time.
+        Access info constructed outside the auth handlers borrows it from the
+        current request's identity where possible, and only otherwise queries for it.
+        """
+        if self.user_id is not None:
+            return self.user_id
+        request_access_info = get_request_access_info()
+        if (
+            isinstance(request_access_info, AccessInfoPrimary)
+            and request_access_info.user_email == self.user_email
+            and request_access_info.user_id is not None
+        ):
+            self.user_id = request_access_info.user_id
+        else:
             self.user_id = DatabaseClient().get_user_id(email=self.user_email)
         return self.user_id
 
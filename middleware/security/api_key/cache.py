@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+
+from db.helpers_.lru_cache import LRUCache
+from middleware.enums import PermissionsEnum
+
+
+@dataclass(frozen=True)
+class ApiKeyIdentity:
+    """
+    The user an API key resolves to, as of when it was looked up.
+    """
+
+    user_id: int
+    user_email: str
+    permissions: tuple[PermissionsEnum, ...] = field(default_factory=tuple)
+
+
+class ApiKeyAuthCache(LRUCache[str, ApiKeyIdentity]):
+    """
+    A bounded, thread-safe TTL cache mapping API key hashes to the identity of their user.
+
+    Only successful lookups are cached, so a newly issued key is usable immediately.
+    Entries are invalidated explicitly when a user's key, permissions or account change.
+    Worker processes do not share the cache, so the TTL is kept short:
+    it bounds how long a revoked key or permission keeps working on other workers.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 10):
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self.remove_where(lambda _, identity: identity.user_id == user_id)
+
+
+api_key_auth_cache = ApiKeyAuthCache()
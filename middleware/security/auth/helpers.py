@@ -1,6 +1,7 @@
 from werkzeug.exceptions import BadRequest, Unauthorized
 
 from middleware.enums import AccessTypeEnum, PermissionsEnum
+from middleware.security.access_info.context import set_request_access_info
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.auth.header.helpers import get_header_auth_info
 from middleware.security.auth.method_config.core import AuthMethodConfig
@@ -42,6 +43,7 @@ def get_authentication(
             restrict_to_permissions=restrict_to_permissions,
         )
         if access_info:
+            set_request_access_info(access_info)
             return access_info
 
     raise Unauthorized(
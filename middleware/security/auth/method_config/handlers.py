@@ -6,7 +6,7 @@ from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.access_info.validate_email import ValidateEmailTokenAccessInfo
 from middleware.security.auth.method_config.helpers import (
     check_permissions_with_access_info,
-    get_user_email_from_api_key,
+    get_user_identity_from_api_key,
     decode_jwt_with_purpose,
 )
 from middleware.security.jwt.enums import JWTPurpose
@@ -25,13 +25,15 @@ def jwt_handler(
 
 
 def api_key_handler(token: str, **kwargs) -> Optional[AccessInfoPrimary]:
-    user_email = get_user_email_from_api_key(token)
-    if user_email:
-        return AccessInfoPrimary(
-            user_email=user_email,
-            access_type=AccessTypeEnum.API_KEY,
-        )
-    return None
+    identity = get_user_identity_from_api_key(token)
+    if identity is None:
+        return None
+    return AccessInfoPrimary(
+        user_email=identity.user_email,
+        user_id=identity.user_id,
+        permissions=list(identity.permissions),
+        access_type=AccessTypeEnum.API_KEY,
+    )
 
 
 def password_reset_handler(
@@ -8,6 +8,7 @@ from db.client.core import DatabaseClient
 from middleware.enums import PermissionsEnum
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.access_info.refresh import RefreshAccessInfo
+from middleware.security.api_key.cache import ApiKeyIdentity
 from middleware.security.api_key.core import ApiKey
 from middleware.security.jwt.core import SimpleJWT
 from middleware.security.jwt.enums import JWTPurpose
@@ -25,13 +26,10 @@ def check_permissions_with_access_info(
             raise Forbidden("You do not have permission to access this endpoint")
 
 
-def get_user_email_from_api_key(token: str) -> Optional[str]:
+def get_user_identity_from_api_key(token: str) -> Optional[ApiKeyIdentity]:
     api_key = ApiKey(raw_key=token)
     db_client = DatabaseClient()
-    user_identifiers = db_client.get_user_by_api_key(api_key.key_hash)
-    if user_identifiers is None:
-        return None
-    return user_identifiers.email
+    return db_client.get_user_identity_by_api_key(api_key.key_hash)
 
 
 def decode_jwt_with_purpose(token: str, purpose: JWTPurpose):
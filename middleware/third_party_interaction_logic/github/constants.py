@@ -1,3 +1,11 @@
 GH_PROJECT_NUMBER = 26
 GH_ORG_NAME = "Police-Data-Accessibility-Project"
 GH_REPO_NAME = "data-requests"
+# The maximum page size GitHub allows for connections
+GH_PROJECT_ITEMS_PAGE_SIZE = 100
+# Mutations sent to GitHub in a single request
+GH_MUTATION_BATCH_SIZE = 10
+# GitHub runs a request's mutations one after another, so they are given longer to respond
+GH_MUTATION_TIMEOUT_SECONDS = 60
+# Recent issues checked for ones an earlier sync created without recording them
+GH_RECENT_ISSUES_COUNT = 100
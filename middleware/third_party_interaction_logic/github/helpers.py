@@ -2,7 +2,15 @@ import re
 from typing import Optional
 
 import requests
-
+from environs import Env
+from pydantic import BaseModel
+
+from middleware.third_party_interaction_logic.github.constants import (
+    GH_MUTATION_TIMEOUT_SECONDS,
+    GH_ORG_NAME,
+    GH_PROJECT_ITEMS_PAGE_SIZE,
+    GH_PROJECT_NUMBER,
+)
 from middleware.third_party_interaction_logic.github.issue_project_info.core import (
     GithubIssueProjectInfo,
 )
@@ -40,12 +48,19 @@ def get_issue_project_statii_and_labels(global_ids: list[str]):
 
 
 def generate_issues_and_project_get_graphql_query():
+    """
+    Query for one page of the project's items, starting after the `cursor` variable
+    """
     return """
-    query {
-      organization(login: "Police-Data-Accessibility-Project") {
-        projectV2(number: 26) {  # Specific project number
+    query ($org: String!, $projectNumber: Int!, $pageSize: Int!, $cursor: String) {
+      organization(login: $org) {
+        projectV2(number: $projectNumber) {
           title
-          items(first: 100) {
+          items(first: $pageSize, after: $cursor) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
             nodes {
               content {
                 ... on Issue {
@@ -71,8 +86,14 @@ def generate_issues_and_project_get_graphql_query():
     """
 
 
-def convert_graph_ql_result_to_issue_info(result: dict):
-    gipi = GithubIssueProjectInfo()
+def convert_graph_ql_result_to_issue_info(
+    result: dict, gipi: Optional[GithubIssueProjectInfo] = None
+) -> GithubIssueProjectInfo:
+    """
+    Adds the issues in a page of project items to `gipi`, creating it if not given
+    """
+    if gipi is None:
+        gipi = GithubIssueProjectInfo()
     data = result.get("data")
     if data is None:
         raise ValueError("No data in result")
@@ -81,9 +102,13 @@ def convert_graph_ql_result_to_issue_info(result: dict):
     items = project_v2.get("items")
     nodes = items.get("nodes")
     for node in nodes:
-        issue_number = node.get("content").get("number")
+        # Draft issues and pull requests have no issue number
+        content = node.get("content") or {}
+        issue_number = content.get("number")
+        if issue_number is None:
+            continue
         project_status = node.get("fieldValueByName").get("name")
-        label_nodes = node.get("content").get("labels").get("nodes")
+        label_nodes = content.get("labels").get("nodes")
         record_types = []
         for label_node in label_nodes:
             if "RT-" in label_node.get("name"):
@@ -99,26 +124,99 @@ def convert_graph_ql_result_to_issue_info(result: dict):
 def get_github_issue_project_statuses(
     issue_numbers: list[int],
 ) -> GithubIssueProjectInfo:
+    """
+    Gets the status and record types of every issue in the project,
+    paging through all of the project's items
+    """
     query = generate_issues_and_project_get_graphql_query()
 
-    response = make_graph_ql_query(query=query)
+    gipi = GithubIssueProjectInfo()
+    cursor = None
+    while True:
+        response = make_graph_ql_query(
+            query=query,
+            variables={
+                "org": GH_ORG_NAME,
+                "projectNumber": GH_PROJECT_NUMBER,
+                "pageSize": GH_PROJECT_ITEMS_PAGE_SIZE,
+                "cursor": cursor,
+            },
+        )
+        convert_graph_ql_result_to_issue_info(response, gipi=gipi)
+
+        page_info = response["data"]["organization"]["projectV2"]["items"]["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return gipi
+        cursor = page_info["endCursor"]
+
+
+class BatchedMutationResult(BaseModel):
+    """
+    The outcome of a batched mutation.
+    GitHub still runs the other mutations of a request when one fails,
+    so the payloads that succeeded are returned alongside the errors.
+    """
 
-    gipi = convert_graph_ql_result_to_issue_info(response)
+    # The payload of each run of the mutation, in the order of the inputs,
+    # or None where that run failed
+    payloads: list[Optional[dict]]
+    errors: list[dict]
 
-    return gipi
+
+def make_batched_graph_ql_mutation(
+    mutation: str, input_type: str, inputs: list[dict], selection: str
+) -> BatchedMutationResult:
+    """
+    Runs the mutation once for each input, in a single request.
+    GitHub runs the mutations of a request one after another, in order.
+
+    :param mutation: The name of the mutation, e.g. `createIssue`
+    :param input_type: The GraphQL type of the mutation's input, e.g. `CreateIssueInput`
+    :param inputs: The input for each run of the mutation
+    :param selection: The fields to select from each mutation's payload
+    :return: The payloads of the runs which succeeded, and the errors of those which failed
+    """
+    if len(inputs) == 0:
+        return BatchedMutationResult(payloads=[], errors=[])
+    variable_definitions = ", ".join(
+        f"$input{i}: {input_type}!" for i in range(len(inputs))
+    )
+    fields = "\n".join(
+        f"m{i}: {mutation}(input: $input{i}) {{ {selection} }}"
+        for i in range(len(inputs))
+    )
+    query = f"mutation ({variable_definitions}) {{\n{fields}\n}}"
+    response = make_graph_ql_query(
+        query=query,
+        variables={f"input{i}": input_ for i, input_ in enumerate(inputs)},
+        timeout=GH_MUTATION_TIMEOUT_SECONDS,
+    )
+    data = response.get("data") or {}
+    payloads = [data.get(f"m{i}") for i in range(len(inputs))]
+    errors = list(response.get("errors") or [])
+    if not errors and any(payload is None for payload in payloads):
+        errors.append({"message": f"{mutation} returned no payload"})
+    return BatchedMutationResult(payloads=payloads, errors=errors)
 
 
-def make_graph_ql_query(query: str, variables: Optional[dict] = None):
+def get_github_graph_ql_url() -> str:
+    return Env().str("GH_GRAPHQL_URL", "https://api.github.com/graphql")
+
+
+def make_graph_ql_query(
+    query: str, variables: Optional[dict] = None, timeout: float = 10
+):
     access_token = get_env_variable("GH_API_ACCESS_TOKEN")
+    json_ = {"query": query}
+    if variables is not None:
+        json_["variables"] = variables
     response = requests.post(
-        url="https://api.github.com/graphql",
+        url=get_github_graph_ql_url(),
         headers={
             "Authorization": f"Bearer {access_token}",
         },
-        json={
-            "query": query,
-        },
-        timeout=10,
+        json=json_,
+        timeout=timeout,
     )
     response.raise_for_status()
     return response.json()
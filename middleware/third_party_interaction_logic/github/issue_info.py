@@ -2,9 +2,22 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from middleware.enums import RecordTypesEnum
+
 
 class GithubIssueInfo(BaseModel):
     id: str
     url: str
     number: int
     data_request_id: Optional[int] = None
+
+
+class ExistingGithubIssueInfo(GithubIssueInfo):
+    title: str
+    body: str
+
+
+class NewGithubIssueInfo(BaseModel):
+    title: str
+    body: str
+    record_types: list[RecordTypesEnum]
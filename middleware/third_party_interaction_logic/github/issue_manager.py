@@ -1,30 +1,58 @@
 import json
+from typing import Optional
 
 from db.enums import RequestStatus
 from middleware.enums import RecordTypesEnum
 from middleware.third_party_interaction_logic.github.constants import (
     GH_ORG_NAME,
     GH_PROJECT_NUMBER,
+    GH_RECENT_ISSUES_COUNT,
     GH_REPO_NAME,
 )
 from middleware.third_party_interaction_logic.github.project_status_manager import (
     ProjectStatusManager,
 )
-from middleware.third_party_interaction_logic.github.issue_info import GithubIssueInfo
+from middleware.third_party_interaction_logic.github.issue_info import (
+    ExistingGithubIssueInfo,
+    GithubIssueInfo,
+    NewGithubIssueInfo,
+)
 from middleware.third_party_interaction_logic.github.label_manager import (
     GithubLabelManager,
 )
-from middleware.third_party_interaction_logic.github.helpers import make_graph_ql_query
+from middleware.third_party_interaction_logic.github.helpers import (
+    make_batched_graph_ql_mutation,
+    make_graph_ql_query,
+)
+from middleware.third_party_interaction_logic.github.node_id_cache import (
+    GithubNodeIDs,
+    github_node_id_cache,
+)
 
 
 class GithubIssueManager:
     def __init__(self):
-        self.project_id = self.get_project_id()
-        self.repo_id = self.get_repository_id()
-        node = self.get_project_status_field()
-        self.project_status_field_id = node["id"]
-        self.project_status_manager = ProjectStatusManager(node["options"])
-        self.label_manager = GithubLabelManager()
+        self._set_node_ids(github_node_id_cache.get(load=self.load_node_ids))
+
+    def _set_node_ids(self, node_ids: GithubNodeIDs) -> None:
+        self.project_id = node_ids.project_id
+        self.repo_id = node_ids.repo_id
+        self.project_status_field_id = node_ids.project_status_field_id
+        self.project_status_manager = ProjectStatusManager(
+            node_ids.project_status_options
+        )
+        self.label_name_to_id = node_ids.label_name_to_id
+
+    def load_node_ids(self) -> GithubNodeIDs:
+        project_id = self.get_project_id()
+        node = self.get_project_status_field(project_id)
+        return GithubNodeIDs(
+            project_id=project_id,
+            repo_id=self.get_repository_id(),
+            project_status_field_id=node["id"],
+            project_status_options=node["options"],
+            label_name_to_id=GithubLabelManager().label_name_to_id,
+        )
 
     def get_project_id(self):
         query = """
@@ -60,8 +88,12 @@ class GithubIssueManager:
         record_type_str_list = [
             f"RT-{record_type.value}" for record_type in record_types
         ]
+        # Labels added since the node ids were cached require reloading them
+        if any(name not in self.label_name_to_id for name in record_type_str_list):
+            github_node_id_cache.clear()
+            self._set_node_ids(github_node_id_cache.get(load=self.load_node_ids))
         return [
-            self.label_manager.label_name_to_id[record_type_str]
+            self.label_name_to_id[record_type_str]
             for record_type_str in record_type_str_list
         ]
 
@@ -142,6 +174,111 @@ class GithubIssueManager:
         self.assign_status(project_item_id=project_item_id, status=status)
         return gii
 
+    def create_issues(
+        self, new_issues: list[NewGithubIssueInfo]
+    ) -> tuple[list[Optional[GithubIssueInfo]], list[dict]]:
+        """
+        Creates the issues in a single request.
+
+        :return: The created issues in the order given, with None for those which failed,
+            and the errors of those which failed
+        """
+        result = make_batched_graph_ql_mutation(
+            mutation="createIssue",
+            input_type="CreateIssueInput",
+            inputs=[
+                {
+                    "repositoryId": self.repo_id,
+                    "title": new_issue.title,
+                    "body": new_issue.body,
+                    "labelIds": self.get_record_type_label_ids(new_issue.record_types),
+                }
+                for new_issue in new_issues
+            ],
+            selection="issue { number, id, url }",
+        )
+        issues = [
+            (
+                GithubIssueInfo(
+                    url=payload["issue"]["url"],
+                    number=payload["issue"]["number"],
+                    id=payload["issue"]["id"],
+                )
+                if payload is not None
+                else None
+            )
+            for payload in result.payloads
+        ]
+        return issues, result.errors
+
+    def get_recent_issues(self) -> list[ExistingGithubIssueInfo]:
+        """
+        Gets the repository's most recently created issues, newest first.
+        """
+        query = """
+        query ($owner: String!, $name: String!, $count: Int!) {
+          repository(owner: $owner, name: $name) {
+            issues(first: $count, orderBy: {field: CREATED_AT, direction: DESC}) {
+              nodes {
+                number
+                id
+                url
+                title
+                body
+              }
+            }
+          }
+        }
+        """
+        response = make_graph_ql_query(
+            query=query,
+            variables={
+                "owner": GH_ORG_NAME,
+                "name": GH_REPO_NAME,
+                "count": GH_RECENT_ISSUES_COUNT,
+            },
+        )
+        issues = response["data"]["repository"]["issues"]["nodes"]
+        return [ExistingGithubIssueInfo(**issue) for issue in issues]
+
+    def assign_issues_to_project_with_status(
+        self, issues: list[GithubIssueInfo], status: RequestStatus
+    ) -> list[dict]:
+        """
+        Adds the issues to the project and assigns them the status,
+        batching each step into a single request.
+        Issues which fail to be added to the project are not assigned the status.
+
+        :return: The errors of the issues which failed either step
+        """
+        item_result = make_batched_graph_ql_mutation(
+            mutation="addProjectV2ItemById",
+            input_type="AddProjectV2ItemByIdInput",
+            inputs=[
+                {"projectId": self.project_id, "contentId": issue.id}
+                for issue in issues
+            ],
+            selection="item { id }",
+        )
+
+        option_id = self.project_status_manager.get_id(status.value)
+        status_result = make_batched_graph_ql_mutation(
+            mutation="updateProjectV2ItemFieldValue",
+            input_type="UpdateProjectV2ItemFieldValueInput",
+            inputs=[
+                {
+                    "projectId": self.project_id,
+                    "itemId": payload["item"]["id"],
+                    "fieldId": self.project_status_field_id,
+                    "value": {"singleSelectOptionId": option_id},
+                }
+                for payload in item_result.payloads
+                if payload is not None
+            ],
+            selection="projectV2Item { id }",
+        )
+        return item_result.errors + status_result.errors
+
     def assign_issue_to_project(self, issue_id: str) -> str:
         query = """
         mutation AssignIssueToProject {
@@ -164,7 +301,7 @@ class GithubIssueManager:
         response = make_graph_ql_query(query=query)
         return response["data"]["addProjectV2ItemById"]["item"]["id"]
 
-    def get_project_status_field(self):
+    def get_project_status_field(self, project_id: str):
         query = (
             """
         query {
@@ -194,7 +331,7 @@ class GithubIssueManager:
           }
         }
         """
-            % self.project_id
+            % project_id
         )
         response = make_graph_ql_query(query=query)
         data = response["data"]
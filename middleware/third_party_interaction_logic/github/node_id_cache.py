@@ -0,0 +1,40 @@
+import threading
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+
+class GithubNodeIDs(BaseModel):
+    """
+    The GitHub node ids the issue manager needs, which rarely change
+    """
+
+    project_id: str
+    repo_id: str
+    project_status_field_id: str
+    project_status_options: list[dict]
+    label_name_to_id: dict[str, str]
+
+
+class GithubNodeIDCache:
+    """
+    Holds the GitHub node ids for this process, so that they are queried once
+    rather than on every synchronization.
+    """
+
+    def __init__(self):
+        self._node_ids: Optional[GithubNodeIDs] = None
+        self._lock = threading.Lock()
+
+    def get(self, load: Callable[[], GithubNodeIDs]) -> GithubNodeIDs:
+        with self._lock:
+            if self._node_ids is None:
+                self._node_ids = load()
+            return self._node_ids
+
+    def clear(self) -> None:
+        with self._lock:
+            self._node_ids = None
+
+
+github_node_id_cache = GithubNodeIDCache()
@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from middleware.third_party_interaction_logic.mailgun_.constants import (
     MAILGUN_URL,
@@ -6,6 +8,32 @@ from middleware.third_party_interaction_logic.mailgun_.constants import (
 )
 from middleware.util.env import get_env_variable
 
+_session: requests.Session | None = None
+
+
+def get_mailgun_session() -> requests.Session:
+    """
+    Returns a process-wide session for Mailgun requests,
+    reusing pooled connections across emails and retrying sends with backoff.
+
+    Only sends Mailgun cannot have accepted are retried: failed connections and rate-limited (429) responses.
+    Read errors and server errors may follow an accepted send, so retrying them could send duplicate emails.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"POST"}),
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=retry))
+        _session = session
+    return _session
+
 
 def send_via_mailgun(
     to_email: str,
@@ -35,7 +63,7 @@ def send_via_mailgun(
     if bcc is not None:
         data["bcc"] = bcc
 
-    r = requests.post(
+    r = get_mailgun_session().post(
         MAILGUN_URL, auth=("api", get_env_variable("MAILGUN_KEY")), data=data, timeout=5
     )
 
@@ -0,0 +1,116 @@
+"""
+JSON serialization shared by the Flask and FastAPI apps.
+
+Responses are serialized with orjson, as compact, UTF-8 encoded JSON.
+"""
+
+import dataclasses
+import json
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from flask import Response, current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+
+def json_default(o: Any) -> Any:
+    """
+    Converts objects the JSON encoder does not support natively
+    (such as `RowMapping`s, pydantic models and `Decimal`s) into ones it does.
+    """
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, UUID):
+        return str(o)
+    if isinstance(o, BaseModel):
+        return o.model_dump(mode="json")
+    if isinstance(o, Mapping):
+        return dict(o)
+    if isinstance(o, (set, frozenset, tuple)):
+        return list(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    html = getattr(o, "__html__", None)
+    if callable(html):
+        return str(html())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serializes an object to UTF-8 encoded JSON.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=json_default, option=option)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serializes an object to a JSON string.
+    """
+    return dumps_bytes(obj, sort_keys=sort_keys).decode("utf-8")
+
+
+def loads(s: str | bytes) -> Any:
+    return orjson.loads(s)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider serializing with `dumps_bytes`.
+    Keys are sorted like Flask's default provider, unless `sort_keys` is disabled.
+    Calls passing encoder arguments (such as `indent`) fall back to the standard library.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", json_default)
+            kwargs.setdefault("sort_keys", self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj, sort_keys=self.sort_keys)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            dumps_bytes(obj, sort_keys=self.sort_keys) + b"\n", mimetype=self.mimetype
+        )
+
+
+def output_json(data: Any, code: int, headers: dict | None = None) -> Response:
+    """
+    flask-restx representation for JSON, used in place of its standard library based one.
+    """
+    if current_app.debug:
+        body = current_app.json.dumps(data, indent=4) + "\n"
+    else:
+        body = dumps_bytes(data) + b"\n"
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    FastAPI response class serializing with `dumps_bytes`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -0,0 +1,94 @@
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from flask import Response, request
+
+from db.client.core import DatabaseClient
+from middleware.util.json_serialization import dumps_bytes
+
+
+@dataclass(frozen=True)
+class PrecomputedPayload:
+    """
+    A JSON response body serialized once, alongside its gzipped form and content hash.
+    """
+
+    version: int
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    built_at: float
+
+    def to_response(self) -> Response:
+        """
+        Builds a response for the current request.
+        Clients accepting gzip receive the compressed body,
+        and clients presenting a matching If-None-Match receive a 304.
+        """
+        if request.accept_encodings["gzip"]:
+            response = Response(self.gzip_body, mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+            response.set_etag(f"{self.etag}-gzip")
+        else:
+            response = Response(self.body, mimetype="application/json")
+            response.set_etag(self.etag)
+        response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
+
+
+class PrecomputedPayloadCache:
+    """
+    Caches the serialized result of an expensive, rarely-changing query.
+
+    `build` may return data to be serialized as JSON,
+    or bytes of a JSON document already serialized, e.g. by the database.
+    The payload is built on first use after each invalidation,
+    and rebuilt once it is older than `max_age_seconds`.
+    Concurrent requests during a rebuild wait for a single build rather than each running the query.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[DatabaseClient], Any],
+        max_age_seconds: float = 3600,
+    ):
+        self._build = build
+        self.max_age_seconds = max_age_seconds
+        self._payload: PrecomputedPayload | None = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, db_client: DatabaseClient) -> PrecomputedPayload:
+        payload = self._payload
+        if payload is not None and not self._is_expired(payload):
+            return payload
+        with self._lock:
+            payload = self._payload
+            if payload is None or self._is_expired(payload):
+                payload = self._serialize(self._build(db_client))
+                self._payload = payload
+            return payload
+
+    def invalidate(self) -> None:
+        self._payload = None
+
+    def _is_expired(self, payload: PrecomputedPayload) -> bool:
+        return time.monotonic() - payload.built_at > self.max_age_seconds
+
+    def _serialize(self, data: Any) -> PrecomputedPayload:
+        if isinstance(data, bytes):
+            body = data
+        else:
+            body = dumps_bytes(data)
+        self._version += 1
+        return PrecomputedPayload(
+            version=self._version,
+            body=body,
+            gzip_body=gzip.compress(body),
+            etag=hashlib.sha256(body).hexdigest(),
+            built_at=time.monotonic(),
+        )
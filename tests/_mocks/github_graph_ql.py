@@ -0,0 +1,151 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGithubGraphQLServer:
+    """
+    A local stand-in for GitHub's GraphQL API,
+    answering the queries and mutations used by the GitHub issue sync.
+
+    :param project_items: The project's items, as returned in `items.nodes`
+    :param failing_issue_titles: The titles of issues whose creation fails
+    """
+
+    def __init__(
+        self,
+        project_items: list[dict],
+        failing_issue_titles: frozenset[str] = frozenset(),
+    ):
+        self.project_items = project_items
+        self.failing_issue_titles = failing_issue_titles
+        self.requests: list[dict] = []
+        self.issues: list[dict] = []
+        # The number of createIssue requests to answer with a server error, after creating the issues
+        self.lost_create_issue_responses = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                request = json.loads(body)
+                fake.requests.append(request)
+                status, body = fake.respond(request)
+                response = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/graphql"
+
+    def __enter__(self) -> "FakeGithubGraphQLServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def issue_count(self) -> int:
+        return len(self.issues)
+
+    def respond(self, request: dict) -> tuple[int, dict]:
+        query = request["query"]
+        variables = request.get("variables") or {}
+        if "createIssue(" in query:
+            response = self._mutation(variables, self._create_issue)
+            if self.lost_create_issue_responses > 0:
+                self.lost_create_issue_responses -= 1
+                return 502, {"message": "Bad Gateway"}
+            return 200, response
+        return 200, self._respond(query, variables)
+
+    def _respond(self, query: str, variables: dict) -> dict:
+        if "items(first" in query:
+            return self._project_items_page(variables)
+        if "issues(first" in query:
+            issues = self.issues[::-1][: variables["count"]]
+            return {"data": {"repository": {"issues": {"nodes": issues}}}}
+        if "addProjectV2ItemById(" in query:
+            return self._mutation(
+                variables,
+                lambda input_: {"item": {"id": f"item-{input_['contentId']}"}},
+            )
+        if "updateProjectV2ItemFieldValue(" in query:
+            return self._mutation(
+                variables, lambda input_: {"projectV2Item": {"id": input_["itemId"]}}
+            )
+        if "labels(first" in query:
+            labels = [
+                {"id": "label-dispatch", "name": "RT-Dispatch Recordings"},
+            ]
+            return {"data": {"repository": {"labels": {"nodes": labels}}}}
+        if "fields(first" in query:
+            status_field = {
+                "id": "status-field",
+                "name": "Status",
+                "options": [{"id": "status-ready", "name": "Ready to start"}],
+            }
+            return {"data": {"node": {"fields": {"nodes": [status_field]}}}}
+        if "projectV2(number" in query:
+            return {"data": {"organization": {"projectV2": {"id": "project"}}}}
+        if "repository(owner" in query:
+            return {"data": {"repository": {"id": "repository"}}}
+        raise ValueError(f"Unexpected query: {query}")
+
+    def _project_items_page(self, variables: dict) -> dict:
+        start = int(variables["cursor"] or 0)
+        end = start + variables["pageSize"]
+        items = {
+            "pageInfo": {
+                "hasNextPage": end < len(self.project_items),
+                "endCursor": str(end),
+            },
+            "nodes": self.project_items[start:end],
+        }
+        return {"data": {"organization": {"projectV2": {"items": items}}}}
+
+    def _create_issue(self, input_: dict) -> dict | None:
+        if input_["title"] in self.failing_issue_titles:
+            return None
+        number = self.issue_count + 1
+        issue = {
+            "number": number,
+            "id": f"issue-{number}",
+            "url": f"https://github.com/issues/{number}",
+            "title": input_["title"],
+            "body": input_["body"],
+        }
+        self.issues.append(issue)
+        return {
+            "issue": {
+                "number": issue["number"],
+                "id": issue["id"],
+                "url": issue["url"],
+            }
+        }
+
+    @staticmethod
+    def _mutation(variables: dict, run) -> dict:
+        # Batched mutations are aliased `m0`, `m1`, ... with inputs `input0`, `input1`, ...
+        # A run returning None fails, without stopping the others, as with GitHub
+        data = {f"m{i}": run(variables[f"input{i}"]) for i in range(len(variables))}
+        errors = [
+            {"message": f"Failed to run {alias}", "path": [alias]}
+            for alias, payload in data.items()
+            if payload is None
+        ]
+        if errors:
+            return {"data": data, "errors": errors}
+        return {"data": data}
@@ -45,7 +45,7 @@ def client_with_mock_db(mocker, monkeypatch) -> Generator[ClientWithMockDB, Any,
     from app import create_flask_app
 
     mock_db = mocker.MagicMock()
-    monkeypatch.setattr("app.initialize_psycopg_connection", lambda: mock_db)
+    monkeypatch.setattr("app.initialize_psycopg_connection_pool", lambda: mock_db)
     app = create_flask_app()
     app.config["TESTING"] = True
     app.config["PROPAGATE_EXCEPTIONS"] = True
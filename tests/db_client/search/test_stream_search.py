@@ -0,0 +1,30 @@
+def test_stream_search_with_location_and_record_type(
+    test_data_creator_db_client,
+    live_database_client,
+):
+    tdc = test_data_creator_db_client
+    pa_location_id = live_database_client.get_location_id(
+        where_mappings={
+            "state_name": "Pennsylvania",
+            "county_name": None,
+            "locality_name": None,
+        }
+    )
+    tdc.link_data_source_to_agency(
+        data_source_id=tdc.data_source().id,
+        agency_id=tdc.agency(location_id=pa_location_id).id,
+    )
+
+    results = live_database_client.search_with_location_and_record_type(
+        location_id=pa_location_id
+    )
+    streamed_results = list(
+        live_database_client.stream_search_with_location_and_record_type(
+            location_id=pa_location_id
+        )
+    )
+
+    assert len(streamed_results) > 0
+    assert sorted(streamed_results, key=lambda row: row["id"]) == sorted(
+        results, key=lambda row: row["id"]
+    )
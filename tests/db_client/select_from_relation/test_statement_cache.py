@@ -0,0 +1,30 @@
+from db.client.core import DatabaseClient
+from db.db_client_dataclasses import WhereMapping
+from db.dynamic_query_constructor import SELECTION_QUERY_CACHE
+
+
+def test_select_from_relation_reuses_statement_for_same_shape(
+    live_database_client: DatabaseClient, test_table_data
+):
+    SELECTION_QUERY_CACHE.clear()
+
+    def select_species(species):
+        return live_database_client._select_from_relation(
+            relation_name="test_table",
+            columns=["pet_name"],
+            where_mappings=[WhereMapping(column="species", value=species)],
+        )
+
+    assert select_species("Aardvark") == [{"pet_name": "Arthur"}]
+    assert select_species("Cat") == [{"pet_name": "Jimbo"}]
+    assert select_species(["Cat", "Bear"]) == [
+        {"pet_name": "Jimbo"},
+        {"pet_name": "Simon"},
+    ]
+    assert select_species(None) == []
+
+    stats = SELECTION_QUERY_CACHE.stats()
+    # Differing values share a statement; a list or null value changes its shape
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.size == 3
@@ -6,7 +6,7 @@ import uuid
 
 import pytest
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from db.client.core import DatabaseClient
 from db.db_client_dataclasses import (
@@ -19,6 +19,10 @@ from db.subquery_logic import SubqueryParameterManager
 from db.enums import (
     SortOrder,
     RequestStatus,
+    SubqueryLoadingStrategy,
+)
+from db.models.implementations.core.notification.queue.data_source import (
+    DataSourceUserNotificationQueue,
 )
 from db.models.table_reference import SQL_ALCHEMY_TABLE_REFERENCE
 from middleware.enums import Relations
@@ -241,6 +245,48 @@ def test_get_linked_rows(
     assert results["data"][0]["id"] == ds_info.id
 
 
+@pytest.mark.parametrize(
+    "loading_strategy",
+    [SubqueryLoadingStrategy.SELECTIN, SubqueryLoadingStrategy.JOINED],
+)
+def test_get_data_requests_with_subqueries(
+    test_data_creator_db_client: TestDataCreatorDBClient,
+    loading_strategy: SubqueryLoadingStrategy,
+):
+    """
+    Each data request is returned once with all of its data sources,
+    and limits apply to data requests rather than to joined rows
+    """
+    tdc = test_data_creator_db_client
+    tdc.clear_test_data()
+
+    data_source_ids = {}
+    for _ in range(3):
+        dr_id = tdc.data_request().id
+        data_source_ids[dr_id] = []
+        for _ in range(3):
+            ds_id = tdc.data_source().id
+            tdc.link_data_request_to_data_source(
+                data_request_id=dr_id, data_source_id=ds_id
+            )
+            data_source_ids[dr_id].append(ds_id)
+
+    subquery_parameters = SubqueryParameterManager.data_sources()
+    subquery_parameters.loading_strategy = loading_strategy
+    results = tdc.db_client.get_data_requests(
+        columns=["id"],
+        limit=2,
+        order_by=OrderByParameters(sort_by="id", sort_order=SortOrder.ASCENDING),
+        subquery_parameters=[subquery_parameters],
+    )
+
+    assert len(results) == 2
+    for result in results:
+        assert sorted(ds["id"] for ds in result["data_sources"]) == sorted(
+            data_source_ids[result["id"]]
+        )
+
+
 def test_get_unarchived_data_requests_with_issues(
     test_data_creator_db_client: TestDataCreatorDBClient,
 ):
@@ -356,6 +402,34 @@ def test_get_next_user_events_and_mark_user_events_as_sent(test_data_creator_db_
     assert event_batch is None
 
 
+def test_update_user_notification_queue_skips_queued_events(
+    test_data_creator_db_client,
+):
+    tdc = test_data_creator_db_client
+    tdc.clear_test_data()
+
+    def get_queue_count() -> int:
+        return tdc.db_client.scalar(
+            select(func.count()).select_from(DataSourceUserNotificationQueue)
+        )
+
+    tdc.create_valid_notification_event()
+    tdc.db_client.optionally_update_user_notification_queue()
+    assert get_queue_count() == 1
+
+    # Refreshing again does not duplicate queued events
+    tdc.db_client.optionally_update_user_notification_queue()
+    assert get_queue_count() == 1
+
+    # An incremental refresh only queues events newer than those already queued
+    tdc.create_valid_notification_event()
+    tdc.db_client.optionally_update_user_notification_queue(incremental=True)
+    assert get_queue_count() == 2
+
+    event_batches = tdc.db_client.get_pending_event_batches(limit=10)
+    assert len(event_batches) == 2
+
+
 def test_insert_search_record(test_data_creator_db_client: TestDataCreatorDBClient):
     tdc = test_data_creator_db_client
     user_info = tdc.user()
@@ -468,3 +542,24 @@ def test_insert_search_record(test_data_creator_db_client: TestDataCreatorDBClie
 #
 #     assert len(results) == 1
 #     assert results[0].data_source_name == 'Xylodammerung Police Department Stops'
+
+
+def test_stream_all(live_database_client: DatabaseClient, test_table_data):
+    model = SQL_ALCHEMY_TABLE_REFERENCE["test_table"]
+
+    rows = live_database_client.stream_all(model, batch_size=2)
+
+    assert sorted(row["pet_name"] for row in rows) == ["Arthur", "Jimbo", "Simon"]
+    assert live_database_client.get_all(model) == AnyOrder(
+        live_database_client.execute_raw_sql("SELECT * FROM test_table")
+    )
+
+
+def test_stream_raw_sql(live_database_client: DatabaseClient, test_table_data):
+    rows = live_database_client.stream_raw_sql(
+        "SELECT pet_name FROM test_table WHERE species <> %s ORDER BY pet_name",
+        ("Cat",),
+        batch_size=1,
+    )
+
+    assert list(rows) == [{"pet_name": "Arthur"}, {"pet_name": "Simon"}]
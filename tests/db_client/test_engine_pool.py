@@ -0,0 +1,33 @@
+from sqlalchemy import select
+
+from db.client.core import DatabaseClient
+from db.helpers_.engine import get_pool_metrics, EnginePoolConfig
+
+
+def test_database_clients_share_pooled_engine(live_database_client: DatabaseClient):
+    other_client = DatabaseClient()
+    assert (
+        live_database_client.session_maker.kw["bind"]
+        is other_client.session_maker.kw["bind"]
+    )
+
+    before = get_pool_metrics()
+    for _ in range(3):
+        other_client.scalar(select(1))
+    after = get_pool_metrics()
+
+    assert after["checkouts"] == before["checkouts"] + 3
+    # Connections are reused rather than re-established per session
+    assert after["connects"] <= before["connects"] + 1
+    assert after["checked_out"] == 0
+
+
+def test_engine_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("SQLALCHEMY_POOL_SIZE", "12")
+    monkeypatch.setenv("SQLALCHEMY_POOL_PRE_PING", "false")
+
+    config = EnginePoolConfig.from_env()
+
+    assert config.pool_size == 12
+    assert config.pool_pre_ping is False
+    assert config.max_overflow == EnginePoolConfig().max_overflow
@@ -4,6 +4,8 @@ from sqlalchemy import update
 
 from db.client.core import DatabaseClient
 from db.models.implementations.core.user.core import User
+from middleware.enums import PermissionsEnum
+from middleware.security.api_key.cache import api_key_auth_cache
 from tests.helpers.common_test_data import get_test_name
 
 
@@ -29,3 +31,33 @@ def test_get_user_by_api_key(live_database_client: DatabaseClient):
 
     # Confirm the user_id is retrieved successfully
     assert user_identifiers.id == user_id
+
+
+def test_get_user_identity_by_api_key(live_database_client: DatabaseClient):
+    test_email = get_test_name()
+    user_id = live_database_client.create_new_user(
+        email=test_email,
+        password_digest="test_password",
+    )
+    live_database_client.add_user_permission(
+        user_id=user_id, permission=PermissionsEnum.DB_WRITE
+    )
+    first_key = uuid.uuid4().hex
+    live_database_client.update_user_api_key(api_key=first_key, user_id=user_id)
+
+    identity = live_database_client.get_user_identity_by_api_key(first_key)
+    assert identity.user_id == user_id
+    assert identity.user_email == test_email
+    assert identity.permissions == (PermissionsEnum.DB_WRITE,)
+    assert api_key_auth_cache.get(first_key) == identity
+
+    # Replacing the key invalidates the cached identity for the old key
+    second_key = uuid.uuid4().hex
+    live_database_client.update_user_api_key(api_key=second_key, user_id=user_id)
+    assert api_key_auth_cache.get(first_key) is None
+    assert live_database_client.get_user_identity_by_api_key(first_key) is None
+    assert live_database_client.get_user_identity_by_api_key(second_key) is not None
+
+    # Deleting the user invalidates the cached identity for the new key
+    live_database_client.delete_user(user_id)
+    assert live_database_client.get_user_identity_by_api_key(second_key) is None
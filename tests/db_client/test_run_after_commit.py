@@ -0,0 +1,42 @@
+from sqlalchemy import text
+
+from db.helpers_ import session as sh
+
+
+def test_run_after_commit(live_database_client, test_table_data):
+    visible_pet_counts: list[int] = []
+
+    def count_visible_pets() -> None:
+        # Counted in a separate session, as a concurrent request would see it
+        pets = live_database_client._select_from_relation(
+            relation_name="test_table",
+            columns=["pet_name"],
+        )
+        visible_pet_counts.append(len(pets))
+
+    session = live_database_client.session_maker()
+    try:
+        sh.run_after_commit(session, count_visible_pets)
+        session.execute(text("DELETE FROM test_table WHERE species = 'Cat'"))
+        assert visible_pet_counts == []
+        session.commit()
+        session.commit()
+    finally:
+        session.close()
+
+    # Run once, and only after the deletion is visible to other sessions
+    assert visible_pet_counts == [2]
+
+
+def test_run_after_commit_skips_rollbacks(live_database_client, test_table_data):
+    calls: list[None] = []
+
+    session = live_database_client.session_maker()
+    try:
+        sh.run_after_commit(session, lambda: calls.append(None))
+        session.execute(text("DELETE FROM test_table WHERE species = 'Cat'"))
+        session.rollback()
+    finally:
+        session.close()
+
+    assert calls == []
@@ -0,0 +1,83 @@
+import uuid
+
+import db.client.core
+
+from db.client.core import DatabaseClient
+from db.helpers_.url_index import NormalizedURLIndex, normalized_url_index
+
+
+def test_normalized_url_index():
+    index = NormalizedURLIndex(
+        [
+            (1, "https://www.example.com/"),
+            (2, "http://example.com"),
+            (3, "https://other.com/page"),
+        ]
+    )
+
+    assert index.get_duplicates("example.com") == [
+        "https://www.example.com/",
+        "http://example.com",
+    ]
+    assert index.get_duplicates("https://other.com/page/") == ["https://other.com/page"]
+    assert index.get_duplicates("https://other.com") == []
+    assert "www.example.com" in index
+    assert index.get_existing_urls(["other.com/page", "example.com", "new.com"]) == [
+        "https://other.com/page",
+        "https://www.example.com/",
+        "http://example.com",
+    ]
+
+
+def test_url_index_rebuilt_after_data_source_added(
+    live_database_client: DatabaseClient, monkeypatch
+):
+    monkeypatch.setenv("URL_INDEX_ENABLED", "true")
+    db_client = live_database_client
+    normalized_url_index.clear()
+    url = f"https://{uuid.uuid4().hex}.com/"
+    assert db_client.check_for_url_duplicates(url) == []
+
+    db_client._create_entry_in_table(
+        table_name="data_sources",
+        column_value_mappings={"name": uuid.uuid4().hex, "source_url": url},
+    )
+
+    # Unlike the distinct_source_urls view, the index need not be refreshed
+    assert db_client.check_for_url_duplicates(url.removeprefix("https://")) == [
+        {"original_url": url}
+    ]
+    assert db_client.get_duplicate_urls_bulk([url, "not-a-duplicate.com"]) == [url]
+
+
+def test_url_index_reloaded_after_data_source_update_commits(
+    live_database_client: DatabaseClient, monkeypatch
+):
+    monkeypatch.setenv("URL_INDEX_ENABLED", "true")
+    db_client = live_database_client
+    normalized_url_index.clear()
+    old_url = f"https://{uuid.uuid4().hex}.com/"
+    new_url = f"https://{uuid.uuid4().hex}.com/"
+    data_source_id = db_client._create_entry_in_table(
+        table_name="data_sources",
+        column_value_mappings={"name": uuid.uuid4().hex, "source_url": old_url},
+        column_to_return="id",
+    )
+    assert db_client.check_for_url_duplicates(new_url) == []
+
+    invalidate = db.client.core.invalidate_normalized_url_index
+
+    def invalidate_then_reload() -> None:
+        invalidate()
+        # A concurrent request reloads the index as soon as it is marked stale
+        db_client.check_for_url_duplicates(new_url)
+
+    monkeypatch.setattr(
+        db.client.core, "invalidate_normalized_url_index", invalidate_then_reload
+    )
+    db_client.update_data_source(
+        entry_id=data_source_id,
+        column_edit_mappings={"source_url": new_url},
+    )
+
+    assert db_client.check_for_url_duplicates(new_url) == [{"original_url": new_url}]
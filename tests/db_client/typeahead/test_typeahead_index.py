@@ -0,0 +1,114 @@
+import pytest
+
+from db.client.core import DatabaseClient
+from db.helpers_.typeahead_index.core import TypeaheadIndex, TypeaheadIndexEntry
+from db.helpers_.typeahead_index.manager import (
+    typeahead_locations_index,
+    typeahead_agencies_index,
+)
+from db.helpers_.typeahead_index.trigram import get_trigrams, trigram_similarity
+
+
+def get_entry(name: str) -> TypeaheadIndexEntry:
+    return TypeaheadIndexEntry(
+        search_key=name, sort_key=name, fuzzy_key=name, result={"name": name}
+    )
+
+
+def test_typeahead_index_search():
+    index = TypeaheadIndex(
+        [
+            get_entry(name)
+            for name in ["Alleghenyville", "Allegheny", "New Allegheny", "Bally"]
+        ]
+    )
+
+    # Prefix matches come first, then substring matches, each in sort order
+    assert [r["name"] for r in index.search("alle", page=1)] == [
+        "Allegheny",
+        "Alleghenyville",
+        "New Allegheny",
+    ]
+    assert [r["name"] for r in index.search("ll", page=1)] == [
+        "Allegheny",
+        "Alleghenyville",
+        "Bally",
+        "New Allegheny",
+    ]
+    assert index.search("alle", page=2) == []
+    # Without matches, the closest entries by similarity are returned
+    assert index.search("Bali", page=1)[0]["name"] == "Bally"
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("Pitsburg Allegeny", "Pittsburgh Allegheny Pennsylvania"),
+        ("st. mary's", "Saint Marys"),
+        ("Ünïcode-PA 12", "unicode pa"),
+    ],
+)
+def test_trigram_similarity_matches_pg_trgm(
+    live_database_client: DatabaseClient, a: str, b: str
+):
+    expected = live_database_client.execute_raw_sql(
+        "SELECT similarity(%s, %s) AS similarity", (a, b)
+    )[0]["similarity"]
+    assert trigram_similarity(get_trigrams(a), get_trigrams(b)) == pytest.approx(
+        expected, abs=1e-6
+    )
+
+
+@pytest.mark.parametrize(
+    "search_term, page",
+    [("Pen", 1), ("All", 1), ("a", 1), ("a", 2), ("sylv", 1)],
+)
+def test_typeahead_locations_index_matches_database(
+    live_database_client: DatabaseClient, search_term: str, page: int
+):
+    db_client = live_database_client
+    typeahead_locations_index.clear()
+
+    expected = db_client._get_typeahead_locations_from_database(search_term, page)
+    actual = typeahead_locations_index.get(db_client.execute_raw_sql).search(
+        search_term, page
+    )
+
+    assert [row["location_id"] for row in actual] == [
+        row["location_id"] for row in expected
+    ]
+
+
+def test_typeahead_locations_index_fuzzy_fallback(
+    live_database_client: DatabaseClient,
+):
+    db_client = live_database_client
+    typeahead_locations_index.clear()
+
+    expected = db_client._get_typeahead_locations_from_database("Pensylvana", 1)
+    actual = typeahead_locations_index.get(db_client.execute_raw_sql).search(
+        "Pensylvana", 1
+    )
+
+    # Postgres does not order ties in similarity, so only the best match is compared
+    assert len(actual) == len(expected)
+    assert actual[0]["location_id"] == expected[0]["location_id"]
+
+
+def test_typeahead_agencies_index_rebuilt_on_refresh(
+    live_database_client: DatabaseClient, test_data_creator_db_client, monkeypatch
+):
+    monkeypatch.setenv("TYPEAHEAD_INDEX_ENABLED", "true")
+    db_client = live_database_client
+    db_client.refresh_all_materialized_views()
+    typeahead_agencies_index.clear()
+    assert db_client.get_typeahead_agencies("Xylo", page=1) == []
+
+    agency = test_data_creator_db_client.agency(name="Xylophone Police Agency")
+    # The index is unchanged until the view is refreshed
+    assert db_client.get_typeahead_agencies("Xylo", page=1) == []
+
+    db_client.refresh_materialized_view("typeahead_agencies")
+    results = db_client.get_typeahead_agencies("Xylo", page=1)
+    assert [row["id"] for row in results] == [agency.id]
+    assert results == db_client._get_typeahead_agencies_from_database("Xylo", 1)
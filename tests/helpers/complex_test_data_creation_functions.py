@@ -27,7 +27,3 @@ def create_data_source_entry_for_url_duplicate_checking(
         )
     except psycopg.errors.UniqueViolation:
         pass  # Already added
-    except Exception as e:
-        # Rollback
-        db_client.connection.rollback()
-        raise e
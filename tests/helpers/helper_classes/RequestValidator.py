@@ -71,7 +71,10 @@ from endpoints.schema_config.instantiations.locations.data_requests import (
 from endpoints.schema_config.instantiations.locations.get_many import (
     LocationsGetManyEndpointSchemaConfig,
 )
-from endpoints.schema_config.instantiations.match import MatchAgencyEndpointSchemaConfig
+from endpoints.schema_config.instantiations.match import (
+    MatchAgenciesBatchEndpointSchemaConfig,
+    MatchAgencyEndpointSchemaConfig,
+)
 from endpoints.schema_config.instantiations.metrics.followed_searches.aggregate import (
     MetricsFollowedSearchesAggregateGetEndpointSchemaConfig,
 )
@@ -661,6 +664,7 @@ class RequestValidator:
         sort_order: SortOrder | None = None,
         page: int = 1,
         limit: int = PAGE_SIZE,
+        cursor: str | None = None,
     ):
         params = {}
         update_if_not_none(
@@ -670,6 +674,7 @@ class RequestValidator:
                 "sort_order": sort_order.value if sort_order is not None else None,
                 "page": page,
                 "limit": limit,
+                "cursor": cursor,
             },
         )
 
@@ -725,6 +730,7 @@ class RequestValidator:
         sort_order: SortOrder | None = None,
         page: int = 1,
         limit: int = PAGE_SIZE,
+        cursor: str | None = None,
     ):
         query_params = {}
         update_if_not_none(
@@ -734,6 +740,7 @@ class RequestValidator:
                 "sort_order": sort_order.value if sort_order is not None else None,
                 "page": page,
                 "limit": limit,
+                "cursor": cursor,
             },
         )
 
@@ -784,6 +791,24 @@ class RequestValidator:
             expected_schema=MatchAgencyEndpointSchemaConfig.primary_output_schema,
         )
 
+    def match_agencies_batch(
+        self,
+        headers: dict,
+        entries: list[dict],
+        similarity_threshold: float | None = None,
+    ):
+        data = {"entries": entries}
+        update_if_not_none(
+            dict_to_update=data,
+            secondary_dict={"similarity_threshold": similarity_threshold},
+        )
+        return self.post(
+            endpoint="/match/agencies",
+            headers=headers,
+            json=data,
+            expected_schema=MatchAgenciesBatchEndpointSchemaConfig.primary_output_schema,
+        )
+
     # region Locations
 
     def get_location_by_id(
@@ -0,0 +1,77 @@
+import base64
+import json
+from http import HTTPStatus
+from itertools import product
+
+from db.enums import SortOrder
+from tests.helpers.constants import AGENCIES_BASE_ENDPOINT
+from tests.helpers.helper_classes.test_data_creator.flask import TestDataCreatorFlask
+
+
+def test_agencies_get_cursor(test_data_creator_flask: TestDataCreatorFlask):
+    """
+    Test that walking GET /agencies by cursor returns every agency once,
+    in the same order as a single unpaginated request
+    """
+    tdc = test_data_creator_flask
+    tus = tdc.standard_user()
+    for _ in range(12):
+        tdc.tdcdb.agency()
+
+    for sort_by, sort_order in product(
+        ("name", "created_at"), (SortOrder.ASCENDING, SortOrder.DESCENDING)
+    ):
+        expected = tdc.request_validator.get_agency(
+            headers=tus.api_authorization_header,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=1000,
+        )["data"]
+
+        crawled = []
+        cursor = None
+        while True:
+            response_json = tdc.request_validator.get_agency(
+                headers=tus.api_authorization_header,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=5,
+                cursor=cursor,
+            )
+            crawled.extend(response_json["data"])
+            cursor = response_json["metadata"]["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [row["id"] for row in crawled] == [row["id"] for row in expected]
+
+
+def test_agencies_get_invalid_cursor(test_data_creator_flask: TestDataCreatorFlask):
+    """
+    Test that GET /agencies rejects malformed and tampered cursors as bad requests
+    """
+    tdc = test_data_creator_flask
+    tus = tdc.standard_user()
+
+    def encode(payload) -> str:
+        return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode(
+            "ascii"
+        )
+
+    for invalid_cursor in (
+        "not-a-cursor",
+        encode({"v": ["garbage"]}),
+        # Well-formed, but with a sort value that is not a timestamp
+        encode([["created_at", False], "garbage", 1]),
+        encode([["created_at", False], ["garbage"], 1]),
+    ):
+        tdc.request_validator.get(
+            endpoint=AGENCIES_BASE_ENDPOINT,
+            query_parameters={
+                "sort_by": "created_at",
+                "sort_order": SortOrder.ASCENDING.value,
+                "cursor": invalid_cursor,
+            },
+            headers=tus.api_authorization_header,
+            expected_response_status=HTTPStatus.BAD_REQUEST,
+        )
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+from itertools import product
+
+from db.enums import SortOrder
+from tests.helpers.constants import DATA_SOURCES_BASE_ENDPOINT
+from tests.helpers.helper_classes.test_data_creator.db_client_.core import (
+    TestDataCreatorDBClient,
+)
+from tests.helpers.helper_classes.test_data_creator.flask import (
+    TestDataCreatorFlask,
+)
+
+
+def test_data_sources_get_cursor(
+    test_data_creator_flask: TestDataCreatorFlask,
+    test_data_creator_db_client: TestDataCreatorDBClient,
+):
+    """
+    Test that walking GET /data-sources by cursor returns every data source once,
+    in the same order as a single unpaginated request
+    """
+    tdc = test_data_creator_flask
+    tus = tdc.standard_user()
+    for _ in range(12):
+        test_data_creator_db_client.data_source()
+
+    # `coverage_start` is null for the created data sources, so ties are broken by ID
+    for sort_by, sort_order in product(
+        ("name", "coverage_start"), (SortOrder.ASCENDING, SortOrder.DESCENDING)
+    ):
+        expected = tdc.request_validator.get_data_sources(
+            headers=tus.api_authorization_header,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=1000,
+        )["data"]
+
+        crawled = []
+        cursor = None
+        while True:
+            response_json = tdc.request_validator.get_data_sources(
+                headers=tus.api_authorization_header,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=5,
+                cursor=cursor,
+            )
+            crawled.extend(response_json["data"])
+            cursor = response_json["metadata"]["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [row["id"] for row in crawled] == [row["id"] for row in expected]
+
+    # Cursors are only valid for the ordering they were produced under
+    cursor = tdc.request_validator.get_data_sources(
+        headers=tus.api_authorization_header,
+        sort_by="name",
+        sort_order=SortOrder.ASCENDING,
+        limit=5,
+    )["metadata"]["next_cursor"]
+    for invalid_cursor in (cursor[:-4], "not-a-cursor"):
+        tdc.request_validator.get(
+            endpoint=DATA_SOURCES_BASE_ENDPOINT,
+            query_parameters={
+                "sort_by": "name",
+                "sort_order": SortOrder.DESCENDING.value,
+                "cursor": invalid_cursor,
+            },
+            headers=tus.api_authorization_header,
+            expected_response_status=HTTPStatus.BAD_REQUEST,
+        )
@@ -1,10 +1,16 @@
+from typing import Optional
+
 from db.enums import RequestStatus
 from db.models.implementations.core.data_request.core import DataRequest
 from db.models.implementations.core.data_request.github_issue_info import (
     DataRequestsGithubIssueInfo,
 )
 from middleware.enums import RecordTypesEnum
-from middleware.third_party_interaction_logic.github.issue_info import GithubIssueInfo
+from middleware.third_party_interaction_logic.github.issue_info import (
+    ExistingGithubIssueInfo,
+    GithubIssueInfo,
+    NewGithubIssueInfo,
+)
 from middleware.third_party_interaction_logic.github.issue_project_info.core import (
     GithubIssueProjectInfo,
 )
@@ -54,6 +60,28 @@ class TestSynchronizeGithubIssueHappyPathManager:
                     number=issue_count,
                 )
 
+            def get_recent_issues(self) -> list[ExistingGithubIssueInfo]:
+                return []
+
+            def create_issues(
+                self, new_issues: list[NewGithubIssueInfo]
+            ) -> tuple[list[Optional[GithubIssueInfo]], list[dict]]:
+                issues = [
+                    self.create_issue_with_status(
+                        title=new_issue.title,
+                        body=new_issue.body,
+                        status=RequestStatus.READY_TO_START,
+                        record_types=new_issue.record_types,
+                    )
+                    for new_issue in new_issues
+                ]
+                return issues, []
+
+            def assign_issues_to_project_with_status(
+                self, issues: list[GithubIssueInfo], status: RequestStatus
+            ) -> list[dict]:
+                return []
+
         monkeypatch_.setattr(
             f"{PATCH_ROOT}.GithubIssueManager",
             MockGithubIssueManager,
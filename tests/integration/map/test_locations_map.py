@@ -0,0 +1,64 @@
+"""Integration tests for /map/locations endpoint"""
+
+import gzip
+import json
+
+from tests.helpers.helper_classes.test_data_creator.flask import (
+    TestDataCreatorFlask,
+)
+
+
+def test_locations_map_etag_and_gzip(test_data_creator_flask: TestDataCreatorFlask):
+    tdcf = test_data_creator_flask
+    tus = tdcf.standard_user()
+    client = tdcf.flask_client
+    tdcf.db_client.refresh_all_materialized_views()
+
+    response = client.get("/map/locations", headers=tus.api_authorization_header)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    data = response.json
+    assert set(data.keys()) == {"localities", "counties", "states"}
+
+    # Revalidating with the current ETag returns no body
+    response = client.get(
+        "/map/locations",
+        headers={**tus.api_authorization_header, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.data == b""
+
+    # Clients accepting gzip receive the same payload compressed
+    response = client.get(
+        "/map/locations",
+        headers={**tus.api_authorization_header, "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == data
+
+
+def test_locations_map_rebuilt_on_refresh(
+    test_data_creator_flask: TestDataCreatorFlask,
+):
+    tdcf = test_data_creator_flask
+    tus = tdcf.standard_user()
+    client = tdcf.flask_client
+    tdcf.db_client.refresh_all_materialized_views()
+
+    response = client.get("/map/locations", headers=tus.api_authorization_header)
+    etag = response.headers["ETag"]
+
+    # Adding a data source for a new locality changes the payload once views refresh
+    location_id = tdcf.tdcdb.locality()
+    agency_id = tdcf.tdcdb.agency(location_id=location_id).id
+    tdcf.tdcdb.link_data_source_to_agency(
+        data_source_id=tdcf.tdcdb.data_source().id,
+        agency_id=agency_id,
+    )
+    response = client.get("/map/locations", headers=tus.api_authorization_header)
+    assert response.headers["ETag"] == etag
+
+    tdcf.db_client.refresh_all_materialized_views()
+    response = client.get("/map/locations", headers=tus.api_authorization_header)
+    assert response.headers["ETag"] != etag
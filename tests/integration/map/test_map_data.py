@@ -1,24 +1,43 @@
+from endpoints.instantiations.map.data.schema_config import (
+    LocationsDataEndpointSchemaConfig,
+)
 from tests.helpers.helper_classes.test_data_creator.flask import TestDataCreatorFlask
 
 
 def test_map_data(test_data_creator_flask: TestDataCreatorFlask, pittsburgh_id) -> None:
-    # TODO: Incomplete
-    pass
-    # tdc = test_data_creator_flask
-    # rv = tdc.request_validator
-    #
-    # agency_id = tdc.agency(location_ids=[pittsburgh_id]).id
-    # data_source_id = tdc.data_source().id
-    # tdc.link_data_source_to_agency(
-    #     data_source_id=data_source_id, agency_id=agency_id
-    # )
-    # tdc.db_client.refresh_all_materialized_views()
-    #
-    #
-    # tus = tdc.standard_user()
-    # response = rv.get(
-    #     endpoint="/map/data",
-    #     headers=tus.api_authorization_header,
-    #     expected_schema=LocationsDataEndpointSchemaConfig.primary_output_schema
-    # )
-    # print(response)
+    tdc = test_data_creator_flask
+    tdcdb = tdc.tdcdb
+
+    # Local data sources are counted by location
+    tdcdb.link_data_source_to_agency(
+        data_source_id=tdcdb.data_source().id,
+        agency_id=tdcdb.agency(location_id=pittsburgh_id).id,
+    )
+    # Federal data sources are listed individually
+    federal_data_source = tdcdb.data_source()
+    tdcdb.link_data_source_to_agency(
+        data_source_id=federal_data_source.id,
+        agency_id=tdcdb.agency().id,
+    )
+    tdc.db_client.refresh_all_materialized_views()
+
+    tus = tdc.standard_user()
+    data = tdc.request_validator.get(
+        endpoint="/map/data",
+        headers=tus.api_authorization_header,
+        expected_schema=LocationsDataEndpointSchemaConfig.primary_output_schema,
+    )
+
+    assert federal_data_source.id in [source["source_id"] for source in data["sources"]]
+    # Locations match the rows of the underlying materialized views,
+    # with empty views given as empty lists
+    db_client = tdc.db_client
+    expected_locations = {
+        "localities": db_client.get_map_localities(),
+        "counties": db_client.get_map_counties(),
+        "states": db_client.get_map_states(),
+    }
+    for key, expected in expected_locations.items():
+        assert sorted(
+            data["locations"][key], key=lambda row: row["location_id"]
+        ) == sorted(expected or [], key=lambda row: row["location_id"])
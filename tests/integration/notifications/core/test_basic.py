@@ -75,7 +75,10 @@ def test_notifications_followed_searches(
     sent_event_batches = [call_.kwargs["event_batch"] for call_ in calls]
     assert len(sent_event_batches) == 2
 
-    assert sent_event_batches == preview_event_batches
+    # Batches are sent concurrently, so may be sent in any order
+    assert sorted(sent_event_batches, key=lambda batch: batch.user_id) == sorted(
+        preview_event_batches, key=lambda batch: batch.user_id
+    )
 
     checker = EventBatchChecker(sent_event_batches)
     checker.check_user(every_event_type_user_info)
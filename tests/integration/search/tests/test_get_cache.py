@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from endpoints.instantiations.search.core.queries.core import SearchQueryBuilder
+from tests.integration.search.search_test_setup import SearchTestSetup
+from utilities.enums import RecordCategoryEnum
+
+
+def test_search_get_cache(search_test_setup: SearchTestSetup):
+    """
+    Repeated searches are served from the cache,
+    until a data source is linked to an agency in the searched location.
+    """
+    sts = search_test_setup
+    tdc = sts.tdc
+    tdcdb = tdc.tdcdb
+
+    def search() -> dict:
+        return tdc.request_validator.search(
+            headers=sts.tus.api_authorization_header,
+            location_id=sts.location_id,
+            record_categories=[RecordCategoryEnum.POLICE],
+        )
+
+    agency_id = tdcdb.agency(location_id=sts.location_id).id
+    initial_count = search()["count"]
+
+    with patch.object(SearchQueryBuilder, "run") as mock_run:
+        assert search()["count"] == initial_count
+    mock_run.assert_not_called()
+
+    tdcdb.link_data_source_to_agency(
+        data_source_id=tdcdb.data_source().id,
+        agency_id=agency_id,
+    )
+
+    assert search()["count"] == initial_count + 1
@@ -0,0 +1,35 @@
+import csv
+from io import StringIO
+
+from tests.integration.search.constants import ENDPOINT_SEARCH_LOCATION_AND_RECORD_TYPE
+from tests.integration.search.search_test_setup import SearchTestSetup
+from utilities.enums import RecordCategoryEnum
+
+
+def test_search_get_csv(search_test_setup: SearchTestSetup):
+    sts = search_test_setup
+    tdc = sts.tdc
+    tdcdb = tdc.tdcdb
+
+    data_source = tdcdb.data_source()
+    tdcdb.link_data_source_to_agency(
+        data_source_id=data_source.id,
+        agency_id=tdcdb.agency(location_id=sts.location_id).id,
+    )
+
+    response = tdc.flask_client.get(
+        ENDPOINT_SEARCH_LOCATION_AND_RECORD_TYPE,
+        query_string={
+            "location_id": sts.location_id,
+            "record_categories": RecordCategoryEnum.POLICE.value,
+            "output_format": "csv",
+        },
+        headers=sts.tus.api_authorization_header,
+    )
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Disposition"].startswith("attachment")
+
+    rows = list(csv.DictReader(StringIO(response.get_data(as_text=True))))
+    assert data_source.name in [row["data_source_name"] for row in rows]
@@ -128,4 +128,34 @@ def test_agency_match_no_match(match_agency_setup: TestMatchAgencySetup):
     assert data["status"] == AgencyMatchStatus.NO_MATCH.value
 
 
+def test_agency_match_batch(match_agency_setup: TestMatchAgencySetup):
+    mas = match_agency_setup
+    location = {
+        "state": mas.location_kwargs["state_name"],
+        "county": mas.location_kwargs["county_name"],
+        "locality": mas.location_kwargs["locality_name"],
+    }
+
+    data = mas.tdc.request_validator.match_agencies_batch(
+        headers=mas.jwt_authorization_header,
+        entries=[
+            {"name": mas.agency_name, **location},
+            {"name": mas.agency_name + "1"},
+            {"name": mas.agency_name, "state": "New York", "locality": get_test_name()},
+            {"name": "zzzz"},
+        ],
+    )
+
+    statuses = [result["status"] for result in data["results"]]
+    assert statuses == [
+        AgencyMatchStatus.EXACT.value,
+        AgencyMatchStatus.PARTIAL.value,
+        AgencyMatchStatus.NO_MATCH.value,
+        AgencyMatchStatus.NO_MATCH.value,
+    ]
+    assert data["results"][0]["agencies"][0]["name"] == mas.agency_name
+    assert data["results"][1]["agencies"][0]["name"] == mas.agency_name
+    assert all(agency["similarity"] >= 0.3 for agency in data["results"][1]["agencies"])
+
+
 # region Test Full Integration
@@ -1,6 +1,10 @@
 import datetime
+import threading
 
 from db.enums import SortOrder
+from db.queries.instantiations.metrics.followed_searches.refresh import (
+    RefreshMetricsFollowedSearchesBreakdownQueryBuilder,
+)
 from middleware.schema_and_dto.dtos.metrics import (
     MetricsFollowedSearchesBreakdownRequestDTO,
 )
@@ -16,6 +20,22 @@ from tests.helpers.helper_classes.test_data_creator.flask import (
 )
 
 
+def test_metrics_summary(test_data_creator_flask: TestDataCreatorFlask):
+    tdc = test_data_creator_flask
+    tdc.db_client.refresh_metrics_summary()
+    headers = tdc.get_admin_tus().jwt_authorization_header
+
+    data = tdc.request_validator.get_metrics(headers=headers)
+
+    # Counts are served from the summary until it is next refreshed
+    tdc.data_source()
+    assert tdc.request_validator.get_metrics(headers=headers) == data
+
+    tdc.db_client.refresh_metrics_summary()
+    refreshed_data = tdc.request_validator.get_metrics(headers=headers)
+    assert refreshed_data["source_count"] == data["source_count"] + 1
+
+
 def test_metrics_followed_searches_breakdown(
     test_data_creator_flask: TestDataCreatorFlask, monkeypatch, pittsburgh_id: int
 ):
@@ -23,6 +43,7 @@ def test_metrics_followed_searches_breakdown(
 
     tdc = test_data_creator_flask
     last_notification_datetime = tdc.tdcdb.notification_log()
+    tdc.db_client.refresh_metrics_followed_searches_breakdown()
 
     data = tdc.request_validator.get_metrics_followed_searches_breakdown(
         headers=tdc.get_admin_tus().jwt_authorization_header,
@@ -57,6 +78,7 @@ def test_metrics_followed_searches_breakdown(
         entry_id=int(mfs.mus.user_3.user_info.user_id),
         column_edit_mappings={"created_at": pre_notification_datetime},
     )
+    tdc.db_client.refresh_metrics_followed_searches_breakdown()
 
     data = tdc.request_validator.get_metrics_followed_searches_breakdown(
         headers=tdc.get_admin_tus().jwt_authorization_header,
@@ -200,3 +222,70 @@ def test_metrics_followed_searches_breakdown(
 #     assert data["last_notification_date"] == last_notification_datetime.strftime(
 #         DATE_FORMAT
 #     )
+
+
+def test_metrics_followed_searches_breakdown_refreshed_on_follow(
+    test_data_creator_flask: TestDataCreatorFlask, pittsburgh_id: int
+):
+    tdc = test_data_creator_flask
+    tdc.tdcdb.notification_log()
+    tdc.db_client.refresh_metrics_followed_searches_breakdown()
+    user = tdc.tdcdb.user()
+
+    def get_results() -> list[dict]:
+        data = tdc.request_validator.get_metrics_followed_searches_breakdown(
+            headers=tdc.get_admin_tus().jwt_authorization_header,
+            dto=MetricsFollowedSearchesBreakdownRequestDTO(),
+        )
+        return data["results"]
+
+    def get_total_followed_searches() -> int:
+        data = tdc.request_validator.get_metrics_followed_searches_aggregate(
+            headers=tdc.get_admin_tus().jwt_authorization_header,
+        )
+        return data["total_followed_searches"]
+
+    total_followed_searches = get_total_followed_searches()
+
+    # Following and unfollowing refresh only the followed location
+    tdc.tdcdb.user_follow_location(user_id=user.id, location_id=pittsburgh_id)
+    results = get_results()
+    assert len(results) == 1
+    assert results[0]["location_id"] == pittsburgh_id
+    assert results[0]["follower_count"] == 1
+    assert results[0]["follower_change"] == 1
+    # The aggregate agrees with the breakdown
+    assert get_total_followed_searches() == total_followed_searches + 1
+
+    tdc.db_client.delete_followed_search(user_id=user.id, location_id=pittsburgh_id)
+    assert get_results() == []
+
+
+def test_follow_not_blocked_by_uncommitted_breakdown_refresh(
+    test_data_creator_flask: TestDataCreatorFlask, pittsburgh_id: int
+):
+    tdc = test_data_creator_flask
+    tdc.tdcdb.notification_log()
+    user = tdc.tdcdb.user()
+
+    # A full refresh which has not yet committed, as from the scheduled job
+    session = tdc.db_client.session_maker()
+    try:
+        RefreshMetricsFollowedSearchesBreakdownQueryBuilder().build(session)
+
+        follow = threading.Thread(
+            target=tdc.db_client.create_followed_search,
+            kwargs={"user_id": user.id, "location_id": pittsburgh_id},
+        )
+        follow.start()
+        follow.join(timeout=10)
+        assert not follow.is_alive()
+    finally:
+        session.rollback()
+        session.close()
+
+    data = tdc.request_validator.get_metrics_followed_searches_breakdown(
+        headers=tdc.get_admin_tus().jwt_authorization_header,
+        dto=MetricsFollowedSearchesBreakdownRequestDTO(),
+    )
+    assert [result["location_id"] for result in data["results"]] == [pittsburgh_id]
@@ -1,4 +1,5 @@
 from middleware.primary_resource_logic.unique_url_checker import (
+    UniqueURLBatchCheckerResponseOuterSchema,
     UniqueURLCheckerResponseOuterSchema,
 )
 from tests.helpers.complex_test_data_creation_functions import (
@@ -52,3 +53,30 @@ def test_unique_url_checker(test_data_creator_flask: TestDataCreatorFlask):
             expected_schema=UniqueURLCheckerResponseOuterSchema,
             headers=header,
         )
+
+
+def test_unique_url_batch_checker(test_data_creator_flask: TestDataCreatorFlask):
+    tdc = test_data_creator_flask
+    create_data_source_entry_for_url_duplicate_checking(tdc.db_client)
+
+    urls = [
+        "https://www.duplicate-checker.com",
+        "https://not-a-duplicate.com",
+        "http://duplicate-checker.com/",
+    ]
+    duplicates = [{"original_url": "https://duplicate-checker.com/"}]
+    run_and_validate_request(
+        flask_client=tdc.flask_client,
+        http_method="post",
+        endpoint="check/unique-url/batch",
+        json={"urls": urls},
+        expected_json_content={
+            "results": [
+                {"url": urls[0], "duplicates": duplicates},
+                {"url": urls[1], "duplicates": []},
+                {"url": urls[2], "duplicates": duplicates},
+            ]
+        },
+        expected_schema=UniqueURLBatchCheckerResponseOuterSchema,
+        headers=tdc.get_admin_tus().api_authorization_header,
+    )
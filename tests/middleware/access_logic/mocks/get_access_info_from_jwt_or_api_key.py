@@ -4,7 +4,7 @@ from tests.helpers.DynamicMagicMock import DynamicMagicMock
 
 
 class GetAccessInfoFromJWTOrAPIKeyMocks(DynamicMagicMock):
-    get_user_email_from_api_key: MagicMock
+    get_user_identity_from_api_key: MagicMock
     get_jwt_identity: MagicMock
     AccessInfo: MagicMock
     get_user_permissions: MagicMock
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from middleware.enums import AccessTypeEnum, PermissionsEnum
+from middleware.security.access_info.context import set_request_access_info
+from middleware.security.access_info.primary import AccessInfoPrimary
+from middleware.security.api_key.cache import ApiKeyIdentity
+from middleware.security.auth.method_config.handlers import api_key_handler
+
+PATCH_ROOT = "middleware.security.auth.method_config.handlers"
+
+
+def test_api_key_handler_resolves_full_identity(monkeypatch):
+    monkeypatch.setattr(
+        f"{PATCH_ROOT}.get_user_identity_from_api_key",
+        MagicMock(
+            return_value=ApiKeyIdentity(
+                user_id=1,
+                user_email="test_email",
+                permissions=(PermissionsEnum.DB_WRITE,),
+            )
+        ),
+    )
+
+    access_info = api_key_handler(token="test_token")
+
+    assert access_info.access_type == AccessTypeEnum.API_KEY
+    assert access_info.user_email == "test_email"
+    assert access_info.user_id == 1
+    assert access_info.permissions == [PermissionsEnum.DB_WRITE]
+
+
+def test_api_key_handler_invalid_key(monkeypatch):
+    monkeypatch.setattr(
+        f"{PATCH_ROOT}.get_user_identity_from_api_key",
+        MagicMock(return_value=None),
+    )
+
+    assert api_key_handler(token="test_token") is None
+
+
+def test_get_user_id_uses_request_access_info(monkeypatch):
+    mock_database_client = MagicMock()
+    monkeypatch.setattr(
+        "middleware.security.access_info.primary.DatabaseClient",
+        mock_database_client,
+    )
+    with Flask(__name__).test_request_context():
+        set_request_access_info(
+            AccessInfoPrimary(
+                user_email="test_email",
+                user_id=1,
+                access_type=AccessTypeEnum.JWT,
+            )
+        )
+        access_info = AccessInfoPrimary(
+            user_email="test_email",
+            access_type=AccessTypeEnum.JWT,
+        )
+
+        assert access_info.get_user_id() == 1
+
+    mock_database_client.assert_not_called()
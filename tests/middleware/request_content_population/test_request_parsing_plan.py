@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.core import (
+    populate_schema_with_request_content,
+)
+from middleware.schema_and_dto.dynamic.schema.request_content_population_.plan import (
+    get_request_parsing_plan,
+)
+from middleware.schema_and_dto.dtos.typeahead import TypeaheadDTO
+from middleware.schema_and_dto.schemas.typeahead.request import TypeaheadQuerySchema
+from tests.middleware.request_content_population.data import (
+    ExampleNestedSchema,
+    ExampleSchema,
+    ExampleDTOWithEnum,
+)
+from tests.middleware.request_content_population.populate_with_request_content.schema.constants import (
+    PATCH_ROOT,
+)
+from utilities.enums import SourceMappingEnum
+
+
+def test_request_parsing_plan_cached_per_schema_shape():
+    plan = get_request_parsing_plan(ExampleNestedSchema())
+
+    assert get_request_parsing_plan(ExampleNestedSchema()) is plan
+    assert plan.fields_by_source == {
+        SourceMappingEnum.JSON: frozenset({"example_dto_with_enum", "example_dto"})
+    }
+    assert plan.nested_dto_info_list[0].key == "example_dto_with_enum"
+    assert plan.nested_dto_info_list[0].class_ == ExampleDTOWithEnum
+
+    # Schemas limited to some of their fields get their own plan
+    partial_plan = get_request_parsing_plan(ExampleSchema(only=["example_string"]))
+    assert partial_plan.fields_by_source == {
+        SourceMappingEnum.JSON: frozenset({"example_string"})
+    }
+    assert get_request_parsing_plan(ExampleSchema()) is not partial_plan
+
+
+def test_populate_schema_with_request_content_without_dto_validation(monkeypatch):
+    monkeypatch.setattr(
+        f"{PATCH_ROOT}._get_data_from_sources",
+        MagicMock(return_value={"query": "Pitt", "page": "2"}),
+    )
+
+    dto = populate_schema_with_request_content(
+        schema=TypeaheadQuerySchema(), dto_class=TypeaheadDTO, validate_dto=False
+    )
+
+    assert isinstance(dto, TypeaheadDTO)
+    assert dto.query == "Pitt"
+    # The schema has already converted the page to an integer
+    assert dto.page == 2
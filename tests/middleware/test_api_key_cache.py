@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+from middleware.enums import PermissionsEnum
+from middleware.security.api_key.cache import ApiKeyAuthCache, ApiKeyIdentity
+
+PATCH_ROOT = "db.helpers_.lru_cache"
+
+
+def get_identity(user_id: int) -> ApiKeyIdentity:
+    return ApiKeyIdentity(
+        user_id=user_id,
+        user_email=f"user_{user_id}@example.com",
+        permissions=(PermissionsEnum.READ_ALL_USER_INFO,),
+    )
+
+
+def test_api_key_cache_get_and_set():
+    cache = ApiKeyAuthCache()
+    assert cache.get("hash_1") is None
+
+    identity = get_identity(1)
+    cache.set("hash_1", identity)
+
+    assert cache.get("hash_1") == identity
+
+
+def test_api_key_cache_expires_entries():
+    cache = ApiKeyAuthCache(ttl_seconds=10)
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=100):
+        cache.set("hash_1", get_identity(1))
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=105):
+        assert cache.get("hash_1") is not None
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=111):
+        assert cache.get("hash_1") is None
+    assert len(cache) == 0
+
+
+def test_api_key_cache_evicts_least_recently_used():
+    cache = ApiKeyAuthCache(max_size=2)
+    cache.set("hash_1", get_identity(1))
+    cache.set("hash_2", get_identity(2))
+    # Touch the first entry so the second becomes least recently used
+    cache.get("hash_1")
+    cache.set("hash_3", get_identity(3))
+
+    assert cache.get("hash_1") is not None
+    assert cache.get("hash_2") is None
+    assert cache.get("hash_3") is not None
+
+
+def test_api_key_cache_invalidate_user():
+    cache = ApiKeyAuthCache()
+    cache.set("hash_1", get_identity(1))
+    cache.set("hash_2", get_identity(2))
+
+    cache.invalidate_user(1)
+
+    assert cache.get("hash_1") is None
+    assert cache.get("hash_2") is not None
+
+
+def test_api_key_cache_drops_identities_looked_up_before_invalidation():
+    cache = ApiKeyAuthCache()
+    generation = cache.generation
+    # The user's key is revoked while their identity is being looked up
+    cache.invalidate_user(1)
+    cache.set("hash_1", get_identity(1), generation=generation)
+
+    assert cache.get("hash_1") is None
@@ -3,7 +3,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from db.enums import RelationRoleEnum
+from db.enums import ColumnPermissionEnum, RelationRoleEnum
+from middleware.column_permission.core import get_invalid_columns, get_permitted_columns
+from middleware.column_permission.matrix import COLUMN_PERMISSION_MATRIX
 from middleware.security.access_info.primary import AccessInfoPrimary
 from middleware.security.access_info.helpers import get_relation_role
 from middleware.column_permission.relation_role_parameters import RelationRoleParameters
@@ -78,3 +80,139 @@ def test_get_relation_role_parameters_no_override(
     mock_relation_role_function_with_params.execute.assert_called_with(
         access_info=mock_access_info
     )
+
+
+@pytest.mark.parametrize(
+    "relation, role, user_permission, expected_columns",
+    (
+        (
+            "data_requests",
+            RelationRoleEnum.OWNER,
+            ColumnPermissionEnum.WRITE,
+            [
+                "submission_notes",
+                "coverage_range",
+                "data_requirements",
+                "request_urgency",
+                "title",
+            ],
+        ),
+        (
+            "data_requests",
+            RelationRoleEnum.STANDARD,
+            ColumnPermissionEnum.READ,
+            [
+                "id",
+                "submission_notes",
+                "request_status",
+                "date_created",
+                "date_status_last_changed",
+                "record_types_required",
+                "pdap_response",
+                "coverage_range",
+                "data_requirements",
+                "request_urgency",
+                "title",
+                "github_issue_number",
+                "github_issue_url",
+            ],
+        ),
+        (
+            "data_requests",
+            RelationRoleEnum.ADMIN,
+            ColumnPermissionEnum.WRITE,
+            [
+                "submission_notes",
+                "request_status",
+                "archive_reason",
+                "internal_notes",
+                "record_types_required",
+                "pdap_response",
+                "coverage_range",
+                "data_requirements",
+                "request_urgency",
+                "title",
+                "github_issue_number",
+                "github_issue_url",
+            ],
+        ),
+        ("data_requests", RelationRoleEnum.STANDARD, ColumnPermissionEnum.WRITE, []),
+        (
+            "agencies",
+            RelationRoleEnum.ADMIN,
+            ColumnPermissionEnum.READ,
+            [
+                "name",
+                "submitted_name",
+                "homepage_url",
+                "jurisdiction_type",
+                "lat",
+                "lng",
+                "defunct_year",
+                "agency_type",
+                "multi_agency",
+                "no_web_presence",
+                "airtable_agency_last_modified",
+                "approval_status",
+                "rejection_reason",
+                "last_approval_editor",
+                "submitter_contact",
+                "agency_created",
+                "county_airtable_uid",
+                "location_id",
+                "id",
+            ],
+        ),
+        (
+            "agencies",
+            RelationRoleEnum.ADMIN,
+            ColumnPermissionEnum.WRITE,
+            [
+                "name",
+                "submitted_name",
+                "homepage_url",
+                "jurisdiction_type",
+                "lat",
+                "lng",
+                "defunct_year",
+                "agency_type",
+                "multi_agency",
+                "no_web_presence",
+                "approval_status",
+                "rejection_reason",
+                "last_approval_editor",
+                "submitter_contact",
+                "location_id",
+            ],
+        ),
+        ("agencies", RelationRoleEnum.STANDARD, ColumnPermissionEnum.NONE, []),
+        # Roles absent from a relation's mapping have no permissions
+        ("agencies_expanded", RelationRoleEnum.OWNER, ColumnPermissionEnum.READ, []),
+    ),
+)
+def test_get_permitted_columns(
+    relation: str,
+    role: RelationRoleEnum,
+    user_permission: ColumnPermissionEnum,
+    expected_columns: list[str],
+):
+    assert (
+        get_permitted_columns(
+            relation=relation, role=role, user_permission=user_permission
+        )
+        == expected_columns
+    )
+
+
+def test_permitted_columns_get_invalid_columns():
+    permitted_columns = COLUMN_PERMISSION_MATRIX.get(
+        relation="agencies_expanded",
+        role=RelationRoleEnum.STANDARD,
+        user_permission=ColumnPermissionEnum.WRITE,
+    )
+    assert permitted_columns.columns == ()
+    assert permitted_columns.get_invalid_columns(["name", "id"]) == ["name", "id"]
+    assert get_invalid_columns(
+        requested_columns=["id", "not_a_column", "name"],
+        permitted_columns=["name", "id"],
+    ) == ["not_a_column"]
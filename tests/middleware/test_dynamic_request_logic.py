@@ -85,7 +85,9 @@ def test_get_by_id(monkeypatch):
         f"{PATCH_ROOT}.get.by_id.get_permitted_columns",
         mock.get_permitted_columns,
     )
-    monkeypatch.setattr(f"{PATCH_ROOT}.get.by_id.check_for_id", mock.check_for_id)
+    monkeypatch.setattr(
+        f"{PATCH_ROOT}.get.by_id.raise_if_not_found", mock.raise_if_not_found
+    )
     id_info = IDInfo(id_column_value=mock.id, id_column_name=mock.id_column_name)
     monkeypatch.setattr(
         f"{PATCH_ROOT}.get.by_id.IDInfo", MagicMock(return_value=id_info)
@@ -97,10 +99,6 @@ def test_get_by_id(monkeypatch):
         relation_role_parameters=mock.relation_role_parameters,
     )
 
-    mock.check_for_id.assert_called_once_with(
-        db_client=mock.mp.db_client, table_name=mock.mp.relation, id_info=id_info
-    )
-
     mock.relation_role_parameters.get_relation_role_from_parameters.assert_called_once_with(
         access_info=mock.mp.access_info
     )
@@ -119,6 +117,10 @@ def test_get_by_id(monkeypatch):
         subquery_parameters=mock.mp.subquery_parameters,
     )
 
+    mock.raise_if_not_found.assert_called_once_with(
+        results=mock.mp.db_client_method.return_value, id_info=id_info
+    )
+
     mock.results_dependent_response.assert_called_once_with(
         mock.mp.entry_name, mock.mp.db_client_method.return_value
     )
@@ -282,6 +284,59 @@ def test_delete_entry(monkeypatch):
     assert result == mock.message_response.return_value
 
 
+def test_delete_entry_by_id(monkeypatch):
+    mock = MagicMock()
+    multi_monkeypatch(
+        monkeypatch,
+        patch_root=f"{PATCH_ROOT}.delete",
+        mock=mock,
+        functions_to_patch=["check_for_id", "message_response"],
+    )
+    id_info = IDInfo(id_column_value=1)
+
+    result = delete_entry(middleware_parameters=mock.mp, id_info=id_info)
+
+    # Existence is checked by the delete itself, rather than by a separate lookup
+    mock.check_for_id.assert_not_called()
+    mock.mp.db_client_method.assert_called_once_with(
+        mock.mp.db_client, id_column_name="id", id_column_value=1
+    )
+    assert result == mock.message_response.return_value
+
+
+def test_delete_entry_by_id_not_found(monkeypatch):
+    mock = MagicMock()
+    mock.mp.db_client_method.return_value = 0
+
+    with pytest.raises(NotFound):
+        delete_entry(middleware_parameters=mock.mp, id_info=IDInfo(id_column_value=1))
+
+
+def test_delete_entry_by_id_not_permitted(monkeypatch):
+    mock = MagicMock()
+    multi_monkeypatch(
+        monkeypatch,
+        patch_root=f"{PATCH_ROOT}.delete",
+        mock=mock,
+        functions_to_patch=["check_for_id"],
+    )
+    mock.permission_checking_function.execute.return_value = False
+    id_info = IDInfo(id_column_value=1)
+
+    with pytest.raises(Forbidden):
+        delete_entry(
+            middleware_parameters=mock.mp,
+            id_info=id_info,
+            permission_checking_function=mock.permission_checking_function,
+        )
+
+    # A missing entry is reported as not found, rather than forbidden
+    mock.check_for_id.assert_called_once_with(
+        table_name=mock.mp.relation, id_info=id_info, db_client=mock.mp.db_client
+    )
+    mock.mp.db_client_method.assert_not_called()
+
+
 def test_check_requested_columns_happy_path(monkeypatch):
     mock = MagicMock()
     mock.get_invalid_columns.return_value = []
@@ -0,0 +1,206 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from db.dtos.data_request_info_for_github import DataRequestInfoForGithub
+from db.enums import RequestStatus
+from middleware.enums import RecordTypesEnum
+from middleware.primary_resource_logic.github_issue_app import (
+    add_ready_data_requests_as_github_issues,
+    get_github_issue_body,
+)
+from middleware.third_party_interaction_logic.github.helpers import (
+    get_github_issue_project_statuses,
+)
+from middleware.third_party_interaction_logic.github.issue_info import (
+    NewGithubIssueInfo,
+)
+from middleware.third_party_interaction_logic.github.issue_manager import (
+    GithubIssueManager,
+)
+from middleware.third_party_interaction_logic.github.node_id_cache import (
+    github_node_id_cache,
+)
+from tests._mocks.github_graph_ql import FakeGithubGraphQLServer
+
+
+def project_item(issue_number: int, status: str, labels: list[str]) -> dict:
+    return {
+        "content": {
+            "number": issue_number,
+            "title": f"Issue {issue_number}",
+            "labels": {"nodes": [{"name": label} for label in labels]},
+        },
+        "fieldValueByName": {"name": status},
+    }
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    items = [project_item(i, "Ready to start", []) for i in range(1, 251)]
+    items[0] = project_item(1, "Complete", ["RT-Dispatch Recordings", "Bug"])
+    # Draft issues have no issue content
+    items.append({"content": {}, "fieldValueByName": {"name": "Complete"}})
+    with FakeGithubGraphQLServer(
+        project_items=items, failing_issue_titles=frozenset({"Failing Request"})
+    ) as server:
+        monkeypatch.setenv("GH_GRAPHQL_URL", server.url)
+        monkeypatch.setenv("GH_API_ACCESS_TOKEN", "token")
+        github_node_id_cache.clear()
+        yield server
+    github_node_id_cache.clear()
+
+
+def test_get_github_issue_project_statuses_pages_through_items(
+    fake_github: FakeGithubGraphQLServer,
+):
+    gipi = get_github_issue_project_statuses(issue_numbers=[])
+
+    assert len(fake_github.requests) == 3
+    assert len(gipi.issue_number_to_info) == 250
+    assert gipi.get_project_status(1) == RequestStatus.COMPLETE
+    assert gipi.get_labels(1) == [RecordTypesEnum.DISPATCH_RECORDINGS]
+    assert gipi.get_project_status(250) == RequestStatus.READY_TO_START
+
+
+def test_create_issues_with_status_batches_mutations(
+    fake_github: FakeGithubGraphQLServer,
+):
+    new_issues = [
+        NewGithubIssueInfo(
+            title=f"Data Request {i}",
+            body="Body",
+            record_types=[RecordTypesEnum.DISPATCH_RECORDINGS],
+        )
+        for i in range(3)
+    ]
+
+    GithubIssueManager()
+    node_id_request_count = len(fake_github.requests)
+
+    # Node ids are cached across managers
+    gim = GithubIssueManager()
+    assert len(fake_github.requests) == node_id_request_count
+
+    issues, errors = gim.create_issues(new_issues=new_issues)
+    assert errors == []
+    assert [issue.number for issue in issues] == [1, 2, 3]
+
+    errors = gim.assign_issues_to_project_with_status(
+        issues=issues, status=RequestStatus.READY_TO_START
+    )
+    assert errors == []
+    mutation_requests = fake_github.requests[node_id_request_count:]
+    # Issues are created, added to the project and assigned a status in one request each
+    assert len(mutation_requests) == 3
+    create_inputs = mutation_requests[0]["variables"]
+    assert create_inputs["input0"] == {
+        "repositoryId": "repository",
+        "title": "Data Request 0",
+        "body": "Body",
+        "labelIds": ["label-dispatch"],
+    }
+    status_inputs = mutation_requests[2]["variables"]
+    assert status_inputs["input2"] == {
+        "projectId": "project",
+        "itemId": "item-issue-3",
+        "fieldId": "status-field",
+        "value": {"singleSelectOptionId": "status-ready"},
+    }
+
+
+def test_add_ready_data_requests_records_issues_created_before_a_failure(
+    fake_github: FakeGithubGraphQLServer,
+):
+    data_requests = [
+        DataRequestInfoForGithub(
+            id=id_,
+            title=title,
+            submission_notes="Notes",
+            data_requirements="Requirements",
+            locations=None,
+            record_types=None,
+        )
+        for id_, title in [(10, "Request"), (20, "Failing Request"), (30, "Request")]
+    ]
+    db_client = MagicMock()
+    db_client.get_data_requests_ready_to_start_without_github_issue.return_value = (
+        data_requests
+    )
+    db_client.get_recorded_github_issue_numbers.return_value = set()
+
+    with pytest.raises(ValueError):
+        add_ready_data_requests_as_github_issues(db_client)
+
+    # The issues created are recorded, so the next sync does not create them again
+    recorded = db_client.create_data_requests_github_issue_info.call_args.kwargs[
+        "issue_infos"
+    ]
+    assert [(info.data_request_id, info.number) for info in recorded] == [
+        (10, 1),
+        (30, 2),
+    ]
+    # And are still added to the project and assigned a status
+    status_request = fake_github.requests[-1]
+    assert "updateProjectV2ItemFieldValue(" in status_request["query"]
+    assert [input_["itemId"] for input_ in status_request["variables"].values()] == [
+        "item-issue-1",
+        "item-issue-2",
+    ]
+
+
+def test_add_ready_data_requests_reuses_issues_created_by_a_failed_sync(
+    fake_github: FakeGithubGraphQLServer,
+):
+    data_requests = [
+        DataRequestInfoForGithub(
+            id=id_,
+            title=f"Request {id_}",
+            submission_notes="Notes",
+            data_requirements="Requirements",
+            locations=None,
+            record_types=None,
+        )
+        for id_ in (10, 20, 30)
+    ]
+    db_client = MagicMock()
+    db_client.get_data_requests_ready_to_start_without_github_issue.return_value = (
+        data_requests
+    )
+    # An older issue with the same content is already linked to another data request
+    fake_github.issues.append(
+        {
+            "number": 1,
+            "id": "issue-1",
+            "url": "https://github.com/issues/1",
+            "title": "Request 30",
+            "body": get_github_issue_body(
+                submission_notes="Notes",
+                data_requirements="Requirements",
+                locations=None,
+            ),
+        }
+    )
+    db_client.get_recorded_github_issue_numbers.return_value = {1}
+
+    # GitHub creates the issues, but its response is lost
+    fake_github.lost_create_issue_responses = 1
+    with pytest.raises(requests.HTTPError):
+        add_ready_data_requests_as_github_issues(db_client)
+    db_client.create_data_requests_github_issue_info.assert_not_called()
+    assert fake_github.issue_count == 4
+
+    issue_infos = add_ready_data_requests_as_github_issues(db_client)
+
+    # The issues are recorded rather than created again
+    assert fake_github.issue_count == 4
+    assert [(info.data_request_id, info.number) for info in issue_infos] == [
+        (10, 2),
+        (20, 3),
+        (30, 4),
+    ]
+    recorded = db_client.create_data_requests_github_issue_info.call_args.kwargs[
+        "issue_infos"
+    ]
+    assert [info.number for info in recorded] == [2, 3, 4]
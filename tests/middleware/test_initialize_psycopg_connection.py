@@ -1,28 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from psycopg import Connection as PgConnection
+from psycopg_pool import ConnectionPool
+
+from db.client.core import DatabaseClient
 from db.helpers_.psycopg import (
-    initialize_psycopg_connection,
+    initialize_psycopg_connection_pool,
+    get_psycopg_connection_pool,
 )
 
-PATCH_ROOT = "middleware.initialize_psycopg_connection"
-GET_ENV_PATCH_ROUTE = PATCH_ROOT + ".get_env_variable"
-CONNECT_PATCH_ROUTE = PATCH_ROOT + ".psycopg.connect"
 
-
-def test_initialize_psycopg_connection():
+def test_initialize_psycopg_connection_pool():
     """
-    Test that initialize_psycopg_connection returns a psycopg connection object.
-    And that, if the connection is closed, it is reopened.
-    :return:
+    Test that initialize_psycopg_connection_pool returns an open, shared pool
+    whose connections are healthy and returned after use.
     """
-    conn = initialize_psycopg_connection()
-    assert isinstance(conn, PgConnection)
-    assert conn.closed == 0
+    pool = initialize_psycopg_connection_pool(wait=True)
+    assert isinstance(pool, ConnectionPool)
+    assert not pool.closed
+    assert pool is get_psycopg_connection_pool()
+
+    with pool.connection() as conn:
+        assert isinstance(conn, PgConnection)
+        assert conn.closed == 0
 
-    conn.close()
+    # A connection closed by the caller is discarded rather than reused
+    with pool.connection() as conn:
+        conn.close()
+    with pool.connection() as conn:
+        assert conn.closed == 0
+
+
+def test_concurrent_raw_sql_uses_separate_connections():
+    """
+    Test that concurrent raw SQL calls on a shared client
+    run in separate transactions on separate connections.
+    """
+    db_client = DatabaseClient()
 
-    assert conn.closed == 1
+    def get_backend_pid(_) -> int:
+        result = db_client.execute_raw_sql(
+            "SELECT pg_backend_pid() AS pid, pg_sleep(0.2)"
+        )
+        return result[0]["pid"]
 
-    conn = initialize_psycopg_connection()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pids = list(executor.map(get_backend_pid, range(2)))
 
-    assert isinstance(conn, PgConnection)
-    assert conn.closed == 0
+    assert len(set(pids)) == 2
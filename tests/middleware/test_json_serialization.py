@@ -0,0 +1,74 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+from sqlalchemy import literal, select
+
+from middleware.enums import JurisdictionType
+from middleware.util.json_serialization import FastJSONProvider, dumps, dumps_bytes
+
+
+class ExampleModel(BaseModel):
+    name: str
+    created: date
+
+
+PAYLOAD = {
+    "id": 1,
+    "created_at": datetime(2024, 1, 2, 3, 4, 5),
+    "coverage_start": date(2024, 1, 1),
+    "jurisdiction_type": JurisdictionType.FEDERAL,
+    "amount": Decimal("1.50"),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "model": ExampleModel(name="ñame", created=date(2024, 1, 1)),
+    "tags": ("a", "b"),
+}
+
+EXPECTED = {
+    "id": 1,
+    "created_at": "2024-01-02T03:04:05",
+    "coverage_start": "2024-01-01",
+    "jurisdiction_type": "federal",
+    "amount": "1.50",
+    "uuid": "12345678-1234-5678-1234-567812345678",
+    "model": {"name": "ñame", "created": "2024-01-01"},
+    "tags": ["a", "b"],
+}
+
+
+def test_dumps():
+    assert json.loads(dumps(PAYLOAD)) == EXPECTED
+    body = dumps_bytes(PAYLOAD)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == EXPECTED
+
+
+def test_dumps_row_mappings(live_database_client):
+    rows = live_database_client.mappings(
+        select(literal(1).label("id"), literal("name").label("name"))
+    )
+    assert json.loads(dumps(list(rows))) == [{"id": 1, "name": "name"}]
+
+
+def test_dumps_unsupported_type():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_fast_json_provider():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    with app.app_context():
+        response = app.json.response(PAYLOAD)
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == EXPECTED
+        assert app.json.loads(app.json.dumps(PAYLOAD)) == EXPECTED
+        # Keys are sorted, as with Flask's default provider
+        assert response.get_data(as_text=True).startswith('{"amount":')
+        # Formatting arguments are honored
+        assert "\n" in app.json.dumps(PAYLOAD, indent=2)
@@ -0,0 +1,151 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from db.dtos.event_batch import EventBatch
+from db.dtos.pending_event_batch import PendingEventBatch
+from middleware.primary_resource_logic.notifications.dispatch import (
+    NotificationDispatcher,
+)
+
+
+class FakeNotificationDBClient:
+    """
+    Serves pending batches by page, and records which queue entries are marked as sent
+    """
+
+    def __init__(self, user_ids: list[int]):
+        self.pending = [
+            PendingEventBatch(
+                event_batch=EventBatch(
+                    user_id=user_id, user_email=f"{user_id}@test.com", events=[]
+                ),
+                data_request_queue_ids=[user_id * 10],
+                data_source_queue_ids=[user_id * 10 + 1],
+            )
+            for user_id in user_ids
+        ]
+        self.mark_sent_calls: list[tuple[list[int], list[int]]] = []
+
+    def get_pending_event_batches(self, limit: int, after_user_id: int | None = None):
+        return [
+            pending
+            for pending in self.pending
+            if after_user_id is None or pending.event_batch.user_id > after_user_id
+        ][:limit]
+
+    def mark_notifications_sent(
+        self, data_request_queue_ids: list[int], data_source_queue_ids: list[int]
+    ):
+        self.mark_sent_calls.append((data_request_queue_ids, data_source_queue_ids))
+
+
+def test_dispatch_sends_every_page_and_marks_sent_in_batches():
+    db_client = FakeNotificationDBClient(user_ids=list(range(1, 8)))
+    send = MagicMock()
+
+    result = NotificationDispatcher(
+        db_client=db_client,
+        send=send,
+        max_workers=3,
+        page_size=3,
+        mark_sent_batch_size=2,
+    ).dispatch()
+
+    assert result.sent == 7
+    assert result.failed == {}
+    assert sorted(call.args[0].user_id for call in send.call_args_list) == list(
+        range(1, 8)
+    )
+    # Pages of 3, 3 and 1, each marked in batches of at most 2
+    batch_sizes = [len(ids) for ids, _ in db_client.mark_sent_calls]
+    assert batch_sizes == [2, 1, 2, 1, 1]
+    assert sorted(
+        queue_id for ids, _ in db_client.mark_sent_calls for queue_id in ids
+    ) == [user_id * 10 for user_id in range(1, 8)]
+
+
+def test_dispatch_leaves_failed_sends_unmarked():
+    db_client = FakeNotificationDBClient(user_ids=[1, 2, 3])
+
+    def send(event_batch: EventBatch):
+        if event_batch.user_id == 2:
+            raise requests.ConnectionError("Mailgun unavailable")
+
+    result = NotificationDispatcher(db_client=db_client, send=send).dispatch()
+
+    assert result.sent == 2
+    assert result.failed == {2: "Mailgun unavailable"}
+    marked_data_source_ids = [
+        queue_id for _, ids in db_client.mark_sent_calls for queue_id in ids
+    ]
+    assert sorted(marked_data_source_ids) == [11, 31]
+
+
+def test_dispatch_raises_unexpected_errors_after_marking_sent():
+    db_client = FakeNotificationDBClient(user_ids=[1, 2, 3])
+
+    def send(event_batch: EventBatch):
+        if event_batch.user_id == 3:
+            raise KeyError("user_email")
+
+    with pytest.raises(KeyError):
+        NotificationDispatcher(db_client=db_client, send=send, max_workers=1).dispatch()
+
+    marked_data_request_ids = [
+        queue_id for ids, _ in db_client.mark_sent_calls for queue_id in ids
+    ]
+    assert sorted(marked_data_request_ids) == [10, 20]
+
+
+def test_dispatch_cancels_queued_sends_after_an_unexpected_error():
+    db_client = FakeNotificationDBClient(user_ids=list(range(1, 21)))
+    release = threading.Event()
+    started: list[int] = []
+    completed: list[int] = []
+    lock = threading.Lock()
+
+    def send(event_batch: EventBatch):
+        with lock:
+            started.append(event_batch.user_id)
+        if event_batch.user_id == 1:
+            raise KeyError("user_email")
+        # Running sends outlast the failure, so queued sends are still waiting
+        release.wait(timeout=5)
+        with lock:
+            completed.append(event_batch.user_id)
+
+    timer = threading.Timer(0.5, release.set)
+    timer.start()
+    try:
+        with pytest.raises(KeyError):
+            NotificationDispatcher(
+                db_client=db_client, send=send, max_workers=4
+            ).dispatch()
+    finally:
+        timer.cancel()
+        release.set()
+
+    # Only the sends already running when the error was raised are made
+    assert len(started) <= 5
+    marked_data_request_ids = [
+        queue_id for ids, _ in db_client.mark_sent_calls for queue_id in ids
+    ]
+    # Every send which finished is marked, so it is not sent again
+    assert len(completed) >= 3
+    assert sorted(marked_data_request_ids) == sorted(
+        user_id * 10 for user_id in completed
+    )
+
+
+def test_dispatch_with_no_pending_notifications():
+    db_client = FakeNotificationDBClient(user_ids=[])
+    send = MagicMock()
+
+    result = NotificationDispatcher(db_client=db_client, send=send).dispatch()
+
+    assert result.sent == 0
+    send.assert_not_called()
+    assert db_client.mark_sent_calls == []
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from middleware.enums import RecordTypesEnum
+from middleware.primary_resource_logic.search.cache import (
+    SearchResultsCache,
+    get_search_cache_key,
+)
+from utilities.enums import RecordCategoryEnum
+
+PATCH_ROOT = "db.helpers_.lru_cache"
+
+
+def test_search_cache_key_normalizes_filters():
+    key = get_search_cache_key(
+        1, [RecordCategoryEnum.POLICE, RecordCategoryEnum.AGENCIES]
+    )
+    assert key == get_search_cache_key(
+        1,
+        [
+            RecordCategoryEnum.AGENCIES,
+            RecordCategoryEnum.POLICE,
+            RecordCategoryEnum.AGENCIES,
+        ],
+    )
+    assert key != get_search_cache_key(2, [RecordCategoryEnum.POLICE])
+    assert get_search_cache_key(1) != get_search_cache_key(1, [])
+    assert get_search_cache_key(
+        1, record_types=[RecordTypesEnum.ACCIDENT_REPORTS]
+    ) != get_search_cache_key(1, [RecordCategoryEnum.POLICE])
+
+
+def test_search_cache_expires_entries():
+    cache = SearchResultsCache(ttl_seconds=10)
+    key = get_search_cache_key(1)
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=100):
+        cache.set(key, ["result"])
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=105):
+        assert cache.get(key) == ["result"]
+    with patch(f"{PATCH_ROOT}.time.monotonic", return_value=111):
+        assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_search_cache_evicts_least_recently_used():
+    cache = SearchResultsCache(max_size=2)
+    for location_id in (1, 2):
+        cache.set(get_search_cache_key(location_id), location_id)
+    # Touch the first entry so the second becomes least recently used
+    cache.get(get_search_cache_key(1))
+    cache.set(get_search_cache_key(3), 3)
+
+    assert cache.get(get_search_cache_key(1)) == 1
+    assert cache.get(get_search_cache_key(2)) is None
+    assert cache.get(get_search_cache_key(3)) == 3
+
+
+def test_search_cache_drops_results_loaded_before_an_invalidation():
+    cache = SearchResultsCache()
+    key = get_search_cache_key(1)
+    generation = cache.generation
+    # An invalidation commits while the search is running
+    cache.clear()
+    cache.set(key, ["stale result"], generation=generation)
+    assert cache.get(key) is None
+
+    cache.set(key, ["result"], generation=cache.generation)
+    assert cache.get(key) == ["result"]
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 from middleware.primary_resource_logic.search.helpers import (
     format_search_results,
+    stream_as_csv,
 )
 from tests.helpers.DynamicMagicMock import DynamicMagicMock
 
@@ -82,3 +83,19 @@ def test_format_search_results():
     }
 
     assert format_search_results(search_results) == expected_formatted_search_results
+
+
+def test_stream_as_csv():
+    rows = [{"id": i, "name": f"name {i}"} for i in range(100)]
+
+    chunks = list(stream_as_csv(rows, chunk_size=256))
+
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert lines[0] == "id,name"
+    assert lines[1:] == [f"{i},name {i}" for i in range(100)]
+
+
+def test_stream_as_csv_no_rows():
+    assert list(stream_as_csv([])) == []